@@ -434,6 +434,17 @@ class Agent:
             tracker, verbosity
         )
 
+    @agent_must_be_ready
+    def predict_next_with_trackers(
+        self,
+        trackers: List[DialogueStateTracker],
+        verbosity: EventVerbosity = EventVerbosity.AFTER_RESTART,
+    ) -> Optional[List[Dict[Text, Any]]]:
+        """Predicts the next actions for multiple trackers at once."""
+        return self.processor.predict_next_with_trackers(  # type: ignore[union-attr]
+            trackers, verbosity
+        )
+
     @agent_must_be_ready
     async def log_message(self, message: UserMessage) -> DialogueStateTracker:
         """Append a message to a dialogue - does not predict actions."""
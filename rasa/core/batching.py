@@ -0,0 +1,84 @@
+import asyncio
+import logging
+from typing import Callable, Generic, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+InputType = TypeVar("InputType")
+OutputType = TypeVar("OutputType")
+
+
+class Batcher(Generic[InputType, OutputType]):
+    """Processes concurrently submitted items together in batches.
+
+    Items which are submitted within `max_wait_time` seconds of each other are
+    collected and processed with a single call of `process_batch`. A batch is
+    processed as soon as it contains `max_batch_size` items or `max_wait_time`
+    seconds after its first item was submitted.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[InputType]], List[OutputType]],
+        max_batch_size: int,
+        max_wait_time: float,
+    ) -> None:
+        """Creates a `Batcher`.
+
+        Args:
+            process_batch: Processes a list of items and returns the results in the
+                same order.
+            max_batch_size: Maximum number of items which are processed together.
+            max_wait_time: Maximum time in seconds an item waits for other items
+                before it is processed.
+        """
+        self._process_batch = process_batch
+        self._max_batch_size = max_batch_size
+        self._max_wait_time = max_wait_time
+
+        self._pending: List[Tuple[InputType, "asyncio.Future[OutputType]"]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    async def submit(self, item: InputType) -> OutputType:
+        """Processes the item together with other concurrently submitted items.
+
+        Args:
+            item: The item which should be processed.
+
+        Returns:
+            The result for the item.
+        """
+        loop = asyncio.get_running_loop()
+        result: "asyncio.Future[OutputType]" = loop.create_future()
+        self._pending.append((item, result))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._process_pending()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_wait_time, self._process_pending)
+
+        return await result
+
+    def _process_pending(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        logger.debug(f"Processing a batch of {len(batch)} items.")
+
+        try:
+            outputs = self._process_batch([item for item, _ in batch])
+        except Exception as e:
+            for _, result in batch:
+                if not result.done():
+                    result.set_exception(e)
+            return
+
+        for (_, result), output in zip(batch, outputs):
+            # the waiting caller might have been cancelled in the meantime
+            if not result.done():
+                result.set_result(output)
@@ -1,11 +1,23 @@
 import asyncio
+import dataclasses
+import functools
 import os
 import json
 import logging
 import structlog
 import threading
 from asyncio import AbstractEventLoop
-from typing import Any, Text, List, Optional, Union, Dict, TYPE_CHECKING
+from collections import deque
+from typing import (
+    Any,
+    Deque,
+    Text,
+    List,
+    Optional,
+    Union,
+    Dict,
+    TYPE_CHECKING,
+)
 import time
 
 from rasa.core.brokers.broker import EventBroker
@@ -20,6 +32,32 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 structlogger = structlog.get_logger()
 
+DEFAULT_MAX_PENDING_EVENTS = 10000
+DEFAULT_PUBLISH_BATCH_SIZE = 100
+DEFAULT_FLUSH_TIMEOUT_IN_SECONDS = 10
+# `publish` is called on the event loop, so it must only block for a short time
+DEFAULT_BLOCK_TIMEOUT_IN_SECONDS = 1
+
+# what happens to a published event if the queue of pending events is full
+OVERFLOW_POLICY_BLOCK = "block"
+OVERFLOW_POLICY_DROP_NEWEST = "drop_newest"
+OVERFLOW_POLICY_DROP_OLDEST = "drop_oldest"
+OVERFLOW_POLICIES = [
+    OVERFLOW_POLICY_BLOCK,
+    OVERFLOW_POLICY_DROP_NEWEST,
+    OVERFLOW_POLICY_DROP_OLDEST,
+]
+
+
+@dataclasses.dataclass
+class _PendingEvent:
+    event: Dict[Text, Any]
+    retries: int
+    retry_delay_in_seconds: float
+    enqueued_at: float
+    # whether the event was already counted as delivered or failed
+    is_reported: bool = False
+
 
 class KafkaEventBroker(EventBroker):
     """Kafka event broker."""
@@ -75,6 +113,15 @@ class KafkaEventBroker(EventBroker):
 
             security_protocol : Protocol used to communicate with brokers.
                 Valid values are: PLAINTEXT, SSL, SASL_PLAINTEXT, SASL_SSL.
+            kwargs: Further options. `max_pending_events` limits the number of
+                events which wait to be published (default: 10000).
+                `overflow_policy` determines what happens to a published event
+                if that limit is reached: `drop_newest` drops the event,
+                `drop_oldest` drops the oldest pending event instead and `block`
+                waits up to `block_timeout_in_seconds` (default: 1) for space
+                before it drops the event (default: `drop_newest`).
+                `publish_batch_size` is the maximum number of events which are
+                produced before the producer is flushed (default: 100).
         """
         self.producer: Optional[Producer] = None
         self.url = url
@@ -91,12 +138,36 @@ class KafkaEventBroker(EventBroker):
         self.queue_size = kwargs.get("queue_size")
         self.ssl_check_hostname = "https" if ssl_check_hostname else None
 
-        # Async producer implementation followed from confluent-kafka asyncio example:
-        # https://github.com/confluentinc/confluent-kafka-python/blob/master/examples/asyncio_example.py#L88  # noqa: E501
-        self._loop = asyncio.get_event_loop()
-        self._cancelled = False
-        self._poll_thread = threading.Thread(target=self._poll_loop)
-        self._poll_thread.start()
+        self.max_pending_events = kwargs.get(
+            "max_pending_events", DEFAULT_MAX_PENDING_EVENTS
+        )
+        self.overflow_policy = kwargs.get(
+            "overflow_policy", OVERFLOW_POLICY_DROP_NEWEST
+        )
+        if self.overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Cannot initialise `KafkaEventBroker`: Invalid `overflow_policy` "
+                f"('{self.overflow_policy}'). Valid values are: {OVERFLOW_POLICIES}."
+            )
+        self.block_timeout_in_seconds = kwargs.get(
+            "block_timeout_in_seconds", DEFAULT_BLOCK_TIMEOUT_IN_SECONDS
+        )
+        self.publish_batch_size = kwargs.get(
+            "publish_batch_size", DEFAULT_PUBLISH_BATCH_SIZE
+        )
+
+        # Events are published by a background thread so that connection problems
+        # with Kafka don't block the event loop.
+        self._pending_events: Deque[_PendingEvent] = deque()
+        self._condition = threading.Condition()
+        self._closing = threading.Event()
+        self._publishing_thread: Optional[threading.Thread] = None
+
+        self.dropped_events = 0
+        self.delivered_events = 0
+        self.failed_deliveries = 0
+        self._total_delivery_latency = 0.0
+        self.max_delivery_latency = 0.0
 
     @classmethod
     async def from_endpoint_config(
@@ -116,9 +187,114 @@ class KafkaEventBroker(EventBroker):
         retries: int = 60,
         retry_delay_in_seconds: float = 5,
     ) -> None:
-        """Publishes events."""
+        """Publishes events.
+
+        The event is added to a queue of pending events which is published to Kafka
+        by a background thread. Events are published in the order in which they
+        were added.
+
+        Args:
+            event: The event to publish.
+            retries: Number of attempts to publish the event.
+            retry_delay_in_seconds: Time to wait between attempts.
+        """
+        pending_event = _PendingEvent(
+            event, retries, retry_delay_in_seconds, time.monotonic()
+        )
+
+        with self._condition:
+            self._start_publishing_thread()
+
+            if len(self._pending_events) >= self.max_pending_events:
+                if self.overflow_policy == OVERFLOW_POLICY_BLOCK:
+                    has_space = self._condition.wait_for(
+                        lambda: len(self._pending_events) < self.max_pending_events,
+                        timeout=self.block_timeout_in_seconds,
+                    )
+                    if not has_space:
+                        self._drop_event()
+                        return
+                elif self.overflow_policy == OVERFLOW_POLICY_DROP_NEWEST:
+                    self._drop_event()
+                    return
+                else:
+                    self._pending_events.popleft()
+                    self._drop_event()
+
+            self._pending_events.append(pending_event)
+            self._condition.notify_all()
+
+    def _start_publishing_thread(self) -> None:
+        if self._publishing_thread is not None and self._publishing_thread.is_alive():
+            return
+
+        self._closing.clear()
+        self._publishing_thread = threading.Thread(
+            target=self._publish_loop, daemon=True
+        )
+        self._publishing_thread.start()
+
+    def _drop_event(self) -> None:
+        self.dropped_events += 1
+        logger.warning(
+            f"Dropped an event, since there are already {self.max_pending_events} "
+            f"events waiting to be published to Kafka."
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        """Returns the number of events which wait to be published."""
+        return len(self._pending_events)
+
+    @property
+    def average_delivery_latency(self) -> Optional[float]:
+        """Returns the average time in seconds from publishing to delivery."""
+        if not self.delivered_events:
+            return None
+        return self._total_delivery_latency / self.delivered_events
+
+    def _publish_loop(self) -> None:
+        """Publishes the pending events in batches until the broker is closed."""
+        while True:
+            with self._condition:
+                if not self._pending_events and not self._closing.is_set():
+                    self._condition.wait(timeout=0.1)
+
+                batch = [
+                    self._pending_events.popleft()
+                    for _ in range(
+                        min(self.publish_batch_size, len(self._pending_events))
+                    )
+                ]
+                closing = self._closing.is_set()
+                # wake up publishers which wait for space in the queue
+                self._condition.notify_all()
+
+            try:
+                for pending_event in batch:
+                    self._publish_with_retries(pending_event)
+
+                if self.producer is not None:
+                    if batch:
+                        self.producer.flush(DEFAULT_FLUSH_TIMEOUT_IN_SECONDS)
+                    else:
+                        # serves the delivery callbacks of previous batches
+                        self.producer.poll(0)
+            except Exception as e:
+                # e.g. `kafka_error_callback` raises from `flush` if all brokers are
+                # down, the thread has to keep publishing the next events anyway
+                logger.error(f"Failed to publish events to Kafka: {e}")
+                for pending_event in batch:
+                    self._report_failed_delivery(pending_event)
+
+            if closing and not batch:
+                return
+
+    def _publish_with_retries(self, pending_event: _PendingEvent) -> None:
         from confluent_kafka import KafkaException
 
+        event = pending_event.event
+        retries = pending_event.retries
         if retries == 1:
             retries = 2
 
@@ -129,10 +305,11 @@ class KafkaEventBroker(EventBroker):
                 logger.debug("Connection to kafka successful.")
             except KafkaException:
                 logger.debug("Failed to connect kafka.")
+                self._report_failed_delivery(pending_event)
                 return
         while retries:
             try:
-                self._publish(event)
+                self._publish(event, pending_event)
                 return
             except BufferError as e:
                 logger.error(
@@ -154,15 +331,23 @@ class KafkaEventBroker(EventBroker):
                     try:
                         self._check_kafka_connection()
                         logger.debug("Reconnection to kafka successful")
-                        self._publish(event)
+                        self._publish(event, pending_event)
                         return
                     except KafkaException:
                         pass
                 retries -= 1
-                time.sleep(retry_delay_in_seconds)
+                # stop retrying early if the broker is closed
+                if self._closing.wait(pending_event.retry_delay_in_seconds):
+                    break
 
+        self._report_failed_delivery(pending_event)
         logger.error("Failed to publish Kafka event.")
 
+    def _report_failed_delivery(self, pending_event: _PendingEvent) -> None:
+        if not pending_event.is_reported:
+            pending_event.is_reported = True
+            self.failed_deliveries += 1
+
     def _check_kafka_connection(self) -> None:
         """Verifies connection with Kafka.
 
@@ -228,7 +413,9 @@ class KafkaEventBroker(EventBroker):
                 f"Cannot initialise `KafkaEventBroker`: {e}"
             )
 
-    def _publish(self, event: Dict[Text, Any]) -> None:
+    def _publish(
+        self, event: Dict[Text, Any], pending_event: Optional[_PendingEvent] = None
+    ) -> None:
         if self.partition_by_sender:
             partition_key = bytes(event.get("sender_id"), encoding=DEFAULT_ENCODING)
         else:
@@ -261,27 +448,48 @@ class KafkaEventBroker(EventBroker):
                 value=serialized_event,
                 key=partition_key,
                 headers=headers,
-                on_delivery=delivery_report,
+                on_delivery=functools.partial(self._on_delivery, pending_event),
             )
 
+    def _on_delivery(
+        self, pending_event: Optional[_PendingEvent], err: Exception, msg: "Message"
+    ) -> None:
+        delivery_report(err, msg)
+
+        if pending_event is not None:
+            if pending_event.is_reported:
+                # counted as failed when publishing its batch failed
+                return
+            pending_event.is_reported = True
+
+        if err is not None:
+            self.failed_deliveries += 1
+        else:
+            self.delivered_events += 1
+            if pending_event is not None:
+                latency = time.monotonic() - pending_event.enqueued_at
+                self._total_delivery_latency += latency
+                self.max_delivery_latency = max(self.max_delivery_latency, latency)
+
+    async def close(self) -> None:
+        """Publishes the pending events and stops the publishing thread."""
+        await asyncio.get_running_loop().run_in_executor(None, self._close)
+
     def _close(self) -> None:
-        self._cancelled = True
-        self._poll_thread.join()
+        with self._condition:
+            thread = self._publishing_thread
+            self._publishing_thread = None
+            self._closing.set()
+            self._condition.notify_all()
+
+        if thread is not None:
+            thread.join()
 
     @rasa.shared.utils.common.lazy_property
     def rasa_environment(self) -> Optional[Text]:
         """Get value of the `RASA_ENVIRONMENT` environment variable."""
         return os.environ.get("RASA_ENVIRONMENT", "RASA_ENVIRONMENT_NOT_SET")
 
-    def _poll_loop(self) -> None:
-        """Polls the producer for events.
-
-        Required to trigger the on_delivery callback passed to produce method.
-        """
-        if self.producer is not None:
-            while not self._cancelled:
-                self.producer.poll(0.1)
-
 
 def kafka_error_callback(err: "KafkaError") -> None:
     """Callback for Kafka errors.
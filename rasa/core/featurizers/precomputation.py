@@ -380,6 +380,25 @@ class CoreFeaturizationInputConverter(GraphComponent):
         container.derive_messages_from_events_and_add(tracker.events)
         return container.all_messages()
 
+    def convert_trackers_for_inference(
+        self, trackers: List[DialogueStateTracker]
+    ) -> List[Message]:
+        """Creates a list of messages containing single user and action attributes.
+
+        Works like `convert_for_inference` but for the events of all given trackers,
+        i.e. each item which can be found in any of the trackers will appear exactly
+        once in the resulting messages.
+
+        Args:
+          trackers: dialogue state trackers containing events
+        Returns:
+          a list of messages
+        """
+        container = MessageContainerForCoreFeaturization()
+        for tracker in trackers:
+            container.derive_messages_from_events_and_add(tracker.events)
+        return container.all_messages()
+
 
 class CoreFeaturizationCollector(GraphComponent):
     """Collects featurized messages for use by a policy."""
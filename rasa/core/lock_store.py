@@ -4,8 +4,21 @@ from contextlib import asynccontextmanager
 import json
 import logging
 import os
-
-from typing import AsyncGenerator, Dict, Optional, Text, Union
+import time
+
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    Optional,
+    Text,
+    TypeVar,
+    Union,
+    TYPE_CHECKING,
+    cast,
+)
 
 from rasa.shared.exceptions import RasaException, ConnectionException
 import rasa.shared.utils.common
@@ -13,6 +26,10 @@ from rasa.core.constants import DEFAULT_LOCK_LIFETIME
 from rasa.core.lock import TicketLock
 from rasa.utils.endpoints import EndpointConfig
 
+if TYPE_CHECKING:
+    from redis.asyncio.client import PubSub
+    from redis.client import Pipeline
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +41,10 @@ LOCK_LIFETIME = _get_lock_lifetime()
 DEFAULT_SOCKET_TIMEOUT_IN_SECONDS = 10
 
 DEFAULT_REDIS_LOCK_STORE_KEY_PREFIX = "lock:"
+# prefix of the Redis channels which announce that tickets of a lock were removed
+REDIS_LOCK_STORE_CHANNEL_PREFIX = "released:"
+
+T = TypeVar("T")
 
 
 # noinspection PyUnresolvedReferences
@@ -111,36 +132,52 @@ class LockStore:
         self, conversation_id: Text, ticket: int, wait_time_in_seconds: float
     ) -> TicketLock:
         logger.debug(f"Acquiring lock for conversation '{conversation_id}'.")
-        while True:
-            # fetch lock in every iteration because lock might no longer exist
-            lock = self.get_lock(conversation_id)
-
-            # exit loop if lock does not exist anymore (expired)
-            if not lock:
-                break
-
-            # acquire lock if it isn't locked
-            if not lock.is_locked(ticket):
-                logger.debug(f"Acquired lock for conversation '{conversation_id}'.")
-                return lock
-
-            items_before_this = ticket - (lock.now_serving or 0)
-
-            logger.debug(
-                f"Failed to acquire lock for conversation ID '{conversation_id}' "
-                f"because {items_before_this} other item(s) for this "
-                f"conversation ID have to be finished processing first. "
-                f"Retrying in {wait_time_in_seconds} seconds ..."
-            )
+        async with self._ticket_removals(conversation_id) as wait_for_removal:
+            while True:
+                # fetch lock in every iteration because lock might no longer exist
+                lock = self.get_lock(conversation_id)
+
+                # exit loop if lock does not exist anymore (expired)
+                if not lock:
+                    break
+
+                # acquire lock if it isn't locked
+                if not lock.is_locked(ticket):
+                    logger.debug(f"Acquired lock for conversation '{conversation_id}'.")
+                    return lock
+
+                items_before_this = ticket - (lock.now_serving or 0)
 
-            # sleep and update lock
-            await asyncio.sleep(wait_time_in_seconds)
-            self.update_lock(conversation_id)
+                logger.debug(
+                    f"Failed to acquire lock for conversation ID '{conversation_id}' "
+                    f"because {items_before_this} other item(s) for this "
+                    f"conversation ID have to be finished processing first. "
+                    f"Retrying in {wait_time_in_seconds} seconds ..."
+                )
+
+                # wait and update lock
+                await wait_for_removal(wait_time_in_seconds)
+                self.update_lock(conversation_id)
 
         raise LockError(
             f"Could not acquire lock for conversation_id '{conversation_id}'."
         )
 
+    @asynccontextmanager
+    async def _ticket_removals(
+        self, conversation_id: Text
+    ) -> AsyncGenerator[Callable[[float], Awaitable[Any]], None]:
+        """Provides a function which waits until tickets might have been removed.
+
+        The function is called with the maximum time to wait in seconds. By default
+        it waits for the full time. It can return earlier, callers check the lock
+        again afterwards.
+
+        Args:
+            conversation_id: Conversation ID of the lock.
+        """
+        yield asyncio.sleep
+
     def update_lock(self, conversation_id: Text) -> None:
         """Fetch lock for `conversation_id`, remove expired tickets and save lock."""
         lock = self.get_lock(conversation_id)
@@ -230,8 +267,9 @@ class RedisLockStore(LockStore):
                 in case Redis doesn't respond within `socket_timeout` seconds.
         """
         import redis
+        import redis.asyncio
 
-        self.red = redis.StrictRedis(
+        connection_args: Dict[Text, Any] = dict(
             host=host,
             port=int(port),
             db=int(db),
@@ -243,6 +281,9 @@ class RedisLockStore(LockStore):
             ssl_ca_certs=ssl_ca_certs,
             socket_timeout=socket_timeout,
         )
+        self.red = redis.StrictRedis(**connection_args)
+        # used to wait for released tickets without blocking the event loop
+        self.async_red = redis.asyncio.StrictRedis(**connection_args)
 
         self.key_prefix = DEFAULT_REDIS_LOCK_STORE_KEY_PREFIX
         if key_prefix:
@@ -268,6 +309,137 @@ class RedisLockStore(LockStore):
 
         return None
 
+    def issue_ticket(
+        self, conversation_id: Text, lock_lifetime: float = LOCK_LIFETIME
+    ) -> int:
+        """Issues a ticket atomically (see parent docstring for more information)."""
+        logger.debug(f"Issuing ticket for conversation '{conversation_id}'.")
+        try:
+            return cast(
+                int,
+                self._update_lock(
+                    conversation_id,
+                    lambda lock: lock.issue_ticket(lock_lifetime),
+                    create_if_missing=True,
+                ),
+            )
+        except Exception as e:
+            raise LockError(f"Error while acquiring lock. Error:\n{e}")
+
+    def update_lock(self, conversation_id: Text) -> None:
+        """Removes expired tickets atomically."""
+        self._update_lock(conversation_id, lambda lock: lock.remove_expired_tickets())
+
+    def finish_serving(self, conversation_id: Text, ticket_number: int) -> None:
+        """Removes ticket with `ticket_number` atomically."""
+        self._update_lock(
+            conversation_id, lambda lock: lock.remove_ticket_for(ticket_number)
+        )
+
+    def cleanup(self, conversation_id: Text, ticket_number: int) -> None:
+        """Removes the ticket and deletes the lock if no one is waiting.
+
+        Both happen in one transaction, so no ticket which was issued in the
+        meantime is deleted with the lock.
+        """
+        self._update_lock(
+            conversation_id,
+            lambda lock: lock.remove_ticket_for(ticket_number),
+            delete_if_unused=True,
+        )
+
+    def _update_lock(
+        self,
+        conversation_id: Text,
+        update: Callable[[TicketLock], T],
+        create_if_missing: bool = False,
+        delete_if_unused: bool = False,
+    ) -> Optional[T]:
+        """Applies `update` to the lock of `conversation_id` in a Redis transaction.
+
+        The lock is watched while it's updated, so the update is retried if
+        another Rasa server modified the lock in the meantime. Waiting Rasa
+        servers are notified if tickets were removed.
+
+        Args:
+            conversation_id: Conversation ID of the lock.
+            update: Function which modifies the lock.
+            create_if_missing: Whether to create the lock if it doesn't exist.
+            delete_if_unused: Whether to delete the lock if no one is waiting for it
+                after the update.
+
+        Returns:
+            The result of `update` or `None` if the lock doesn't exist and
+            `create_if_missing` is `False`.
+        """
+        key = self.key_prefix + conversation_id
+
+        def transaction(pipe: Pipeline) -> Optional[T]:
+            serialised_lock = pipe.get(key)
+            if serialised_lock:
+                lock = TicketLock.from_dict(json.loads(serialised_lock))
+            elif create_if_missing:
+                lock = self.create_lock(conversation_id)
+            else:
+                return None
+
+            number_of_tickets = len(lock.tickets)
+            result = update(lock)
+
+            pipe.multi()
+            if delete_if_unused and not lock.is_someone_waiting():
+                pipe.delete(key)
+            else:
+                pipe.set(key, lock.dumps())
+            if len(lock.tickets) < number_of_tickets:
+                pipe.publish(self._channel(conversation_id), len(lock.tickets))
+
+            return result
+
+        return self.red.transaction(transaction, key, value_from_callable=True)
+
+    def _channel(self, conversation_id: Text) -> Text:
+        return REDIS_LOCK_STORE_CHANNEL_PREFIX + self.key_prefix + conversation_id
+
+    @asynccontextmanager
+    async def _ticket_removals(
+        self, conversation_id: Text
+    ) -> AsyncGenerator[Callable[[float], Awaitable[Any]], None]:
+        """Waits for the notifications which are published when tickets are removed.
+
+        Most locks are acquired without waiting, so the channel is only subscribed
+        to once a ticket has to wait for the first time. This first call returns
+        right after subscribing, so that tickets which were removed before the
+        subscription aren't missed when the lock is checked again.
+
+        Args:
+            conversation_id: Conversation ID of the lock.
+        """
+        pubsub: Optional["PubSub"] = None
+
+        async def wait_for_removal(timeout: float) -> None:
+            nonlocal pubsub
+            if pubsub is None:
+                pubsub = self.async_red.pubsub()
+                await pubsub.subscribe(self._channel(conversation_id))
+                return
+
+            deadline = time.monotonic() + timeout
+            remaining = timeout
+            while remaining > 0:
+                # returns `None` for the subscription confirmation
+                if await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=remaining
+                ):
+                    return
+                remaining = deadline - time.monotonic()
+
+        try:
+            yield wait_for_removal
+        finally:
+            if pubsub is not None:
+                await pubsub.close()
+
     def delete_lock(self, conversation_id: Text) -> None:
         """Deletes lock for conversation ID."""
         deletion_successful = self.red.delete(self.key_prefix + conversation_id)
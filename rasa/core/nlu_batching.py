@@ -0,0 +1,44 @@
+from typing import Callable, List
+
+from rasa.core.batching import Batcher
+from rasa.core.channels.channel import UserMessage
+from rasa.shared.nlu.training_data.message import Message
+
+
+class NLUMessageBatcher(Batcher[UserMessage, Message]):
+    """Parses concurrently received messages together in batches.
+
+    Messages which are parsed within `max_wait_time` seconds of each other are
+    collected and parsed with a single call of `parse_messages`, so that the NLU
+    components process them as one batch. A batch is parsed as soon as it contains
+    `max_batch_size` messages or `max_wait_time` seconds after its first message was
+    received.
+    """
+
+    def __init__(
+        self,
+        parse_messages: Callable[[List[UserMessage]], List[Message]],
+        max_batch_size: int,
+        max_wait_time: float,
+    ) -> None:
+        """Creates a `NLUMessageBatcher`.
+
+        Args:
+            parse_messages: Parses a list of messages and returns the parsed messages
+                in the same order.
+            max_batch_size: Maximum number of messages which are parsed together.
+            max_wait_time: Maximum time in seconds a message waits for other
+                messages before it is parsed.
+        """
+        super().__init__(parse_messages, max_batch_size, max_wait_time)
+
+    async def parse(self, message: UserMessage) -> Message:
+        """Parses the message together with other concurrently received messages.
+
+        Args:
+            message: The message which should be parsed.
+
+        Returns:
+            The parsed message.
+        """
+        return await self.submit(message)
@@ -103,6 +103,39 @@ class PolicyPredictionEnsemble(ABC):
             predictions=predictions, tracker=tracker, domain=domain
         )
 
+    def combine_predictions_for_trackers_from_kwargs(
+        self, trackers: List[DialogueStateTracker], domain: Domain, **kwargs: Any
+    ) -> List[PolicyPrediction]:
+        """Derives a single prediction per tracker from predictions given as kwargs.
+
+        Args:
+            trackers: dialogue state trackers holding the states of the conversations,
+              which may influence the combination of predictions as well
+            domain: the common domain
+            **kwargs: arbitrary keyword arguments. All lists of policy predictions
+              passed as kwargs will be combined, where the i-th prediction of each
+              list belongs to the i-th tracker.
+
+        Returns:
+            a single prediction per tracker in the same order as the trackers
+        """
+        predictions_per_policy = [
+            value
+            for value in kwargs.values()
+            if isinstance(value, list)
+            and all(isinstance(prediction, PolicyPrediction) for prediction in value)
+        ]
+        return [
+            self.combine_predictions(
+                predictions=[
+                    predictions[idx] for predictions in predictions_per_policy
+                ],
+                tracker=tracker,
+                domain=domain,
+            )
+            for idx, tracker in enumerate(trackers)
+        ]
+
     @abstractmethod
     def combine_predictions(
         self,
@@ -6,9 +6,22 @@ import base64
 import json
 import logging
 import structlog
+import sys
 
+import numpy as np
 from tqdm import tqdm
-from typing import Optional, Any, Dict, List, Text
+from typing import (
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    Optional,
+    Any,
+    Dict,
+    List,
+    Text,
+    Tuple,
+)
 from pathlib import Path
 
 import rasa.utils.io
@@ -38,6 +51,179 @@ from rasa.shared.core.constants import ACTION_LISTEN_NAME
 logger = logging.getLogger(__name__)
 structlogger = structlog.get_logger()
 
+COMPACT_LOOKUP_VOCABULARY_FILE = "memorized_turns_vocabulary.json"
+COMPACT_LOOKUP_ARRAYS = ["hashes", "offsets", "state_ids", "action_ids"]
+
+# parameters of the 64-bit FNV-1a hash, which is truncated to 63 bits to fit into
+# signed integers
+FNV_OFFSET_BASIS = 0xCBF29CE484222325
+FNV_PRIME = 0x100000001B3
+HASH_MASK = 2**63 - 1
+
+
+class CompactLookup:
+    """Memorized turns which are stored as sequences of integer state ids.
+
+    Every distinct state is stored once and identified by its index. A memorized turn
+    is the sequence of the ids of its states. All sequences are concatenated into a
+    single array, which is sorted by the hashes of the sequences so that a sequence is
+    found by binary search. When loaded, the arrays are memory-mapped instead of
+    read into Python objects.
+    """
+
+    def __init__(
+        self,
+        states: List[Text],
+        actions: List[Text],
+        hashes: np.ndarray,
+        offsets: np.ndarray,
+        state_ids: np.ndarray,
+        action_ids: np.ndarray,
+    ) -> None:
+        """Creates the lookup.
+
+        Args:
+            states: The distinct states of all memorized turns.
+            actions: The distinct actions of all memorized turns.
+            hashes: Sorted hashes of the state id sequences of the memorized turns.
+            offsets: Start of the state ids of each memorized turn in `state_ids`,
+                followed by the total number of state ids.
+            state_ids: The concatenated state id sequences of the memorized turns.
+            action_ids: The id of the action of each memorized turn.
+        """
+        self.states = states
+        self.actions = actions
+        self.hashes = hashes
+        self.offsets = offsets
+        self.state_ids = state_ids
+        self.action_ids = action_ids
+
+        self._index_of_state = {state: index for index, state in enumerate(states)}
+
+    @classmethod
+    def from_turns(
+        cls, turns: Iterable[Tuple[Tuple[Text, ...], Text]]
+    ) -> "CompactLookup":
+        """Creates the lookup from memorized turns.
+
+        Args:
+            turns: The serialized states of a memorized turn and its action.
+
+        Returns:
+            The lookup.
+        """
+        index_of_state: Dict[Text, int] = {}
+        index_of_action: Dict[Text, int] = {}
+
+        encoded_turns = []
+        for states, action in turns:
+            ids = [
+                index_of_state.setdefault(state, len(index_of_state))
+                for state in states
+            ]
+            action_id = index_of_action.setdefault(action, len(index_of_action))
+            encoded_turns.append((_hash_state_ids(ids), ids, action_id))
+
+        # stable sort keeps the training order for sequences with colliding hashes
+        encoded_turns.sort(key=lambda turn: turn[0])
+
+        offsets = np.zeros(len(encoded_turns) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(ids) for _, ids, _ in encoded_turns])
+
+        return cls(
+            list(index_of_state),
+            list(index_of_action),
+            np.array([turn[0] for turn in encoded_turns], dtype=np.int64),
+            offsets,
+            np.array(
+                [state_id for _, ids, _ in encoded_turns for state_id in ids],
+                dtype=np.int32,
+            ),
+            np.array([turn[2] for turn in encoded_turns], dtype=np.int32),
+        )
+
+    def get(self, states: Optional[Tuple[Text, ...]]) -> Optional[Text]:
+        """Returns the memorized action for serialized states.
+
+        Args:
+            states: The serialized states.
+
+        Returns:
+            The action or `None` if the states weren't memorized.
+        """
+        if not states:
+            return None
+
+        ids = []
+        for state in states:
+            state_id = self._index_of_state.get(state)
+            if state_id is None:
+                # states which were never seen can't be part of a memorized turn
+                return None
+            ids.append(state_id)
+
+        hash_value = _hash_state_ids(ids)
+        index = int(np.searchsorted(self.hashes, np.int64(hash_value)))
+        while index < len(self.hashes) and self.hashes[index] == hash_value:
+            start, end = self.offsets[index], self.offsets[index + 1]
+            # compare the ids as the hashes of different sequences can collide
+            if self.state_ids[start:end].tolist() == ids:
+                return self.actions[self.action_ids[index]]
+            index += 1
+
+        return None
+
+    def items(self) -> Iterator[Tuple[Tuple[Text, ...], Text]]:
+        """Returns the serialized states and the action of the memorized turns."""
+        for index in range(len(self)):
+            start, end = self.offsets[index], self.offsets[index + 1]
+            yield (
+                tuple(self.states[state_id] for state_id in self.state_ids[start:end]),
+                self.actions[self.action_ids[index]],
+            )
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def persist(self, directory: Path) -> None:
+        """Persists the lookup to `directory`."""
+        rasa.shared.utils.io.dump_obj_as_json_to_file(
+            directory / COMPACT_LOOKUP_VOCABULARY_FILE,
+            {"states": self.states, "actions": self.actions},
+        )
+        for name in COMPACT_LOOKUP_ARRAYS:
+            np.save(directory / f"memorized_turns_{name}.npy", getattr(self, name))
+
+    @classmethod
+    def load(cls, directory: Path) -> Optional["CompactLookup"]:
+        """Loads a persisted lookup from `directory`.
+
+        Returns:
+            The lookup or `None` if there is no persisted lookup in `directory`.
+        """
+        vocabulary_file = directory / COMPACT_LOOKUP_VOCABULARY_FILE
+        if not vocabulary_file.is_file():
+            return None
+
+        vocabulary = rasa.shared.utils.io.read_json_file(vocabulary_file)
+        # Windows can't delete the model directory while the files are mapped
+        mmap_mode = None if sys.platform == "win32" else "r"
+        arrays = {
+            name: np.load(
+                directory / f"memorized_turns_{name}.npy", mmap_mode=mmap_mode
+            )
+            for name in COMPACT_LOOKUP_ARRAYS
+        }
+
+        return cls(vocabulary["states"], vocabulary["actions"], **arrays)
+
+
+def _hash_state_ids(state_ids: List[int]) -> int:
+    hash_value = FNV_OFFSET_BASIS
+    for state_id in state_ids:
+        hash_value = ((hash_value ^ state_id) * FNV_PRIME) & HASH_MASK
+    return hash_value
+
 
 @DefaultV1Recipe.register(
     DefaultV1Recipe.ComponentType.POLICY_WITHOUT_END_TO_END_SUPPORT, is_trainable=True
@@ -68,6 +254,7 @@ class MemoizationPolicy(Policy):
         # please make sure to update the docs when changing a default parameter
         return {
             "enable_feature_string_compression": True,
+            "use_compact_lookup": False,
             "use_nlu_confidence_as_score": False,
             POLICY_PRIORITY: MEMOIZATION_POLICY_PRIORITY,
             POLICY_MAX_HISTORY: DEFAULT_MAX_HISTORY,
@@ -92,6 +279,8 @@ class MemoizationPolicy(Policy):
         """Initialize the policy."""
         super().__init__(config, model_storage, resource, execution_context, featurizer)
         self.lookup = lookup or {}
+        # replaces `lookup` if `use_compact_lookup` is enabled
+        self.compact_lookup: Optional[CompactLookup] = None
 
     def _create_lookup_from_states(
         self,
@@ -107,7 +296,21 @@ class MemoizationPolicy(Policy):
         Returns:
             lookup dictionary
         """
-        lookup: Dict[Text, Text] = {}
+        return self._memorize(
+            trackers_as_states, trackers_as_actions, self._create_feature_key
+        )
+
+    def _memorize(
+        self,
+        trackers_as_states: List[List[State]],
+        trackers_as_actions: List[List[Text]],
+        create_key: Callable[[List[State]], Optional[Hashable]],
+    ) -> Dict[Any, Text]:
+        """Maps the keys of the states to the actions which follow them.
+
+        States which are followed by different actions are not memorized.
+        """
+        lookup: Dict[Any, Text] = {}
 
         if not trackers_as_states:
             return lookup
@@ -127,7 +330,7 @@ class MemoizationPolicy(Policy):
         for states, actions in pbar:
             action = actions[0]
 
-            feature_key = self._create_feature_key(states)
+            feature_key = create_key(states)
             if not feature_key:
                 continue
 
@@ -162,6 +365,19 @@ class MemoizationPolicy(Policy):
         else:
             return feature_str
 
+    @staticmethod
+    def _serialized_states(states: List[State]) -> Optional[Tuple[Text, ...]]:
+        """Serializes the states individually for the `CompactLookup`.
+
+        Joining the serialized states results in the uncompressed feature key.
+        """
+        if not states:
+            return None
+
+        return tuple(
+            json.dumps(state, sort_keys=True).replace('"', "") for state in states
+        )
+
     def train(
         self,
         training_trackers: List[TrackerWithCachedStates],
@@ -182,15 +398,26 @@ class MemoizationPolicy(Policy):
             trackers_as_states,
             trackers_as_actions,
         ) = self.featurizer.training_states_and_labels(training_trackers, domain)
-        self.lookup = self._create_lookup_from_states(
-            trackers_as_states, trackers_as_actions
-        )
-        logger.debug(f"Memorized {len(self.lookup)} unique examples.")
+        if self.config["use_compact_lookup"]:
+            self.lookup = {}
+            self.compact_lookup = CompactLookup.from_turns(
+                self._memorize(
+                    trackers_as_states, trackers_as_actions, self._serialized_states
+                ).items()
+            )
+            logger.debug(f"Memorized {len(self.compact_lookup)} unique examples.")
+        else:
+            self.lookup = self._create_lookup_from_states(
+                trackers_as_states, trackers_as_actions
+            )
+            logger.debug(f"Memorized {len(self.lookup)} unique examples.")
 
         self.persist()
         return self._resource
 
     def _recall_states(self, states: List[State]) -> Optional[Text]:
+        if self.compact_lookup is not None:
+            return self.compact_lookup.get(self._serialized_states(states))
         return self.lookup.get(self._create_feature_key(states))
 
     def recall(
@@ -287,6 +514,9 @@ class MemoizationPolicy(Policy):
             rasa.shared.utils.io.create_directory_for_file(file)
             rasa.shared.utils.io.dump_obj_as_json_to_file(file, self._metadata())
 
+            if self.compact_lookup is not None:
+                self.compact_lookup.persist(Path(path))
+
     @classmethod
     def load(
         cls,
@@ -299,12 +529,14 @@ class MemoizationPolicy(Policy):
         """Loads a trained policy (see parent class for full docstring)."""
         featurizer = None
         lookup = None
+        compact_lookup = None
 
         try:
             with model_storage.read_from(resource) as path:
                 metadata_file = Path(path) / cls._metadata_filename()
                 metadata = rasa.shared.utils.io.read_json_file(metadata_file)
                 lookup = metadata["lookup"]
+                compact_lookup = CompactLookup.load(Path(path))
 
                 if (Path(path) / FEATURIZER_FILE).is_file():
                     featurizer = TrackerFeaturizer.load(path)
@@ -315,7 +547,7 @@ class MemoizationPolicy(Policy):
                 f"metadata couldn't be loaded."
             )
 
-        return cls(
+        policy = cls(
             config,
             model_storage,
             resource,
@@ -323,6 +555,8 @@ class MemoizationPolicy(Policy):
             featurizer=featurizer,
             lookup=lookup,
         )
+        policy.compact_lookup = compact_lookup
+        return policy
 
 
 @DefaultV1Recipe.register(
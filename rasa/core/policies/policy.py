@@ -373,6 +373,37 @@ class Policy(GraphComponent):
         """
         raise NotImplementedError("Policy must have the capacity to predict.")
 
+    def predict_action_probabilities_for_trackers(
+        self,
+        trackers: List[DialogueStateTracker],
+        domain: Domain,
+        rule_only_data: Optional[Dict[Text, Any]] = None,
+        **kwargs: Any,
+    ) -> List[PolicyPrediction]:
+        """Predicts the next action the bot should take for each of the trackers.
+
+        Policies which can make predictions for multiple conversations more
+        efficiently at once (e.g. by running their model on a single batch) should
+        override this method. By default, the trackers are predicted one by one.
+
+        Args:
+            trackers: The trackers containing the conversation histories up to now.
+            domain: The model's domain.
+            rule_only_data: Slots and loops which are specific to rules and hence
+                should be ignored by this policy.
+            **kwargs: Depending on the specified `needs` section and the resulting
+                graph structure the policy can use different input to make predictions.
+
+        Returns:
+             One prediction per tracker in the same order as the trackers.
+        """
+        return [
+            self.predict_action_probabilities(
+                tracker, domain, rule_only_data=rule_only_data, **kwargs
+            )
+            for tracker in trackers
+        ]
+
     def _prediction(
         self,
         probabilities: List[float],
@@ -3,7 +3,22 @@ import copy
 import functools
 import logging
 import structlog
-from typing import Any, List, DefaultDict, Dict, Text, Optional, Set, Tuple, cast
+from pathlib import Path
+from typing import (
+    Any,
+    List,
+    DefaultDict,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Text,
+    Optional,
+    Set,
+    Tuple,
+    cast,
+)
 
 from tqdm import tqdm
 import numpy as np
@@ -15,7 +30,7 @@ from rasa.engine.recipes.default_recipe import DefaultV1Recipe
 from rasa.engine.storage.resource import Resource
 from rasa.engine.storage.storage import ModelStorage
 from rasa.shared.constants import DOCS_URL_RULES
-from rasa.shared.exceptions import RasaException
+from rasa.shared.exceptions import FileIOException, RasaException
 import rasa.shared.utils.io
 from rasa.shared.core.events import LoopInterrupted, UserUttered, ActionExecuted
 from rasa.core.featurizers.tracker_featurizers import TrackerFeaturizer
@@ -50,9 +65,10 @@ from rasa.shared.core.constants import (
     ACTIVE_LOOP,
     RULE_ONLY_SLOTS,
     RULE_ONLY_LOOPS,
+    USER,
 )
 from rasa.shared.core.domain import InvalidDomain, State, Domain
-from rasa.shared.nlu.constants import ACTION_NAME, INTENT_NAME_KEY
+from rasa.shared.nlu.constants import ACTION_NAME, ACTION_TEXT, INTENT, INTENT_NAME_KEY
 import rasa.core.test
 from rasa.core.training.training import create_action_fingerprints, ActionFingerprint
 
@@ -78,6 +94,10 @@ DEFAULT_RULES = "predicting default action with intent "
 LOOP_RULES = "handling active loops and forms - "
 LOOP_RULES_SEPARATOR = " - "
 
+COMPACT_RULE_LOOKUP_FILE = "rule_policy_compact_lookup.json"
+# lookups which are stored as `CompactRuleLookup`s if `use_compact_lookup` is enabled
+COMPACT_RULE_LOOKUPS = [RULES, RULES_FOR_LOOP_UNHAPPY_PATH]
+
 
 class InvalidRule(RasaException):
     """Exception that can be raised when rules are not valid."""
@@ -138,6 +158,9 @@ class RulePolicy(MemoizationPolicy):
             # the policy will use the confidence of NLU on the latest
             # user message to set the confidence of the action
             "use_nlu_confidence_as_score": False,
+            # If `True` the rules are stored as sequences of ids of distinct states
+            # instead of JSON strings of all their states.
+            "use_compact_lookup": False,
         }
 
     def __init__(
@@ -164,6 +187,10 @@ class RulePolicy(MemoizationPolicy):
         self._rules_sources: DefaultDict[Text, List[Tuple[Text, Text]]] = defaultdict(
             list
         )
+        # indices of the rule lookups by the id of the indexed lookup
+        self._rule_indices: Dict[int, _RuleIndex] = {}
+        if RULES in self.lookup:
+            self._rule_index(self.lookup[RULES])
 
     @classmethod
     def raise_if_incompatible_with_domain(
@@ -825,6 +852,9 @@ class RulePolicy(MemoizationPolicy):
 
         logger.debug(f"Memorized '{len(self.lookup[RULES])}' unique rules.")
 
+        if self.config["use_compact_lookup"]:
+            self._use_compact_lookup()
+
         self.persist()
 
         return self._resource
@@ -881,6 +911,27 @@ class RulePolicy(MemoizationPolicy):
         # turn_index goes back in time
         reversed_rule_states = list(reversed(self._rule_key_to_state(rule_key)))
 
+        return self._are_rule_states_applicable(
+            reversed_rule_states, turn_index, conversation_state
+        )
+
+    @classmethod
+    def _are_rule_states_applicable(
+        cls,
+        reversed_rule_states: List[State],
+        turn_index: int,
+        conversation_state: State,
+    ) -> bool:
+        """Checks if rule is satisfied with current state at turn.
+
+        Args:
+            reversed_rule_states: the states of the rule in reversed order
+            turn_index: index of a current dialogue turn
+            conversation_state: the state that corresponds to turn_index
+
+        Returns:
+            a boolean that says whether the rule is applicable to current state
+        """
         # the rule must be applicable because we got (without any applicability issues)
         # further in the conversation history than the rule's length
         if turn_index >= len(reversed_rule_states):
@@ -906,22 +957,69 @@ class RulePolicy(MemoizationPolicy):
             return False
 
         # check: current rule state features are present in current conversation state
-        return self._does_rule_match_state(
+        return cls._does_rule_match_state(
             reversed_rule_states[turn_index], conversation_state
         )
 
+    def _use_compact_lookup(self) -> None:
+        """Replaces the JSON keys of the learned rules with ids of distinct states.
+
+        The checks for contradictions during training modify the lookups, so they are
+        only replaced once training is done.
+        """
+        vocabulary = _StateVocabulary()
+        for key in COMPACT_RULE_LOOKUPS:
+            self.lookup[key] = CompactRuleLookup.from_lookup(
+                self.lookup[key], vocabulary
+            )
+        if RULES_NOT_IN_STORIES in self.lookup:
+            self.lookup[RULES_NOT_IN_STORIES] = CompactRuleSources.from_sources(
+                self.lookup[RULES_NOT_IN_STORIES], vocabulary
+            )
+
+    def _rule_index(self, lookup: Mapping[Text, Text]) -> _RuleIndex:
+        """Returns the index of the rules in `lookup`.
+
+        The index is rebuilt if rules were added to or removed from `lookup`
+        (e.g. when removing incomplete rules during training).
+        """
+        index = self._rule_indices.get(id(lookup))
+        if index is None or not index.is_valid_for(lookup):
+            index = _RuleIndex(lookup)
+            # drop the indices of lookups which were replaced during training
+            current_lookups = {
+                id(self.lookup.get(RULES)),
+                id(self.lookup.get(RULES_FOR_LOOP_UNHAPPY_PATH)),
+            }
+            self._rule_indices = {
+                lookup_id: rule_index
+                for lookup_id, rule_index in self._rule_indices.items()
+                if lookup_id in current_lookups
+            }
+            self._rule_indices[id(lookup)] = index
+        return index
+
     def _get_possible_keys(
-        self, lookup: Dict[Text, Text], states: List[State]
+        self, lookup: Mapping[Text, Text], states: List[State]
     ) -> Set[Text]:
-        possible_keys = set(lookup.keys())
+        if not states:
+            return set(lookup.keys())
+
+        index = self._rule_index(lookup)
+        # the index only returns rules which can match the latest state
+        possible_rules = index.candidates(states[-1])
         for i, state in enumerate(reversed(states)):
-            # find rule keys that correspond to current state
-            possible_keys = set(
-                filter(
-                    lambda _key: self._is_rule_applicable(_key, i, state), possible_keys
+            if not possible_rules:
+                break
+            # find rules that correspond to current state
+            possible_rules = {
+                rule
+                for rule in possible_rules
+                if self._are_rule_states_applicable(
+                    index.reversed_rule_states[rule], i, state
                 )
-            )
-        return possible_keys
+            }
+        return {index.rule_key(rule) for rule in possible_rules}
 
     @staticmethod
     def _find_action_from_default_actions(
@@ -1249,8 +1347,61 @@ class RulePolicy(MemoizationPolicy):
                 directory / "rule_only_data.json", rule_only_data
             )
 
+            compact_lookup = self._compact_lookup_as_dict()
+            if compact_lookup is not None:
+                rasa.shared.utils.io.dump_obj_as_json_to_file(
+                    directory / COMPACT_RULE_LOOKUP_FILE, compact_lookup
+                )
+
     def _metadata(self) -> Dict[Text, Any]:
-        return {"lookup": self.lookup}
+        # compact lookups are persisted separately
+        return {
+            "lookup": {
+                key: value
+                for key, value in self.lookup.items()
+                if not isinstance(value, (CompactRuleLookup, CompactRuleSources))
+            }
+        }
+
+    def _compact_lookup_as_dict(self) -> Optional[Dict[Text, Any]]:
+        rules = self.lookup.get(RULES)
+        if not isinstance(rules, CompactRuleLookup):
+            return None
+
+        compact_lookup: Dict[Text, Any] = {"states": rules.vocabulary.states}
+        for key, value in self.lookup.items():
+            if isinstance(value, (CompactRuleLookup, CompactRuleSources)):
+                compact_lookup[key] = value.as_dict()
+        return compact_lookup
+
+    @classmethod
+    def load(
+        cls,
+        config: Dict[Text, Any],
+        model_storage: ModelStorage,
+        resource: Resource,
+        execution_context: ExecutionContext,
+        **kwargs: Any,
+    ) -> RulePolicy:
+        """Loads a trained policy (see parent class for full docstring)."""
+        policy = cast(
+            RulePolicy,
+            super().load(config, model_storage, resource, execution_context, **kwargs),
+        )
+
+        try:
+            with model_storage.read_from(resource) as path:
+                compact_lookup_file = Path(path) / COMPACT_RULE_LOOKUP_FILE
+                if compact_lookup_file.is_file():
+                    compact_lookup = rasa.shared.utils.io.read_json_file(
+                        compact_lookup_file
+                    )
+                    policy.lookup.update(_compact_lookups_from_dict(compact_lookup))
+        except (ValueError, FileNotFoundError, FileIOException):
+            # the parent class already warned that the policy couldn't be loaded
+            pass
+
+        return policy
 
     @classmethod
     def _metadata_filename(cls) -> Text:
@@ -1265,3 +1416,320 @@ class RulePolicy(MemoizationPolicy):
         return {
             key: self.lookup.get(key, []) for key in [RULE_ONLY_SLOTS, RULE_ONLY_LOOPS]
         }
+
+
+class _RuleIndex:
+    """Index of rules by the features which their latest state requires.
+
+    Rules are only matched against the conversation states if the previous action
+    and the intent of their latest state match the latest conversation state.
+    The states of the rules are decoded once when the index is created.
+
+    Rules are identified by their keys, or by their state ids for a
+    `CompactRuleLookup`. `rule_key` returns the key of a rule.
+    """
+
+    # key of rules whose latest state is a conversation start state
+    _CONVERSATION_START = (PREVIOUS_ACTION, None)
+
+    def __init__(self, lookup: Mapping[Text, Text]) -> None:
+        """Creates the index.
+
+        Args:
+            lookup: The rule lookup which maps rule keys to predictions.
+        """
+        self._lookup = lookup
+        self.reversed_rule_states: Dict[Hashable, List[State]] = {}
+        self._rules: DefaultDict[
+            Tuple[Optional[Tuple[Text, Any]], Optional[Text]], Set[Hashable]
+        ] = defaultdict(set)
+
+        rules: Iterable[Tuple[Hashable, List[State]]]
+        if isinstance(lookup, CompactRuleLookup):
+            rules = lookup.rule_states()
+        else:
+            rules = ((rule_key, json.loads(rule_key)) for rule_key in lookup)
+
+        for rule, rule_states in rules:
+            reversed_rule_states = list(reversed(rule_states))
+            self.reversed_rule_states[rule] = reversed_rule_states
+            self._rules[self._index_key(reversed_rule_states)].add(rule)
+
+    def is_valid_for(self, lookup: Mapping[Text, Text]) -> bool:
+        """Checks whether the index was created for the current rules of `lookup`."""
+        return lookup is self._lookup and len(lookup) == len(self.reversed_rule_states)
+
+    def rule_key(self, rule: Hashable) -> Text:
+        """Returns the key of a rule which is returned by `candidates`."""
+        if isinstance(self._lookup, CompactRuleLookup):
+            return self._lookup.rule_key(cast(Tuple[int, ...], rule))
+        return cast(Text, rule)
+
+    @staticmethod
+    def _required_value(sub_state: Any, key: Text) -> Optional[Text]:
+        """Returns the value of `key` which a matching state must have."""
+        if not sub_state:
+            return None
+
+        value = sub_state.get(key)
+        if isinstance(value, str) and value and value != SHOULD_NOT_BE_SET:
+            return value
+        return None
+
+    @classmethod
+    def _index_key(
+        cls, reversed_rule_states: List[State]
+    ) -> Tuple[Optional[Tuple[Text, Any]], Optional[Text]]:
+        if not reversed_rule_states:
+            # rules without states are applicable to any conversation
+            return None, None
+
+        latest_state = reversed_rule_states[0]
+        previous_action = latest_state.get(PREVIOUS_ACTION)
+        if not previous_action:
+            # intents aren't checked for conversation start states
+            return cls._CONVERSATION_START, None
+
+        intent = cls._required_value(latest_state.get(USER), INTENT)
+        for key in (ACTION_NAME, ACTION_TEXT):
+            value = cls._required_value(previous_action, key)
+            if value is not None:
+                return (key, value), intent
+
+        return None, intent
+
+    def candidates(self, conversation_state: State) -> Set[Hashable]:
+        """Returns the rules which might be applicable to the latest state.
+
+        Args:
+            conversation_state: The latest state of the conversation.
+
+        Returns:
+            All rules which can match `conversation_state`.
+        """
+        previous_action = conversation_state.get(PREVIOUS_ACTION)
+        if not previous_action:
+            return set(self._rules.get((self._CONVERSATION_START, None), set())) | set(
+                self._rules.get((None, None), set())
+            )
+
+        user_sub_state = conversation_state.get(USER) or {}
+        previous_action_keys: List[Optional[Tuple[Text, Any]]] = [None]
+        for key in (ACTION_NAME, ACTION_TEXT):
+            value = previous_action.get(key)
+            if isinstance(value, str):
+                previous_action_keys.append((key, value))
+        intent_keys = [None, user_sub_state.get(INTENT)]
+
+        candidates: Set[Hashable] = set()
+        for previous_action_key in previous_action_keys:
+            for intent_key in intent_keys:
+                candidates.update(
+                    self._rules.get((previous_action_key, intent_key), ())
+                )
+        return candidates
+
+
+class _StateVocabulary:
+    """Distinct states of rules, which are stored and decoded only once."""
+
+    def __init__(self, states: Optional[List[Text]] = None) -> None:
+        """Creates the vocabulary.
+
+        Args:
+            states: The states as JSON strings with sorted keys.
+        """
+        self.states: List[Text] = []
+        self._decoded_states: List[State] = []
+        self._index_of_state: Dict[Text, int] = {}
+        for state in states or []:
+            self._add(state)
+
+    def _add(self, state: Text) -> int:
+        self._index_of_state[state] = len(self.states)
+        self.states.append(state)
+        self._decoded_states.append(json.loads(state))
+        return self._index_of_state[state]
+
+    def encode(
+        self, rule_key: Text, add_missing_states: bool = False
+    ) -> Optional[Tuple[int, ...]]:
+        """Returns the state ids of a rule key.
+
+        Args:
+            rule_key: JSON string of the states of a rule.
+            add_missing_states: Whether to add states which aren't in the vocabulary.
+
+        Returns:
+            The state ids or `None` if the rule contains unknown states.
+        """
+        state_ids = []
+        for state in json.loads(rule_key):
+            serialized_state = json.dumps(state, sort_keys=True)
+            state_id = self._index_of_state.get(serialized_state)
+            if state_id is None:
+                if not add_missing_states:
+                    return None
+                state_id = self._add(serialized_state)
+            state_ids.append(state_id)
+        return tuple(state_ids)
+
+    def decode(self, state_ids: Iterable[int]) -> Text:
+        """Returns the rule key of state ids."""
+        # the same string as `json.dumps` of the list of states
+        return "[" + ", ".join(self.states[state_id] for state_id in state_ids) + "]"
+
+    def decoded_states(self, state_ids: Iterable[int]) -> List[State]:
+        """Returns the decoded states of state ids.
+
+        The states are shared by all rules and must not be modified.
+        """
+        return [self._decoded_states[state_id] for state_id in state_ids]
+
+
+class CompactRuleLookup(Mapping[Text, Text]):
+    """Rule lookup which stores rules as sequences of ids of distinct states.
+
+    The keys of large rule lookups repeat the same states many times. Here every
+    distinct state is stored only once. The key of a rule is created from its
+    state ids when it's needed, e.g. as prediction source.
+    """
+
+    def __init__(
+        self, vocabulary: _StateVocabulary, rules: Dict[Tuple[int, ...], Text]
+    ) -> None:
+        """Creates the lookup.
+
+        Args:
+            vocabulary: The states of the rules.
+            rules: The predictions of the rules by their state ids.
+        """
+        self.vocabulary = vocabulary
+        self._rules = rules
+
+    @classmethod
+    def from_lookup(
+        cls, lookup: Mapping[Text, Text], vocabulary: _StateVocabulary
+    ) -> CompactRuleLookup:
+        """Creates the lookup from a lookup with rule keys.
+
+        Args:
+            lookup: The predictions of the rules by their keys.
+            vocabulary: Vocabulary to which the states of the rules are added.
+
+        Returns:
+            The lookup.
+        """
+        rules = {}
+        for rule_key, prediction in lookup.items():
+            state_ids = vocabulary.encode(rule_key, add_missing_states=True)
+            rules[cast(Tuple[int, ...], state_ids)] = prediction
+        return cls(vocabulary, rules)
+
+    def rule_key(self, state_ids: Tuple[int, ...]) -> Text:
+        """Returns the key of the rule with the given state ids."""
+        return self.vocabulary.decode(state_ids)
+
+    def rule_states(self) -> Iterator[Tuple[Tuple[int, ...], List[State]]]:
+        """Returns the state ids and the decoded states of the rules."""
+        for state_ids in self._rules:
+            yield state_ids, self.vocabulary.decoded_states(state_ids)
+
+    def __getitem__(self, rule_key: Text) -> Text:
+        state_ids = self.vocabulary.encode(rule_key)
+        if state_ids is None or state_ids not in self._rules:
+            raise KeyError(rule_key)
+        return self._rules[state_ids]
+
+    def __iter__(self) -> Iterator[Text]:
+        return (self.rule_key(state_ids) for state_ids in self._rules)
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def as_dict(self) -> List[List[Any]]:
+        """Returns the rules in a JSON serializable format."""
+        return [
+            [list(state_ids), prediction]
+            for state_ids, prediction in self._rules.items()
+        ]
+
+
+class CompactRuleSources:
+    """Prediction sources of rules, e.g. rules which aren't used in stories.
+
+    Sources which are rule keys are stored as state ids.
+    """
+
+    def __init__(
+        self,
+        vocabulary: _StateVocabulary,
+        names: Iterable[Text],
+        rules: Iterable[Tuple[int, ...]],
+    ) -> None:
+        """Creates the sources.
+
+        Args:
+            vocabulary: The states of the rules.
+            names: Sources which aren't rule keys, e.g. default actions.
+            rules: The state ids of the sources which are rule keys.
+        """
+        self.vocabulary = vocabulary
+        self._names = set(names)
+        self._rules = set(rules)
+
+    @classmethod
+    def from_sources(
+        cls, sources: Iterable[Text], vocabulary: _StateVocabulary
+    ) -> CompactRuleSources:
+        """Creates the sources from their names and rule keys."""
+        names = []
+        rules = []
+        for source in sources:
+            if _is_rule_key(source):
+                state_ids = vocabulary.encode(source, add_missing_states=True)
+                rules.append(cast(Tuple[int, ...], state_ids))
+            else:
+                names.append(source)
+        return cls(vocabulary, names, rules)
+
+    def __contains__(self, source: Any) -> bool:
+        if not isinstance(source, str):
+            return False
+        if not _is_rule_key(source):
+            return source in self._names
+        return self.vocabulary.encode(source) in self._rules
+
+    def as_dict(self) -> Dict[Text, Any]:
+        """Returns the sources in a JSON serializable format."""
+        return {
+            "names": sorted(self._names),
+            "rules": [list(state_ids) for state_ids in self._rules],
+        }
+
+
+def _is_rule_key(source: Text) -> bool:
+    # rule keys are JSON lists of states, other sources are descriptions
+    return source.startswith("[")
+
+
+def _compact_lookups_from_dict(compact_lookup: Dict[Text, Any]) -> Dict[Text, Any]:
+    """Creates the compact lookups which `RulePolicy` persisted."""
+    vocabulary = _StateVocabulary(compact_lookup["states"])
+    lookups: Dict[Text, Any] = {}
+    for key in COMPACT_RULE_LOOKUPS:
+        lookups[key] = CompactRuleLookup(
+            vocabulary,
+            {
+                tuple(state_ids): prediction
+                for state_ids, prediction in compact_lookup.get(key, [])
+            },
+        )
+    if RULES_NOT_IN_STORIES in compact_lookup:
+        sources = compact_lookup[RULES_NOT_IN_STORIES]
+        lookups[RULES_NOT_IN_STORIES] = CompactRuleSources(
+            vocabulary,
+            sources["names"],
+            [tuple(state_ids) for state_ids in sources["rules"]],
+        )
+    return lookups
@@ -164,6 +164,13 @@ class TEDPolicy(Policy):
           (https://arxiv.org/abs/1709.03856) idea.
     """
 
+    @staticmethod
+    def is_thread_safe() -> bool:
+        """Whether the component can run at the same time as other graph nodes."""
+        # the model sets the global `random`, `numpy` and `tensorflow` seeds which
+        # would make parallel training runs influence each other
+        return False
+
     @staticmethod
     def get_default_config() -> Dict[Text, Any]:
         """Returns the default config (see parent class for full docstring)."""
@@ -848,17 +855,7 @@ class TEDPolicy(Policy):
         confidence, is_e2e_prediction = self._pick_confidence(
             confidences, similarities, domain
         )
-
-        # rank and mask the confidence (if we need to)
-        ranking_length = self.config[RANKING_LENGTH]
-        if 0 < ranking_length < len(confidence):
-            renormalize = (
-                self.config[RENORMALIZE_CONFIDENCES]
-                and self.config[MODEL_CONFIDENCE] == SOFTMAX
-            )
-            _, confidence = train_utils.rank_and_mask(
-                confidence, ranking_length=ranking_length, renormalize=renormalize
-            )
+        confidence = self._rank_and_mask_confidence(confidence)
 
         optional_events = self._create_optional_event_for_entities(
             outputs, is_e2e_prediction, precomputations, tracker
@@ -871,6 +868,108 @@ class TEDPolicy(Policy):
             diagnostic_data=outputs.get(DIAGNOSTIC_DATA),
         )
 
+    def predict_action_probabilities_for_trackers(
+        self,
+        trackers: List[DialogueStateTracker],
+        domain: Domain,
+        rule_only_data: Optional[Dict[Text, Any]] = None,
+        precomputations: Optional[MessageContainerForCoreFeaturization] = None,
+        **kwargs: Any,
+    ) -> List[PolicyPrediction]:
+        """Predicts the next action for each tracker with a single model run.
+
+        The examples of all trackers are padded to the longest dialogue and fed to
+        the model as one batch. Trackers for which entities have to be predicted from
+        the latest user message are predicted one by one.
+
+        See parent class for full docstring.
+        """
+        if self.model is None or len(trackers) <= 1:
+            return super().predict_action_probabilities_for_trackers(
+                trackers,
+                domain,
+                rule_only_data=rule_only_data,
+                precomputations=precomputations,
+                **kwargs,
+            )
+
+        # every tracker contributes one or two examples to the batch
+        tracker_state_features: List[List[Dict[Text, List[Features]]]] = []
+        example_ranges = []
+        for tracker in trackers:
+            start = len(tracker_state_features)
+            tracker_state_features += self._featurize_tracker(
+                tracker, domain, precomputations, rule_only_data=rule_only_data
+            )
+            example_ranges.append((start, len(tracker_state_features)))
+
+        model_data = self._create_model_data(tracker_state_features)
+        # the outputs of a single batch have the same dialogue length, which
+        # wouldn't be the case if the examples were split into several batches
+        outputs = self.model.run_inference(
+            model_data, batch_size=len(tracker_state_features)
+        )
+        dialogue_lengths = model_data.data[DIALOGUE][LENGTH][0]
+        attention_weights = outputs.get(DIAGNOSTIC_DATA, {}).get("attention_weights")
+
+        predictions = []
+        for tracker, (start, end) in zip(trackers, example_ranges):
+            # the model only returns the prediction for the last turn of each
+            # dialogue during inference
+            confidence, is_e2e_prediction = self._pick_confidence(
+                outputs["scores"][start:end, -1, :],
+                outputs["similarities"][start:end, -1, :],
+                domain,
+            )
+
+            if (
+                is_e2e_prediction
+                and self.config[ENTITY_RECOGNITION]
+                and tracker.latest_action_name == ACTION_LISTEN_NAME
+            ):
+                predictions.append(
+                    self.predict_action_probabilities(
+                        tracker,
+                        domain,
+                        rule_only_data=rule_only_data,
+                        precomputations=precomputations,
+                        **kwargs,
+                    )
+                )
+                continue
+
+            diagnostic_data = None
+            if attention_weights is not None:
+                # the attention weights cover all turns of the padded dialogues
+                dialogue_length = int(dialogue_lengths[start])
+                diagnostic_data = {
+                    "attention_weights": attention_weights[
+                        start:end, ..., :dialogue_length, :dialogue_length
+                    ]
+                }
+
+            predictions.append(
+                self._prediction(
+                    self._rank_and_mask_confidence(confidence).tolist(),
+                    is_end_to_end_prediction=is_e2e_prediction,
+                    diagnostic_data=diagnostic_data,
+                )
+            )
+
+        return predictions
+
+    def _rank_and_mask_confidence(self, confidence: np.ndarray) -> np.ndarray:
+        ranking_length = self.config[RANKING_LENGTH]
+        if 0 < ranking_length < len(confidence):
+            renormalize = (
+                self.config[RENORMALIZE_CONFIDENCES]
+                and self.config[MODEL_CONFIDENCE] == SOFTMAX
+            )
+            _, confidence = train_utils.rank_and_mask(
+                confidence, ranking_length=ranking_length, renormalize=renormalize
+            )
+        return confidence
+
     def _create_optional_event_for_entities(
         self,
         prediction_output: Dict[Text, tf.Tensor],
@@ -38,7 +38,7 @@ from rasa.core.constants import (
     POLICY_PRIORITY,
     UNLIKELY_INTENT_POLICY_PRIORITY,
 )
-from rasa.core.policies.policy import PolicyPrediction
+from rasa.core.policies.policy import Policy, PolicyPrediction
 from rasa.core.policies.ted_policy import (
     LABEL_KEY,
     LABEL_SUB_KEY,
@@ -562,6 +562,20 @@ class UnexpecTEDIntentPolicy(TEDPolicy):
 
         return UnexpecTEDIntentPolicyMetadata(query_intent_metadata, ranking_metadata)
 
+    def predict_action_probabilities_for_trackers(
+        self,
+        trackers: List[DialogueStateTracker],
+        domain: Domain,
+        rule_only_data: Optional[Dict[Text, Any]] = None,
+        **kwargs: Any,
+    ) -> List[PolicyPrediction]:
+        """Predicts the next action for each tracker (see parent class for docs)."""
+        # The batched prediction of `TEDPolicy` picks action predictions, hence the
+        # trackers are predicted one by one.
+        return Policy.predict_action_probabilities_for_trackers(
+            self, trackers, domain, rule_only_data=rule_only_data, **kwargs
+        )
+
     def predict_action_probabilities(
         self,
         tracker: DialogueStateTracker,
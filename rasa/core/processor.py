@@ -1,5 +1,6 @@
 import inspect
 import copy
+import dataclasses
 import logging
 import structlog
 import os
@@ -12,6 +13,7 @@ from typing import Any, Dict, List, Optional, Text, Tuple, Union
 from rasa.core.http_interpreter import RasaNLUHttpInterpreter
 from rasa.engine import loader
 from rasa.engine.constants import PLACEHOLDER_MESSAGE, PLACEHOLDER_TRACKER
+from rasa.engine.graph import GraphSchema
 from rasa.engine.runner.dask import DaskGraphRunner
 from rasa.engine.storage.local_model_storage import LocalModelStorage
 from rasa.engine.storage.storage import ModelMetadata
@@ -27,6 +29,7 @@ from rasa.core.channels.channel import (
     OutputChannel,
     UserMessage,
 )
+from rasa.core.nlu_batching import NLUMessageBatcher
 import rasa.core.utils
 from rasa.core.policies.policy import PolicyPrediction
 from rasa.engine.runner.interface import GraphRunner
@@ -80,6 +83,17 @@ logger = logging.getLogger(__name__)
 structlogger = structlog.get_logger()
 
 MAX_NUMBER_OF_PREDICTIONS = int(os.environ.get("MAX_NUMBER_OF_PREDICTIONS", "10"))
+# concurrently received messages are parsed in batches if this is greater than 1
+NLU_BATCH_SIZE = int(os.environ.get("NLU_BATCH_SIZE", "1"))
+NLU_BATCH_MAX_WAIT_TIME = float(os.environ.get("NLU_BATCH_MAX_WAIT_MS", "10")) / 1000
+
+# functions of the core prediction graph and their counterparts which make
+# predictions for multiple trackers at once
+BATCH_PREDICTION_FUNCTIONS = {
+    "predict_action_probabilities": "predict_action_probabilities_for_trackers",
+    "combine_predictions_from_kwargs": "combine_predictions_for_trackers_from_kwargs",
+    "convert_for_inference": "convert_trackers_for_inference",
+}
 
 
 class MessageProcessor:
@@ -95,8 +109,27 @@ class MessageProcessor:
         max_number_of_predictions: int = MAX_NUMBER_OF_PREDICTIONS,
         on_circuit_break: Optional[LambdaType] = None,
         http_interpreter: Optional[RasaNLUHttpInterpreter] = None,
+        nlu_batch_size: int = NLU_BATCH_SIZE,
+        nlu_batch_max_wait_time: float = NLU_BATCH_MAX_WAIT_TIME,
     ) -> None:
-        """Initializes a `MessageProcessor`."""
+        """Initializes a `MessageProcessor`.
+
+        Args:
+            model_path: Path to the model or to a directory containing models.
+            tracker_store: Tracker store which stores the conversations.
+            lock_store: Lock store which locks the conversations.
+            generator: Generator for the bot responses.
+            action_endpoint: Endpoint of the action server.
+            max_number_of_predictions: Maximum number of actions predicted after a
+                message.
+            on_circuit_break: Called if `max_number_of_predictions` is reached.
+            http_interpreter: Interpreter which parses messages via HTTP instead of
+                the NLU part of the model.
+            nlu_batch_size: Maximum number of concurrently received messages which are
+                parsed together. Messages are parsed one by one if this is `1`.
+            nlu_batch_max_wait_time: Maximum time in seconds a message waits for
+                other messages to be parsed together with.
+        """
         self.nlg = generator
         self.tracker_store = tracker_store
         self.lock_store = lock_store
@@ -120,6 +153,77 @@ class MessageProcessor:
         self.model_path = Path(model_path)
         self.domain = self.model_metadata.domain
         self.http_interpreter = http_interpreter
+        self.nlu_batcher = self._create_nlu_batcher(
+            nlu_batch_size, nlu_batch_max_wait_time
+        )
+        self.batch_graph_runner = self._create_batch_graph_runner()
+
+    def _create_nlu_batcher(
+        self, max_batch_size: int, max_wait_time: float
+    ) -> Optional[NLUMessageBatcher]:
+        """Creates the batcher which parses concurrently received messages together.
+
+        Messages can't be batched if any NLU component requires the tracker, as
+        every message belongs to a different conversation.
+        """
+        if max_batch_size <= 1:
+            return None
+
+        nlu_schema = self.model_metadata.predict_schema.minimal_graph_schema(
+            [self.model_metadata.nlu_target]
+        )
+        if any(
+            PLACEHOLDER_TRACKER in node.needs.values()
+            for node in nlu_schema.nodes.values()
+        ):
+            logger.warning(
+                "Messages are parsed one by one, since the NLU components of the "
+                "model require the conversation tracker."
+            )
+            return None
+
+        return NLUMessageBatcher(
+            self._parse_messages_with_graph, max_batch_size, max_wait_time
+        )
+
+    def _create_batch_graph_runner(self) -> Optional[GraphRunner]:
+        """Creates a runner which predicts the next actions for multiple trackers.
+
+        The runner shares the components of the prediction graph, but runs the
+        functions in `BATCH_PREDICTION_FUNCTIONS` for all nodes which require the
+        tracker. Returns `None` if any of these nodes doesn't support batching.
+        """
+        target = self.model_metadata.core_target
+        if not target:
+            return None
+
+        core_schema = self.model_metadata.predict_schema.minimal_graph_schema([target])
+        batch_nodes = {}
+        for node_name, node in core_schema.nodes.items():
+            if PLACEHOLDER_TRACKER not in node.needs.values():
+                batch_nodes[node_name] = node
+                continue
+
+            batch_fn = BATCH_PREDICTION_FUNCTIONS.get(node.fn)
+            if not batch_fn or not hasattr(node.uses, batch_fn):
+                logger.debug(
+                    f"Next actions are predicted one tracker at a time, since node "
+                    f"'{node_name}' doesn't support predictions for multiple trackers."
+                )
+                return None
+
+            needs = {
+                "trackers" if provider == PLACEHOLDER_TRACKER else param: provider
+                for param, provider in node.needs.items()
+            }
+            batch_nodes[node_name] = dataclasses.replace(
+                node, fn=batch_fn, needs=needs
+            )
+
+        try:
+            return self.graph_runner.with_graph_schema(GraphSchema(batch_nodes))
+        except NotImplementedError:
+            return None
 
     @staticmethod
     def _load_model(
@@ -271,7 +375,42 @@ class MessageProcessor:
             return None
 
         prediction = self._predict_next_with_tracker(tracker)
+        return self._prediction_result(tracker, prediction, verbosity)
+
+    def predict_next_with_trackers(
+        self,
+        trackers: List[DialogueStateTracker],
+        verbosity: EventVerbosity = EventVerbosity.AFTER_RESTART,
+    ) -> Optional[List[Dict[Text, Any]]]:
+        """Predict the next actions for multiple conversation states at once.
+
+        Args:
+            trackers: Trackers representing conversation states.
+            verbosity: Verbosity for the returned conversation states.
 
+        Returns:
+            The predictions for the next actions in the same order as the trackers.
+            `None` if no domain or policies loaded.
+        """
+        if self.model_metadata.training_type == TrainingType.NLU:
+            rasa.shared.utils.io.raise_warning(
+                "No core model. Skipping action prediction and execution.",
+                docs=DOCS_URL_POLICIES,
+            )
+            return None
+
+        predictions = self._predict_next_with_trackers(trackers)
+        return [
+            self._prediction_result(tracker, prediction, verbosity)
+            for tracker, prediction in zip(trackers, predictions)
+        ]
+
+    def _prediction_result(
+        self,
+        tracker: DialogueStateTracker,
+        prediction: PolicyPrediction,
+        verbosity: EventVerbosity,
+    ) -> Dict[Text, Any]:
         scores = [
             {"action": a, "score": p}
             for a, p in zip(self.domain.action_names_or_texts, prediction.probabilities)
@@ -518,6 +657,45 @@ class MessageProcessor:
         Returns:
              The index of the next action and prediction of the policy.
 
+        Raises:
+            ActionLimitReached if the limit of actions to predict has been reached.
+        """
+        self.check_action_limit(tracker)
+
+        prediction = self._predict_next_with_tracker(tracker)
+        return self._action_for_prediction(prediction), prediction
+
+    def predict_next_with_trackers_if_should(
+        self, trackers: List[DialogueStateTracker]
+    ) -> List[Tuple[rasa.core.actions.action.Action, PolicyPrediction]]:
+        """Predicts the next actions for multiple trackers at once.
+
+        Args:
+            trackers: The trackers to predict the next actions for.
+
+        Returns:
+             The next action and prediction of the policy for every tracker in the
+             same order as the trackers.
+
+        Raises:
+            ActionLimitReached if the limit of actions to predict has been reached
+            for any of the trackers.
+        """
+        for tracker in trackers:
+            self.check_action_limit(tracker)
+
+        predictions = self._predict_next_with_trackers(trackers)
+        return [
+            (self._action_for_prediction(prediction), prediction)
+            for prediction in predictions
+        ]
+
+    def check_action_limit(self, tracker: DialogueStateTracker) -> None:
+        """Checks whether another action may be predicted for the tracker.
+
+        Args:
+            tracker: The tracker to predict the next action for.
+
         Raises:
             ActionLimitReached if the limit of actions to predict has been reached.
         """
@@ -530,8 +708,9 @@ class MessageProcessor:
                 "The limit of actions to predict has been reached."
             )
 
-        prediction = self._predict_next_with_tracker(tracker)
-
+    def _action_for_prediction(
+        self, prediction: PolicyPrediction
+    ) -> rasa.core.actions.action.Action:
         action = rasa.core.actions.action.action_for_index(
             prediction.max_confidence_index, self.domain, self.action_endpoint
         )
@@ -541,7 +720,7 @@ class MessageProcessor:
             f"{prediction.max_confidence:.2f}."
         )
 
-        return action, prediction
+        return action
 
     @staticmethod
     def _is_reminder(e: Event, name: Text) -> bool:
@@ -724,7 +903,11 @@ class MessageProcessor:
                 message=Message({TEXT: message.text})
             )
             # Intent is not explicitly present. Pass message to graph.
-            if msg.data.get(INTENT) is None:
+            if msg.data.get(INTENT) is None and self.nlu_batcher:
+                parse_data = self._parse_data_for_message(
+                    await self.nlu_batcher.parse(message), only_output_properties
+                )
+            elif msg.data.get(INTENT) is None:
                 parse_data = self._parse_message_with_graph(
                     message, tracker, only_output_properties
                 )
@@ -772,6 +955,27 @@ class MessageProcessor:
         )
         parsed_messages = results[self.model_metadata.nlu_target]
         parsed_message = parsed_messages[0]
+        return self._parse_data_for_message(parsed_message, only_output_properties)
+
+    def _parse_messages_with_graph(self, messages: List[UserMessage]) -> List[Message]:
+        """Interprets multiple messages with a single run of the graph.
+
+        Arguments:
+            messages: Messages to handle
+
+        Returns:
+            The parsed messages in the same order.
+        """
+        results = self.graph_runner.run(
+            inputs={PLACEHOLDER_MESSAGE: messages, PLACEHOLDER_TRACKER: None},
+            targets=[self.model_metadata.nlu_target],
+        )
+        return results[self.model_metadata.nlu_target]
+
+    @staticmethod
+    def _parse_data_for_message(
+        parsed_message: Message, only_output_properties: bool = True
+    ) -> Dict[Text, Any]:
         parse_data = {
             TEXT: "",
             INTENT: {INTENT_NAME_KEY: None, PREDICTED_CONFIDENCE_KEY: 0.0},
@@ -1104,20 +1308,9 @@ class MessageProcessor:
         self, tracker: DialogueStateTracker
     ) -> PolicyPrediction:
         """Collect predictions from ensemble and return action and predictions."""
-        followup_action = tracker.followup_action
-        if followup_action:
-            tracker.clear_followup_action()
-            if followup_action in self.domain.action_names_or_texts:
-                prediction = PolicyPrediction.for_action_name(
-                    self.domain, followup_action, FOLLOWUP_ACTION
-                )
-                return prediction
-
-            logger.error(
-                f"Trying to run unknown follow-up action '{followup_action}'. "
-                "Instead of running that, Rasa Open Source will ignore the action "
-                "and predict the next action."
-            )
+        followup_prediction = self._predict_followup_action(tracker)
+        if followup_prediction:
+            return followup_prediction
 
         target = self.model_metadata.core_target
         if not target:
@@ -1128,3 +1321,56 @@ class MessageProcessor:
         )
         policy_prediction = results[target]
         return policy_prediction
+
+    def _predict_next_with_trackers(
+        self, trackers: List[DialogueStateTracker]
+    ) -> List[PolicyPrediction]:
+        """Collects the predictions for multiple trackers with a single graph run.
+
+        Falls back to predicting the trackers one by one if the graph doesn't
+        support predictions for multiple trackers.
+        """
+        if not self.batch_graph_runner:
+            return [self._predict_next_with_tracker(tracker) for tracker in trackers]
+
+        predictions: List[Optional[PolicyPrediction]] = [
+            self._predict_followup_action(tracker) for tracker in trackers
+        ]
+        trackers_to_predict = [
+            tracker
+            for tracker, prediction in zip(trackers, predictions)
+            if prediction is None
+        ]
+        if trackers_to_predict:
+            target = self.model_metadata.core_target
+            results = self.batch_graph_runner.run(
+                inputs={PLACEHOLDER_TRACKER: trackers_to_predict}, targets=[target]
+            )
+            policy_predictions = iter(results[target])
+            predictions = [
+                prediction if prediction else next(policy_predictions)
+                for prediction in predictions
+            ]
+
+        return predictions  # type: ignore[return-value]
+
+    def _predict_followup_action(
+        self, tracker: DialogueStateTracker
+    ) -> Optional[PolicyPrediction]:
+        """Predicts the follow-up action of the tracker if there is a known one."""
+        followup_action = tracker.followup_action
+        if not followup_action:
+            return None
+
+        tracker.clear_followup_action()
+        if followup_action in self.domain.action_names_or_texts:
+            return PolicyPrediction.for_action_name(
+                self.domain, followup_action, FOLLOWUP_ACTION
+            )
+
+        logger.error(
+            f"Trying to run unknown follow-up action '{followup_action}'. "
+            "Instead of running that, Rasa Open Source will ignore the action "
+            "and predict the next action."
+        )
+        return None
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 from pathlib import Path
@@ -14,6 +15,7 @@ from rasa.core.constants import (
     SUCCESSFUL_STORIES_FILE,
     STORIES_WITH_WARNINGS_FILE,
 )
+from rasa.core.batching import Batcher
 from rasa.core.channels import UserMessage
 from rasa.core.policies.policy import PolicyPrediction
 from rasa.nlu.test import EntityEvaluationResult, evaluate_entities
@@ -60,7 +62,7 @@ from rasa.shared.utils.io import DEFAULT_ENCODING
 from rasa.utils.tensorflow.constants import QUERY_INTENT_KEY, SEVERITY_KEY
 from rasa.exceptions import ActionLimitReached
 
-from rasa.core.actions.action import ActionRetrieveResponse
+from rasa.core.actions.action import Action, ActionRetrieveResponse
 
 if TYPE_CHECKING:
     from rasa.core.agent import Agent
@@ -84,6 +86,11 @@ StoryEvaluation = namedtuple(
 
 PredictionList = List[Optional[Text]]
 
+ActionPredictionBatcher = Batcher[DialogueStateTracker, Tuple[Action, PolicyPrediction]]
+
+# number of stories whose next actions are predicted together during evaluation
+STORY_EVALUATION_BATCH_SIZE = 64
+
 
 class WrongPredictionException(RasaException, ValueError):
     """Raised if a wrong prediction is encountered."""
@@ -659,12 +666,28 @@ def _get_predicted_action_name(
     return predicted_action_name
 
 
+async def _predict_next_action(
+    processor: "MessageProcessor",
+    partial_tracker: DialogueStateTracker,
+    action_batcher: Optional[ActionPredictionBatcher] = None,
+) -> Tuple[Action, PolicyPrediction]:
+    if action_batcher is None:
+        return processor.predict_next_with_tracker_if_should(partial_tracker)
+
+    # check the limit upfront, so that it only fails the prediction for this story
+    processor.check_action_limit(partial_tracker)
+    return await action_batcher.submit(partial_tracker)
+
+
 async def _run_action_prediction(
     processor: "MessageProcessor",
     partial_tracker: DialogueStateTracker,
     expected_action: Text,
+    action_batcher: Optional[ActionPredictionBatcher] = None,
 ) -> Tuple[Text, PolicyPrediction, Optional[EntityEvaluationResult]]:
-    action, prediction = processor.predict_next_with_tracker_if_should(partial_tracker)
+    action, prediction = await _predict_next_action(
+        processor, partial_tracker, action_batcher
+    )
     predicted_action = _get_predicted_action_name(
         action, partial_tracker, expected_action
     )
@@ -683,8 +706,8 @@ async def _run_action_prediction(
         # but it might be Ok if form action is rejected.
         emulate_loop_rejection(partial_tracker)
         # try again
-        action, prediction = processor.predict_next_with_tracker_if_should(
-            partial_tracker
+        action, prediction = await _predict_next_action(
+            processor, partial_tracker, action_batcher
         )
         # Even if the prediction is also wrong, we don't have to undo the emulation
         # of the action rejection as we know that the user explicitly specified
@@ -701,6 +724,7 @@ async def _collect_action_executed_predictions(
     partial_tracker: DialogueStateTracker,
     event: ActionExecuted,
     fail_on_prediction_errors: bool,
+    action_batcher: Optional[ActionPredictionBatcher] = None,
 ) -> Tuple[EvaluationStore, PolicyPrediction, Optional[EntityEvaluationResult]]:
 
     action_executed_eval_store = EvaluationStore()
@@ -717,7 +741,9 @@ async def _collect_action_executed_predictions(
             predicted_action,
             prediction,
             policy_entity_result,
-        ) = await _run_action_prediction(processor, partial_tracker, expected_action)
+        ) = await _run_action_prediction(
+            processor, partial_tracker, expected_action, action_batcher
+        )
     except ActionLimitReached:
         prediction = PolicyPrediction([], policy_name=None)
         predicted_action = "circuit breaker tripped"
@@ -743,7 +769,7 @@ async def _collect_action_executed_predictions(
                 prediction,
                 policy_entity_result,
             ) = await _run_action_prediction(
-                processor, partial_tracker, expected_action
+                processor, partial_tracker, expected_action, action_batcher
             )
         except ActionLimitReached:
             prediction = PolicyPrediction([], policy_name=None)
@@ -815,6 +841,7 @@ async def _predict_tracker_actions(
     agent: "Agent",
     fail_on_prediction_errors: bool = False,
     use_e2e: bool = False,
+    action_batcher: Optional[ActionPredictionBatcher] = None,
 ) -> Tuple[
     EvaluationStore,
     DialogueStateTracker,
@@ -854,7 +881,11 @@ async def _predict_tracker_actions(
                 prediction,
                 entity_result,
             ) = await _collect_action_executed_predictions(
-                processor, partial_tracker, event, fail_on_prediction_errors
+                processor,
+                partial_tracker,
+                event,
+                fail_on_prediction_errors,
+                action_batcher,
             )
             if entity_result:
                 policy_entity_results.append(entity_result)
@@ -966,16 +997,28 @@ async def _collect_story_predictions(
     action_list = []
     entity_results = []
 
-    for tracker in tqdm(completed_trackers):
-        (
-            tracker_results,
-            predicted_tracker,
-            tracker_actions,
-            tracker_entity_results,
-        ) = await _predict_tracker_actions(
-            tracker, agent, fail_on_prediction_errors, use_e2e
+    if (
+        fail_on_prediction_errors
+        or agent.processor is None
+        or agent.processor.batch_graph_runner is None
+    ):
+        story_results = [
+            await _predict_tracker_actions(
+                tracker, agent, fail_on_prediction_errors, use_e2e
+            )
+            for tracker in tqdm(completed_trackers)
+        ]
+    else:
+        story_results = await _predict_tracker_actions_in_batches(
+            completed_trackers, agent, use_e2e
         )
 
+    for (
+        tracker_results,
+        predicted_tracker,
+        tracker_actions,
+        tracker_entity_results,
+    ) in story_results:
         entity_results.extend(tracker_entity_results)
 
         story_eval_store.merge_store(tracker_results)
@@ -1024,6 +1067,52 @@ async def _collect_story_predictions(
     )
 
 
+async def _predict_tracker_actions_in_batches(
+    completed_trackers: List[DialogueStateTracker], agent: "Agent", use_e2e: bool
+) -> List[
+    Tuple[
+        EvaluationStore,
+        DialogueStateTracker,
+        List[Dict[Text, Any]],
+        List[EntityEvaluationResult],
+    ]
+]:
+    """Evaluates the stories concurrently and predicts their actions in batches.
+
+    The next actions of all stories which are waiting for a prediction are
+    predicted together.
+    """
+    from tqdm import tqdm
+
+    processor = cast("MessageProcessor", agent.processor)
+    action_batcher: ActionPredictionBatcher = Batcher(
+        processor.predict_next_with_trackers_if_should,
+        max_batch_size=STORY_EVALUATION_BATCH_SIZE,
+        # predict as soon as all stories of the current iteration are waiting
+        max_wait_time=0,
+    )
+
+    with tqdm(total=len(completed_trackers)) as progress_bar:
+
+        async def predict_story(
+            tracker: DialogueStateTracker,
+        ) -> Tuple[
+            EvaluationStore,
+            DialogueStateTracker,
+            List[Dict[Text, Any]],
+            List[EntityEvaluationResult],
+        ]:
+            result = await _predict_tracker_actions(
+                tracker, agent, use_e2e=use_e2e, action_batcher=action_batcher
+            )
+            progress_bar.update()
+            return result
+
+        return await asyncio.gather(
+            *[predict_story(tracker) for tracker in completed_trackers]
+        )
+
+
 def _filter_step_events(step: StoryStep) -> StoryStep:
     events = []
     for event in step.events:
@@ -0,0 +1,238 @@
+import base64
+import importlib.util
+import json
+import math
+import zlib
+from typing import Any, Callable, Dict, Optional, Text, Tuple, Union
+
+from rasa.shared.exceptions import RasaException
+from rasa.shared.utils.io import DEFAULT_ENCODING
+
+# key of the serialisation configuration of a tracker store in the endpoint config
+TRACKER_STORE_SERIALISATION_CONFIG_KEY = "serialisation"
+
+JSON_LIBRARY_AUTO = "auto"
+JSON_LIBRARY_JSON = "json"
+JSON_LIBRARY_ORJSON = "orjson"
+JSON_LIBRARY_MSGSPEC = "msgspec"
+# libraries which are used by `auto` if they are installed, in order of preference
+FAST_JSON_LIBRARIES = [JSON_LIBRARY_ORJSON, JSON_LIBRARY_MSGSPEC]
+
+COMPRESSION_ZLIB = "zlib"
+COMPRESSION_ZSTD = "zstd"
+COMPRESSION_METHODS = [COMPRESSION_ZLIB, COMPRESSION_ZSTD]
+DEFAULT_COMPRESSION_THRESHOLD = 1024
+
+# Compressed values are stored as text of the form `<method>:<base64 data>`. As JSON
+# text can't start like this, uncompressed values can be read alongside.
+COMPRESSION_PREFIX_SEPARATOR = ":"
+
+
+class TrackerSerialiserException(RasaException):
+    """Raised if the serialisation of a tracker store is configured incorrectly."""
+
+
+class TrackerSerialiser:
+    """Converts trackers and events to text and back.
+
+    Uses a fast JSON library if one is installed and optionally compresses large
+    values.
+    """
+
+    def __init__(
+        self,
+        json_library: Text = JSON_LIBRARY_AUTO,
+        compression: Optional[Text] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+    ) -> None:
+        """Creates the serialiser.
+
+        Args:
+            json_library: The library used to encode and decode JSON: `json`,
+                `orjson`, `msgspec` or `auto`, which uses the fastest installed one.
+            compression: Method to compress large values: `zlib`, `zstd` or `None`
+                to not compress values.
+            compression_threshold: Values are only compressed if their encoded JSON
+                has at least this many characters.
+        """
+        self.json_library = self._resolve_json_library(json_library)
+        if compression is not None and compression not in COMPRESSION_METHODS:
+            raise TrackerSerialiserException(
+                f"Unknown compression method '{compression}'. Valid values are: "
+                f"{COMPRESSION_METHODS}."
+            )
+        if compression == COMPRESSION_ZSTD:
+            _import_zstandard()
+
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+
+        self._dumps, self._loads = _json_functions(self.json_library)
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[Text, Any]]) -> "TrackerSerialiser":
+        """Creates the serialiser from the configuration of a tracker store.
+
+        Args:
+            config: Value of the `serialisation` key of the tracker store endpoint
+                config.
+
+        Returns:
+            The configured serialiser.
+        """
+        return cls(**(config or {}))
+
+    @staticmethod
+    def _resolve_json_library(json_library: Text) -> Text:
+        if json_library == JSON_LIBRARY_AUTO:
+            for library in FAST_JSON_LIBRARIES:
+                if importlib.util.find_spec(library) is not None:
+                    return library
+            return JSON_LIBRARY_JSON
+
+        if json_library not in [JSON_LIBRARY_JSON, *FAST_JSON_LIBRARIES]:
+            raise TrackerSerialiserException(
+                f"Unknown JSON library '{json_library}'. Valid values are: "
+                f"{[JSON_LIBRARY_AUTO, JSON_LIBRARY_JSON, *FAST_JSON_LIBRARIES]}."
+            )
+        if importlib.util.find_spec(json_library) is None:
+            raise TrackerSerialiserException(
+                f"The JSON library '{json_library}' is configured for the tracker "
+                f"store, but it is not installed. Please install it with "
+                f"`pip install {json_library}`."
+            )
+
+        return json_library
+
+    def dumps(self, obj: Any) -> Text:
+        """Serialises `obj` to text.
+
+        Args:
+            obj: JSON serialisable object, e.g. a serialised event.
+
+        Returns:
+            The JSON text, which is compressed if compression is configured and the
+            text exceeds the compression threshold.
+        """
+        try:
+            serialised = self._dumps(obj)
+        except Exception:
+            # fast JSON libraries are stricter than the stdlib, e.g. regarding
+            # non-string keys or integers exceeding 64 bit
+            serialised = json.dumps(obj)
+        else:
+            # fast JSON libraries silently write `NaN` and infinity as `null`
+            if (
+                self.json_library != JSON_LIBRARY_JSON
+                and "null" in serialised
+                and _contains_non_finite_float(obj)
+            ):
+                serialised = json.dumps(obj)
+
+        if self.compression is None or len(serialised) < self.compression_threshold:
+            return serialised
+
+        return self._compress(serialised)
+
+    def loads(self, serialised: Union[Text, bytes]) -> Any:
+        """Deserialises text which was created by `dumps` or by `json.dumps`.
+
+        Args:
+            serialised: The serialised object.
+
+        Returns:
+            The deserialised object.
+
+        Raises:
+            UnicodeDecodeError: If `serialised` are bytes which aren't text.
+        """
+        if isinstance(serialised, bytes):
+            serialised = serialised.decode(DEFAULT_ENCODING)
+
+        if not serialised.startswith(("{", "[")):
+            serialised = self._decompress(serialised)
+
+        try:
+            return self._loads(serialised)
+        except Exception:
+            # e.g. `NaN`, which only the stdlib supports
+            return json.loads(serialised)
+
+    def _compress(self, serialised: Text) -> Text:
+        data = serialised.encode(DEFAULT_ENCODING)
+        if self.compression == COMPRESSION_ZSTD:
+            compressed = _import_zstandard().ZstdCompressor().compress(data)
+        else:
+            compressed = zlib.compress(data)
+
+        return (
+            self.compression
+            + COMPRESSION_PREFIX_SEPARATOR
+            + base64.b64encode(compressed).decode("ascii")
+        )
+
+    @staticmethod
+    def _decompress(serialised: Text) -> Text:
+        method, separator, encoded = serialised.partition(COMPRESSION_PREFIX_SEPARATOR)
+        if not separator or method not in COMPRESSION_METHODS:
+            # not compressed, e.g. a JSON string or number
+            return serialised
+
+        compressed = base64.b64decode(encoded)
+        if method == COMPRESSION_ZSTD:
+            data = _import_zstandard().ZstdDecompressor().decompress(compressed)
+        else:
+            data = zlib.decompress(compressed)
+
+        return data.decode(DEFAULT_ENCODING)
+
+
+def _json_functions(
+    json_library: Text,
+) -> Tuple[Callable[[Any], Text], Callable[[Text], Any]]:
+    """Returns the functions to encode and decode JSON text with `json_library`."""
+    if json_library == JSON_LIBRARY_ORJSON:
+        import orjson
+
+        def orjson_dumps(obj: Any) -> Text:
+            return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode(
+                DEFAULT_ENCODING
+            )
+
+        return orjson_dumps, orjson.loads
+
+    if json_library == JSON_LIBRARY_MSGSPEC:
+        import msgspec
+
+        encoder = msgspec.json.Encoder()
+        decoder = msgspec.json.Decoder()
+
+        def msgspec_dumps(obj: Any) -> Text:
+            return encoder.encode(obj).decode(DEFAULT_ENCODING)
+
+        return msgspec_dumps, decoder.decode
+
+    return json.dumps, json.loads
+
+
+def _contains_non_finite_float(obj: Any) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_contains_non_finite_float(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_contains_non_finite_float(value) for value in obj)
+    return False
+
+
+def _import_zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise TrackerSerialiserException(
+            f"The compression method '{COMPRESSION_ZSTD}' is configured for the "
+            f"tracker store, but the `zstandard` package is not installed. Please "
+            f"install it with `pip install zstandard`."
+        ) from e
+
+    return zstandard
@@ -6,6 +6,8 @@ import logging
 import os
 from inspect import isawaitable, iscoroutinefunction
 
+import time
+from collections import OrderedDict
 from time import sleep
 from typing import (
     Any,
@@ -21,6 +23,8 @@ from typing import (
     Generator,
     TypeVar,
     Generic,
+    NamedTuple,
+    Tuple,
 )
 
 from boto3.dynamodb.conditions import Key
@@ -31,13 +35,17 @@ import rasa.shared.utils.cli
 import rasa.shared.utils.common
 import rasa.shared.utils.io
 from rasa.plugin import plugin_manager
-from rasa.shared.core.constants import ACTION_LISTEN_NAME
+from rasa.shared.core.constants import ACTION_LISTEN_NAME, ACTION_SESSION_START_NAME
 from rasa.core.brokers.broker import EventBroker
 from rasa.core.constants import (
     POSTGRESQL_SCHEMA,
     POSTGRESQL_MAX_OVERFLOW,
     POSTGRESQL_POOL_SIZE,
 )
+from rasa.core.tracker_serialisation import (
+    TRACKER_STORE_SERIALISATION_CONFIG_KEY,
+    TrackerSerialiser,
+)
 from rasa.shared.core.conversation import Dialogue
 from rasa.shared.core.domain import Domain
 from rasa.shared.core.events import SessionStarted, Event
@@ -59,6 +67,7 @@ if TYPE_CHECKING:
     from sqlalchemy.engine.base import Engine
     from sqlalchemy.orm import Session, Query
     from sqlalchemy import Sequence
+    from sqlalchemy.sql import Select
 
 logger = logging.getLogger(__name__)
 
@@ -66,8 +75,31 @@ logger = logging.getLogger(__name__)
 POSTGRESQL_DEFAULT_MAX_OVERFLOW = 100
 POSTGRESQL_DEFAULT_POOL_SIZE = 50
 
+# asyncio drivers used by the `AsyncSQLTrackerStore` per SQL dialect
+ASYNC_SQL_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+# key of the cache configuration of a tracker store in the endpoint config
+TRACKER_STORE_CACHE_CONFIG_KEY = "cache"
+DEFAULT_TRACKER_CACHE_MAX_SIZE = 1000
+
 # default value for key prefix in RedisTrackerStore
 DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX = "tracker:"
+# prefix of the keys of the Redis lists which hold the events of a conversation
+REDIS_TRACKER_STORE_EVENTS_KEY_PREFIX = "events:"
+
+# fields of the Redis hash which describes the events stored for a conversation
+REDIS_TRACKER_NUMBER_OF_EVENTS = "number_of_events"
+REDIS_TRACKER_SESSION_START = "session_start"
+REDIS_TRACKER_SESSION_START_TIMESTAMP = "session_start_timestamp"
+REDIS_TRACKER_FIRST_EVENT_TIMESTAMP = "first_event_timestamp"
+
+# fields of a conversation document in the MongoTrackerStore which locate the events
+# of the latest conversation session
+MONGO_TRACKER_NUMBER_OF_EVENTS = "number_of_events"
+MONGO_TRACKER_SESSION_START = "session_start"
+
+# suffix of the DynamoDB table which holds the latest session of each conversation
+DYNAMO_SESSIONS_TABLE_SUFFIX = "_sessions"
 
 
 def check_if_tracker_store_async(tracker_store: TrackerStore) -> bool:
@@ -143,11 +175,15 @@ class TrackerStore:
             domain: The `Domain` to initialize the `DialogueStateTracker`.
             event_broker: An event broker to publish any new events to another
                 destination.
-            kwargs: Additional kwargs.
+            kwargs: Additional kwargs. `serialisation` configures the
+                `TrackerSerialiser` which converts trackers and events to text.
         """
         self._domain = domain or Domain.empty()
         self.event_broker = event_broker
         self.max_event_history: Optional[int] = None
+        self.serialiser = TrackerSerialiser.from_config(
+            kwargs.get(TRACKER_STORE_SERIALISATION_CONFIG_KEY)
+        )
 
     @staticmethod
     def create(
@@ -340,6 +376,20 @@ class TrackerStore:
         """Returns the set of values for the tracker store's primary key."""
         raise NotImplementedError()
 
+    async def number_of_stored_events(self, sender_id: Text) -> Optional[int]:
+        """Returns the number of events stored for a conversation across all sessions.
+
+        The number is used to check whether a cached tracker is outdated.
+        Tracker stores which can't determine it cheaply return `None`.
+
+        Args:
+            sender_id: Conversation ID to count the events for.
+
+        Returns:
+            The number of stored events or `None` if it is unknown.
+        """
+        return None
+
     def deserialise_tracker(
         self, sender_id: Text, serialised_tracker: Union[Text, bytes]
     ) -> Optional[DialogueStateTracker]:
@@ -347,7 +397,9 @@ class TrackerStore:
         tracker = self.init_tracker(sender_id)
 
         try:
-            dialogue = Dialogue.from_parameters(json.loads(serialised_tracker))
+            dialogue = Dialogue.from_parameters(
+                self.serialiser.loads(serialised_tracker)
+            )
         except UnicodeDecodeError as e:
             raise TrackerDeserialisationException(
                 "Tracker cannot be deserialised. "
@@ -385,8 +437,9 @@ class InMemoryTrackerStore(TrackerStore, SerializedTrackerAsText):
     async def save(self, tracker: DialogueStateTracker) -> None:
         """Updates and saves the current conversation state."""
         await self.stream_events(tracker)
-        serialised = InMemoryTrackerStore.serialise_tracker(tracker)
-        self.store[tracker.sender_id] = serialised
+        self.store[tracker.sender_id] = self.serialiser.dumps(
+            tracker.as_dialogue().as_dict()
+        )
 
     async def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         """Returns tracker matching sender_id."""
@@ -497,27 +550,223 @@ class RedisTrackerStore(TrackerStore, SerializedTrackerAsText):
     def _get_key_prefix(self) -> Text:
         return self.key_prefix
 
+    def _events_key(self, sender_id: Text) -> Text:
+        return REDIS_TRACKER_STORE_EVENTS_KEY_PREFIX + self.key_prefix + sender_id
+
     async def save(
         self, tracker: DialogueStateTracker, timeout: Optional[float] = None
     ) -> None:
-        """Saves the current conversation state."""
+        """Saves the current conversation state.
+
+        The events of a conversation are stored in a Redis list, which is accompanied
+        by a Redis hash describing the stored events. Saving a tracker only appends
+        the events which aren't stored yet.
+        """
         await self.stream_events(tracker)
 
         if not timeout and self.record_exp:
             timeout = self.record_exp
 
-        stored = self.red.get(self.key_prefix + tracker.sender_id)
+        # The header has to be read before writing since it decides which events are
+        # appended. No transaction is needed to guard against concurrent writes
+        # in between, as the lock store already serialises the saves of a
+        # conversation, and a `WATCH` would cost another round trip.
+        header = self._retrieve_header(tracker.sender_id)
+        number_of_stored_events = self._number_of_stored_events(header, tracker)
+
+        if number_of_stored_events is None:
+            # the tracker doesn't continue the stored events, hence merge them
+            prior_tracker = await self._retrieve(
+                tracker.sender_id, fetch_all_sessions=True
+            )
+            if prior_tracker is not None:
+                tracker = self._merge_trackers(prior_tracker, tracker)
+            self._write_events(tracker.sender_id, list(tracker.events), {}, timeout)
+            return
+
+        self._write_events(
+            tracker.sender_id,
+            list(
+                itertools.islice(
+                    tracker.events, number_of_stored_events, len(tracker.events)
+                )
+            ),
+            header,
+            timeout,
+        )
+
+    def _retrieve_header(self, sender_id: Text) -> Dict[Text, float]:
+        """Returns the description of the events stored for `sender_id`.
+
+        Conversations which are still stored as serialised tracker are migrated to
+        the current storage format first.
+        """
+        import redis
+
+        fields = [
+            REDIS_TRACKER_NUMBER_OF_EVENTS,
+            REDIS_TRACKER_SESSION_START,
+            REDIS_TRACKER_SESSION_START_TIMESTAMP,
+            REDIS_TRACKER_FIRST_EVENT_TIMESTAMP,
+        ]
+
+        try:
+            values = self.red.hmget(self.key_prefix + sender_id, fields)
+        except redis.exceptions.ResponseError:
+            # the key holds a serialised tracker
+            self._migrate_serialised_tracker(sender_id)
+            values = self.red.hmget(self.key_prefix + sender_id, fields)
+
+        return {
+            field: float(value)
+            for field, value in zip(fields, values)
+            if value is not None
+        }
+
+    @staticmethod
+    def _number_of_stored_events(
+        header: Dict[Text, float], tracker: DialogueStateTracker
+    ) -> Optional[int]:
+        """Returns how many events of `tracker` are already stored.
+
+        Args:
+            header: Description of the stored events.
+            tracker: Tracker which is either a continuation of the latest stored
+                conversation session or of all stored conversation sessions.
+
+        Returns:
+            The number of events of `tracker` which are already stored or `None` if
+            `tracker` doesn't continue the stored events.
+        """
+        number_of_events = int(header.get(REDIS_TRACKER_NUMBER_OF_EVENTS, 0))
+        if not number_of_events:
+            return 0
+
+        if not tracker.events:
+            return None
+
+        first_event_timestamp = tracker.events[0].timestamp
+        if first_event_timestamp == header.get(REDIS_TRACKER_SESSION_START_TIMESTAMP):
+            number_of_stored_events = number_of_events - int(
+                header[REDIS_TRACKER_SESSION_START]
+            )
+        elif first_event_timestamp == header.get(REDIS_TRACKER_FIRST_EVENT_TIMESTAMP):
+            number_of_stored_events = number_of_events
+        else:
+            return None
+
+        if number_of_stored_events > len(tracker.events):
+            return None
+
+        return number_of_stored_events
+
+    def _write_events(
+        self,
+        sender_id: Text,
+        new_events: List[Event],
+        header: Dict[Text, float],
+        timeout: Optional[float],
+    ) -> None:
+        """Appends events and updates the header in a single round trip.
+
+        Args:
+            sender_id: Conversation ID of the events.
+            new_events: Events which should be appended to the stored events.
+            header: Description of the stored events. All stored events are replaced
+                by `new_events` if the header is empty.
+            timeout: Expiry of the stored conversation in seconds.
+        """
+        number_of_events = int(header.get(REDIS_TRACKER_NUMBER_OF_EVENTS, 0))
+        updated_header = dict(header)
+
+        for index, event in enumerate(new_events, start=number_of_events):
+            if index == 0:
+                updated_header[REDIS_TRACKER_FIRST_EVENT_TIMESTAMP] = event.timestamp
+                updated_header[REDIS_TRACKER_SESSION_START] = 0
+                updated_header[REDIS_TRACKER_SESSION_START_TIMESTAMP] = event.timestamp
+            elif (
+                isinstance(event, ActionExecuted)
+                and event.action_name == ACTION_SESSION_START_NAME
+            ):
+                updated_header[REDIS_TRACKER_SESSION_START] = index
+                updated_header[REDIS_TRACKER_SESSION_START_TIMESTAMP] = event.timestamp
+
+        updated_header[REDIS_TRACKER_NUMBER_OF_EVENTS] = number_of_events + len(
+            new_events
+        )
+
+        key = self.key_prefix + sender_id
+        events_key = self._events_key(sender_id)
 
-        if stored is not None:
-            prior_tracker = self.deserialise_tracker(tracker.sender_id, stored)
+        pipeline = self.red.pipeline()
+        if not number_of_events:
+            pipeline.delete(key, events_key)
+        if new_events:
+            pipeline.rpush(
+                events_key,
+                *[self.serialiser.dumps(event.as_dict()) for event in new_events],
+            )
+        pipeline.hset(key, mapping=updated_header)
+        if timeout:
+            pipeline.expire(key, int(timeout))
+            pipeline.expire(events_key, int(timeout))
+        pipeline.execute()
 
-            tracker = self._merge_trackers(prior_tracker, tracker)
+    def _migrate_serialised_tracker(self, sender_id: Text) -> None:
+        """Migrates a conversation stored as serialised tracker to a list of events.
 
-        serialised_tracker = self.serialise_tracker(tracker)
-        self.red.set(
-            self.key_prefix + tracker.sender_id, serialised_tracker, ex=timeout
+        Args:
+            sender_id: Conversation ID of the serialised tracker.
+        """
+        key = self.key_prefix + sender_id
+        serialised_tracker = self.red.get(key)
+        if serialised_tracker is None:
+            return
+
+        tracker = self.deserialise_tracker(sender_id, serialised_tracker)
+        if tracker is None:
+            return
+
+        expiry = self.red.ttl(key)
+        self._write_events(
+            sender_id,
+            list(tracker.events),
+            {},
+            expiry if expiry and expiry > 0 else None,
+        )
+
+        logger.debug(
+            f"Migrated serialised tracker for conversation ID '{sender_id}' to a "
+            f"list of events."
         )
 
+    def migrate_serialised_trackers(self) -> int:
+        """Migrates all conversations stored as serialised trackers to event lists.
+
+        Conversations are also migrated lazily when they are accessed. This method
+        allows to migrate all of them at once, e.g. before a deployment.
+
+        Returns:
+            The number of migrated conversations.
+        """
+        number_of_migrated_trackers = 0
+
+        for key in self.red.scan_iter(match=self.key_prefix + "*"):
+            if isinstance(key, bytes):
+                key = key.decode()
+
+            key_type = self.red.type(key)
+            if isinstance(key_type, bytes):
+                key_type = key_type.decode()
+
+            if key_type != "string":
+                continue
+
+            self._migrate_serialised_tracker(key[len(self.key_prefix) :])
+            number_of_migrated_trackers += 1
+
+        return number_of_migrated_trackers
+
     async def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         """Retrieves tracker for the latest conversation session.
 
@@ -555,24 +804,28 @@ class RedisTrackerStore(TrackerStore, SerializedTrackerAsText):
             sender_id: Conversation ID to fetch the tracker for.
             fetch_all_sessions: Whether to fetch all sessions or only the last one.
         """
-        stored = self.red.get(self.key_prefix + sender_id)
-        if stored is None:
+        header = self._retrieve_header(sender_id)
+        if not header.get(REDIS_TRACKER_NUMBER_OF_EVENTS):
             logger.debug(f"Could not find tracker for conversation ID '{sender_id}'.")
             return None
 
-        tracker = self.deserialise_tracker(sender_id, stored)
-        if fetch_all_sessions:
-            return tracker
+        # only fetch the events of the last session
+        start = (
+            0 if fetch_all_sessions else int(header.get(REDIS_TRACKER_SESSION_START, 0))
+        )
+        serialised_events = self.red.lrange(self._events_key(sender_id), start, -1)
 
-        # only return the last session
-        multiple_tracker_sessions = (
-            rasa.shared.core.trackers.get_trackers_for_conversation_sessions(tracker)
+        return DialogueStateTracker.from_dict(
+            sender_id,
+            [self.serialiser.loads(event) for event in serialised_events],
+            self.domain.slots,
+            max_event_history=self.max_event_history,
         )
 
-        if 0 <= len(multiple_tracker_sessions) <= 1:
-            return tracker
-
-        return multiple_tracker_sessions[-1]
+    async def number_of_stored_events(self, sender_id: Text) -> Optional[int]:
+        """Returns the number of events stored for a conversation."""
+        header = self._retrieve_header(sender_id)
+        return int(header.get(REDIS_TRACKER_NUMBER_OF_EVENTS, 0))
 
     async def keys(self) -> Iterable[Text]:
         """Returns keys of the Redis Tracker Store."""
@@ -617,6 +870,39 @@ class RedisTrackerStore(TrackerStore, SerializedTrackerAsText):
         return merged
 
 
+def _index_of_last_session_start(events: List[Dict[Text, Any]]) -> Optional[int]:
+    """Returns the index of the latest serialised `SessionStarted` event.
+
+    Args:
+        events: Serialised events of a conversation.
+
+    Returns:
+        The index of the latest `SessionStarted` event or `None` if there is none.
+    """
+    for index in range(len(events) - 1, -1, -1):
+        if events[index]["event"] == SessionStarted.type_name:
+            return index
+
+    return None
+
+
+def _continues_events(
+    events: List[Dict[Text, Any]], stored_events: List[Dict[Text, Any]]
+) -> bool:
+    """Checks whether serialised events start with the stored events.
+
+    Events are compared by their type and timestamp.
+    """
+    if len(stored_events) > len(events):
+        return False
+
+    return all(
+        event.get("event") == stored_event.get("event")
+        and event.get("timestamp") == stored_event.get("timestamp")
+        for event, stored_event in zip(events, stored_events)
+    )
+
+
 class DynamoTrackerStore(TrackerStore, SerializedTrackerAsDict):
     """Stores conversation history in DynamoDB."""
 
@@ -645,6 +931,11 @@ class DynamoTrackerStore(TrackerStore, SerializedTrackerAsDict):
         self.region = region
         self.table_name = table_name
         self.db = self.get_or_create_table(table_name)
+        # holds the events of the latest session of each conversation so that
+        # `retrieve` doesn't need to read the whole conversation
+        self.sessions = self.get_or_create_table(
+            f"{table_name}{DYNAMO_SESSIONS_TABLE_SUFFIX}"
+        )
         super().__init__(domain, event_broker, **kwargs)
 
     def get_or_create_table(
@@ -658,7 +949,7 @@ class DynamoTrackerStore(TrackerStore, SerializedTrackerAsDict):
             self.client.describe_table(TableName=table_name)
         except self.client.exceptions.ResourceNotFoundException:
             table = dynamo.create_table(
-                TableName=self.table_name,
+                TableName=table_name,
                 KeySchema=[{"AttributeName": "sender_id", "KeyType": "HASH"}],
                 AttributeDefinitions=[
                     {"AttributeName": "sender_id", "AttributeType": "S"}
@@ -674,11 +965,106 @@ class DynamoTrackerStore(TrackerStore, SerializedTrackerAsDict):
         return table
 
     async def save(self, tracker: DialogueStateTracker) -> None:
-        """Saves the current conversation state."""
+        """Saves the current conversation state.
+
+        If the tracker continues the latest stored session, the new events are
+        appended to the conversation. Otherwise the events of the tracker replace
+        the stored conversation. The latest session of the conversation is replaced
+        in both cases.
+        """
         await self.stream_events(tracker)
-        serialized = self.serialise_tracker(tracker)
 
-        self.db.put_item(Item=serialized)
+        session_start, stored_session_events = self._retrieve_latest_session(
+            tracker.sender_id
+        )
+
+        events = [event.as_dict() for event in tracker.events]
+        latest_session_start = _index_of_last_session_start(events) or 0
+
+        if not _continues_events(events, stored_session_events):
+            self._replace_conversation(tracker.sender_id, events, latest_session_start)
+            return
+
+        additional_events = events[len(stored_session_events) :]
+
+        # `tracker.events` starts with the first event of the stored session
+        self.db.update_item(
+            Key={"sender_id": tracker.sender_id},
+            UpdateExpression=(
+                "SET #events = list_append(if_not_exists(#events, :empty), :events), "
+                "#name = :name"
+            ),
+            ExpressionAttributeNames={"#events": "events", "#name": "name"},
+            ExpressionAttributeValues={
+                ":events": core_utils.replace_floats_with_decimals(additional_events),
+                ":empty": [],
+                ":name": tracker.sender_id,
+            },
+        )
+        self.sessions.put_item(
+            Item={
+                "sender_id": tracker.sender_id,
+                "session_start": session_start + latest_session_start,
+                "events": core_utils.replace_floats_with_decimals(
+                    events[latest_session_start:]
+                ),
+            }
+        )
+
+    def _replace_conversation(
+        self, sender_id: Text, events: List[Dict[Text, Any]], session_start: int
+    ) -> None:
+        """Replaces all stored events of a conversation.
+
+        Args:
+            sender_id: Conversation ID.
+            events: The serialised events of the conversation.
+            session_start: The index of the first event of the latest session.
+        """
+        self.db.put_item(
+            Item={
+                "sender_id": sender_id,
+                "events": core_utils.replace_floats_with_decimals(events),
+                "name": sender_id,
+            }
+        )
+        self.sessions.put_item(
+            Item={
+                "sender_id": sender_id,
+                "session_start": session_start,
+                "events": core_utils.replace_floats_with_decimals(
+                    events[session_start:]
+                ),
+            }
+        )
+
+    def _retrieve_latest_session(
+        self, sender_id: Text
+    ) -> Tuple[int, List[Dict[Text, Any]]]:
+        """Retrieves the events of the latest session of a conversation.
+
+        Conversations which were stored by previous Rasa versions don't have a
+        session item. Their events are loaded to determine the latest session.
+
+        Args:
+            sender_id: Conversation ID.
+
+        Returns:
+            The index of the first event of the latest session within all events of
+            the conversation, and the serialised events of the latest session.
+        """
+        session = self.sessions.get_item(Key={"sender_id": sender_id}).get("Item")
+        if session:
+            return (
+                int(session["session_start"]),
+                core_utils.replace_decimals_with_floats(session.get("events", [])),
+            )
+
+        stored = self.db.get_item(Key={"sender_id": sender_id}).get("Item") or {}
+        events = core_utils.replace_decimals_with_floats(stored.get("events", []))
+        session_start = _index_of_last_session_start(events) or 0
+
+        return session_start, events[session_start:]
 
     @staticmethod
     def serialise_tracker(
@@ -718,24 +1104,26 @@ class DynamoTrackerStore(TrackerStore, SerializedTrackerAsDict):
             sender_id: Conversation ID to fetch the tracker for.
             fetch_all_sessions: Whether to fetch all sessions or only the last one.
         """
-        dialogues = self.db.query(
-            KeyConditionExpression=Key("sender_id").eq(sender_id),
-            ScanIndexForward=False,
-        )["Items"]
+        if fetch_all_sessions:
+            dialogues = self.db.query(
+                KeyConditionExpression=Key("sender_id").eq(sender_id),
+                ScanIndexForward=False,
+            )["Items"]
 
-        if not dialogues:
-            return None
+            if not dialogues:
+                return None
 
-        if fetch_all_sessions:
             events_with_floats = []
             for dialogue in dialogues:
                 if dialogue.get("events"):
                     events = core_utils.replace_decimals_with_floats(dialogue["events"])
                     events_with_floats += events
         else:
-            events = dialogues[0].get("events", [])
-            # `float`s are stored as `Decimal` objects - we need to convert them back
-            events_with_floats = core_utils.replace_decimals_with_floats(events)
+            # `float`s are stored as `Decimal` objects - they are converted back
+            _, events_with_floats = self._retrieve_latest_session(sender_id)
+
+            if not events_with_floats:
+                return None
 
         if self.domain is None:
             slots = []
@@ -818,19 +1206,61 @@ class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
         """Saves the current conversation state."""
         await self.stream_events(tracker)
 
-        additional_events = self._additional_events(tracker)
+        number_of_events, session_start = self._stored_event_indices(tracker.sender_id)
+        number_of_events_in_session = number_of_events - session_start
+        additional_events = [
+            event.as_dict()
+            for event in itertools.islice(
+                tracker.events, number_of_events_in_session, len(tracker.events)
+            )
+        ]
+
+        latest_session_start = _index_of_last_session_start(additional_events)
+        if latest_session_start is not None:
+            session_start = number_of_events + latest_session_start
+
+        state = self._current_tracker_state_without_events(tracker)
+        state[MONGO_TRACKER_NUMBER_OF_EVENTS] = number_of_events + len(
+            additional_events
+        )
+        state[MONGO_TRACKER_SESSION_START] = session_start
 
         self.conversations.update_one(
             {"sender_id": tracker.sender_id},
-            {
-                "$set": self._current_tracker_state_without_events(tracker),
-                "$push": {
-                    "events": {"$each": [e.as_dict() for e in additional_events]}
-                },
-            },
+            {"$set": state, "$push": {"events": {"$each": additional_events}}},
             upsert=True,
         )
 
+    def _stored_event_indices(self, sender_id: Text) -> Tuple[int, int]:
+        """Returns the number of stored events and the start of the latest session.
+
+        Conversations which were stored by previous Rasa versions don't contain
+        these indices. Their events are loaded once to determine them.
+
+        Args:
+            sender_id: Conversation ID.
+
+        Returns:
+            The number of events stored for the conversation and the index of the
+            stored event which starts the latest conversation session.
+        """
+        stored = self.conversations.find_one(
+            {"sender_id": sender_id}, projection={"events": False}
+        )
+        if not stored:
+            return 0, 0
+
+        if MONGO_TRACKER_NUMBER_OF_EVENTS in stored:
+            return (
+                stored[MONGO_TRACKER_NUMBER_OF_EVENTS],
+                stored[MONGO_TRACKER_SESSION_START],
+            )
+
+        stored = self.conversations.find_one({"sender_id": sender_id}) or {}
+        events = self._events_from_serialized_tracker(stored)
+
+        return len(events), _index_of_last_session_start(events) or 0
+
     def _additional_events(self, tracker: DialogueStateTracker) -> Iterator:
         """Return events from the tracker which aren't currently stored.
 
@@ -841,15 +1271,10 @@ class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
             List of serialised events that aren't currently stored.
 
         """
-        stored = self.conversations.find_one({"sender_id": tracker.sender_id}) or {}
-        all_events = self._events_from_serialized_tracker(stored)
-
-        number_events_since_last_session = len(
-            self._events_since_last_session_start(all_events)
-        )
+        number_of_events, session_start = self._stored_event_indices(tracker.sender_id)
 
         return itertools.islice(
-            tracker.events, number_events_since_last_session, len(tracker.events)
+            tracker.events, number_of_events - session_start, len(tracker.events)
         )
 
     @staticmethod
@@ -868,18 +1293,18 @@ class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
             event. Returns all events if no such event is found.
 
         """
-        events_after_session_start = []
-        for event in reversed(events):
-            events_after_session_start.append(event)
-            if event["event"] == SessionStarted.type_name:
-                break
-
-        return list(reversed(events_after_session_start))
+        return events[_index_of_last_session_start(events) or 0 :]
 
     async def _retrieve(
         self, sender_id: Text, fetch_events_from_all_sessions: bool
     ) -> Optional[List[Dict[Text, Any]]]:
-        stored = self.conversations.find_one({"sender_id": sender_id})
+        projection = None
+        if not fetch_events_from_all_sessions:
+            projection = self._latest_session_projection(sender_id)
+
+        stored = self.conversations.find_one(
+            {"sender_id": sender_id}, projection=projection
+        )
 
         # look for conversations which have used an `int` sender_id in the past
         # and update them.
@@ -902,6 +1327,36 @@ class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
 
         return events
 
+    def _latest_session_projection(self, sender_id: Text) -> Optional[Dict]:
+        """Returns a projection which only fetches the events of the latest session.
+
+        Args:
+            sender_id: Conversation ID.
+
+        Returns:
+            `None` if the conversation wasn't stored with the start index of its
+            latest session, e.g. by a previous Rasa version.
+        """
+        stored = self.conversations.find_one(
+            {"sender_id": sender_id},
+            projection={
+                "_id": False,
+                MONGO_TRACKER_NUMBER_OF_EVENTS: True,
+                MONGO_TRACKER_SESSION_START: True,
+            },
+        )
+        if not stored or MONGO_TRACKER_NUMBER_OF_EVENTS not in stored:
+            return None
+
+        number_of_events = stored[MONGO_TRACKER_NUMBER_OF_EVENTS]
+        session_start = stored[MONGO_TRACKER_SESSION_START]
+        # `$slice` requires a positive number of elements to return
+        return {
+            "events": {
+                "$slice": [session_start, max(number_of_events - session_start, 1)]
+            }
+        }
+
     async def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         """Retrieves tracker for the latest conversation session."""
         events = await self._retrieve(sender_id, fetch_events_from_all_sessions=False)
@@ -926,6 +1381,25 @@ class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
             conversation_id, events, self.domain.slots
         )
 
+    async def number_of_stored_events(self, sender_id: Text) -> Optional[int]:
+        """Returns the number of events stored for a conversation."""
+        stored = self.conversations.find_one(
+            {"sender_id": sender_id},
+            projection={"_id": False, MONGO_TRACKER_NUMBER_OF_EVENTS: True},
+        )
+        if stored and MONGO_TRACKER_NUMBER_OF_EVENTS in stored:
+            return stored[MONGO_TRACKER_NUMBER_OF_EVENTS]
+
+        counts = list(
+            self.conversations.aggregate(
+                [
+                    {"$match": {"sender_id": sender_id}},
+                    {"$project": {"count": {"$size": {"$ifNull": ["$events", []]}}}},
+                ]
+            )
+        )
+        return counts[0]["count"] if counts else 0
+
     async def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the Mongo Tracker Store."""
         return [c["sender_id"] for c in self.conversations.find()]
@@ -1247,6 +1721,15 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
             sender_ids = session.query(self.SQLEvent.sender_id).distinct().all()
             return [sender_id for (sender_id,) in sender_ids]
 
+    async def number_of_stored_events(self, sender_id: Text) -> Optional[int]:
+        """Returns the number of events stored for a conversation."""
+        with self.session_scope() as session:
+            return (
+                session.query(sa.func.count(self.SQLEvent.id))
+                .filter(self.SQLEvent.sender_id == sender_id)
+                .scalar()
+            )
+
     async def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         """Retrieves tracker for the latest conversation session."""
         return await self._retrieve(sender_id, fetch_events_from_all_sessions=False)
@@ -1270,13 +1753,15 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
                 fetch_events_from_all_sessions=fetch_events_from_all_sessions,
             ).all()
 
-            events = [json.loads(event.data) for event in serialised_events]
+            events = [self.serialiser.loads(event.data) for event in serialised_events]
 
             if self.domain and len(events) > 0:
                 logger.debug(f"Recreating tracker from sender id '{sender_id}'")
-                return DialogueStateTracker.from_dict(
+                tracker = DialogueStateTracker.from_dict(
                     sender_id, events, self.domain.slots
                 )
+                tracker.number_of_persisted_events = len(events)
+                return tracker
             else:
                 logger.debug(
                     f"Can't retrieve tracker matching "
@@ -1333,41 +1818,359 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
             # only store recent events
             events = self._additional_events(session, tracker)
 
-            for event in events:
-                data = event.as_dict()
-                intent = (
-                    data.get("parse_data", {}).get("intent", {}).get(INTENT_NAME_KEY)
-                )
-                action = data.get("name")
-                timestamp = data.get("timestamp")
-
-                # noinspection PyArgumentList
-                session.add(
-                    self.SQLEvent(
-                        sender_id=tracker.sender_id,
-                        type_name=event.type_name,
-                        timestamp=timestamp,
-                        intent_name=intent,
-                        action_name=action,
-                        data=json.dumps(data),
-                    )
-                )
+            rows = [
+                self._event_row(tracker.sender_id, event, self.serialiser)
+                for event in events
+            ]
+            if rows:
+                # a single statement for all events instead of one per event
+                session.execute(self.SQLEvent.__table__.insert(), rows)
             session.commit()
 
+        tracker.number_of_persisted_events = len(tracker.events)
+
         logger.debug(f"Tracker with sender_id '{tracker.sender_id}' stored to database")
 
+    @staticmethod
+    def _event_row(
+        sender_id: Text, event: Event, serialiser: TrackerSerialiser
+    ) -> Dict[Text, Any]:
+        """Returns the column values to store `event` as row of the events table."""
+        data = event.as_dict()
+        intent = data.get("parse_data", {}).get("intent", {}).get(INTENT_NAME_KEY)
+
+        return {
+            "sender_id": sender_id,
+            "type_name": event.type_name,
+            "timestamp": data.get("timestamp"),
+            "intent_name": intent,
+            "action_name": data.get("name"),
+            "data": serialiser.dumps(data),
+        }
+
     def _additional_events(
         self, session: "Session", tracker: DialogueStateTracker
     ) -> Iterator:
-        """Return events from the tracker which aren't currently stored."""
-        number_of_events_since_last_session = self._event_query(
-            session, tracker.sender_id, fetch_events_from_all_sessions=False
-        ).count()
+        """Return events from the tracker which aren't currently stored.
+
+        Trackers which were retrieved from or saved to this tracker store know how
+        many of their events are stored. The events are only counted in the database
+        for other trackers.
+        """
+        number_of_persisted_events = tracker.number_of_persisted_events
+        if number_of_persisted_events is None:
+            number_of_persisted_events = self._event_query(
+                session, tracker.sender_id, fetch_events_from_all_sessions=False
+            ).count()
 
         return itertools.islice(
-            tracker.events, number_of_events_since_last_session, len(tracker.events)
+            tracker.events, number_of_persisted_events, len(tracker.events)
+        )
+
+
+class AsyncSQLTrackerStore(TrackerStore, SerializedTrackerAsText):
+    """Store which saves and retrieves trackers from an SQL database asynchronously.
+
+    Uses the same table as the `SQLTrackerStore`, but talks to the database with
+    an asyncio driver (`asyncpg` for PostgreSQL, `aiosqlite` for SQLite) so that
+    queries don't block the event loop.
+    """
+
+    def __init__(
+        self,
+        domain: Optional[Domain] = None,
+        dialect: Text = "sqlite",
+        host: Optional[Text] = None,
+        port: Optional[int] = None,
+        db: Text = "rasa.db",
+        username: Optional[Text] = None,
+        password: Optional[Text] = None,
+        event_broker: Optional[EventBroker] = None,
+        query: Optional[Dict] = None,
+        pool_size: Optional[int] = None,
+        max_overflow: Optional[int] = None,
+        statement_timeout: Optional[float] = None,
+        prepared_statement_cache_size: Optional[int] = None,
+        **kwargs: Dict[Text, Any],
+    ) -> None:
+        """Creates the tracker store.
+
+        Args:
+            domain: The `Domain` to initialize the `DialogueStateTracker`.
+            dialect: SQL database type, either `postgresql` or `sqlite`.
+            host: Database network host or complete database URL.
+            port: Database network port.
+            db: Database name.
+            username: User name to use when connecting to the database.
+            password: Password for database user.
+            event_broker: An event broker to publish any new events to another
+                destination.
+            query: Dictionary of options to be passed to the dialect and/or the
+                DBAPI upon connect.
+            pool_size: Number of connections kept in the connection pool
+                (PostgreSQL only).
+            max_overflow: Number of connections which can be opened in addition to
+                `pool_size` (PostgreSQL only).
+            statement_timeout: Time in seconds after which the database aborts a
+                statement (PostgreSQL only).
+            prepared_statement_cache_size: Number of prepared statements cached per
+                connection (PostgreSQL only).
+            kwargs: Additional kwargs.
+        """
+        from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+        engine_url = self.get_db_url(
+            dialect, host, validate_port(port), db, username, password, query
+        )
+
+        self.engine = create_async_engine(
+            engine_url,
+            **self._create_engine_kwargs(
+                engine_url,
+                pool_size,
+                max_overflow,
+                statement_timeout,
+                prepared_statement_cache_size,
+            ),
+        )
+        self.sessionmaker = sa.orm.session.sessionmaker(
+            bind=self.engine, class_=AsyncSession, expire_on_commit=False
+        )
+        self._tables_created = False
+
+        logger.debug(f"Using async SQL database via '{self.engine.url!r}'.")
+
+        super().__init__(domain, event_broker, **kwargs)
+
+    @staticmethod
+    def get_db_url(
+        dialect: Text = "sqlite",
+        host: Optional[Text] = None,
+        port: Optional[int] = None,
+        db: Text = "rasa.db",
+        username: Optional[Text] = None,
+        password: Optional[Text] = None,
+        query: Optional[Dict] = None,
+    ) -> "URL":
+        """Builds the database URL including the asyncio driver of the dialect.
+
+        Args:
+            dialect: SQL database type.
+            host: Database network host.
+            port: Database network port.
+            db: Database name.
+            username: User name to use when connecting to the database.
+            password: Password for database user.
+            query: Dictionary of options to be passed to the dialect and/or the
+                DBAPI upon connect.
+
+        Returns:
+            URL ready to be used with an SQLAlchemy `AsyncEngine` object.
+        """
+        url = sa.engine.make_url(
+            SQLTrackerStore.get_db_url(
+                dialect, host, port, db, username, password, query=query
+            )
+        )
+
+        if "+" in url.drivername:
+            # the driver was already specified by the user
+            return url
+
+        async_driver = ASYNC_SQL_DRIVERS.get(url.get_backend_name())
+        if async_driver is None:
+            raise RasaException(
+                f"The dialect '{url.get_backend_name()}' is not supported by the "
+                f"'{AsyncSQLTrackerStore.__name__}'. Supported dialects are: "
+                f"{', '.join(ASYNC_SQL_DRIVERS)}."
+            )
+
+        return url.set(drivername=f"{url.get_backend_name()}+{async_driver}")
+
+    @staticmethod
+    def _create_engine_kwargs(
+        url: "URL",
+        pool_size: Optional[int],
+        max_overflow: Optional[int],
+        statement_timeout: Optional[float],
+        prepared_statement_cache_size: Optional[int],
+    ) -> Dict[Text, Any]:
+        """Get `sqlalchemy.ext.asyncio.create_async_engine()` kwargs."""
+        if url.get_backend_name() != "postgresql":
+            return {}
+
+        server_settings = {}
+        schema_name = os.environ.get(POSTGRESQL_SCHEMA)
+        if schema_name:
+            logger.debug(f"Using PostgreSQL schema '{schema_name}'.")
+            server_settings["search_path"] = schema_name
+        if statement_timeout:
+            # PostgreSQL expects the timeout in milliseconds
+            server_settings["statement_timeout"] = str(int(statement_timeout * 1000))
+
+        connect_args: Dict[Text, Any] = {"server_settings": server_settings}
+        if prepared_statement_cache_size is not None:
+            connect_args.update(
+                prepared_statement_cache_size=prepared_statement_cache_size
+            )
+
+        return {
+            "connect_args": connect_args,
+            "pool_size": pool_size
+            or int(os.environ.get(POSTGRESQL_POOL_SIZE, POSTGRESQL_DEFAULT_POOL_SIZE)),
+            "max_overflow": max_overflow
+            or int(
+                os.environ.get(POSTGRESQL_MAX_OVERFLOW, POSTGRESQL_DEFAULT_MAX_OVERFLOW)
+            ),
+            "pool_pre_ping": True,
+        }
+
+    async def _ensure_tables_exist(self) -> None:
+        """Creates the events table when the tracker store is used for the first time.
+
+        The table can't be created in the constructor as it isn't a coroutine.
+        """
+        if self._tables_created:
+            return
+
+        import sqlalchemy.exc
+
+        try:
+            async with self.engine.begin() as connection:
+                await connection.run_sync(SQLTrackerStore.Base.metadata.create_all)
+        except (sqlalchemy.exc.OperationalError, sqlalchemy.exc.ProgrammingError) as e:
+            # Several Rasa services started in parallel may attempt to
+            # create tables at the same time. That is okay so long as
+            # the first services finishes the table creation.
+            logger.error(f"Could not create tables: {e}")
+
+        self._tables_created = True
+
+    async def keys(self) -> Iterable[Text]:
+        """Returns sender_ids of the AsyncSQLTrackerStore."""
+        await self._ensure_tables_exist()
+
+        async with self.sessionmaker() as session:
+            result = await session.execute(
+                sa.select(SQLTrackerStore.SQLEvent.sender_id).distinct()
+            )
+            return list(result.scalars())
+
+    async def number_of_stored_events(self, sender_id: Text) -> Optional[int]:
+        """Returns the number of events stored for a conversation."""
+        await self._ensure_tables_exist()
+
+        sql_event = SQLTrackerStore.SQLEvent
+        async with self.sessionmaker() as session:
+            return await session.scalar(
+                sa.select(sa.func.count(sql_event.id)).where(
+                    sql_event.sender_id == sender_id
+                )
+            )
+
+    async def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        """Retrieves tracker for the latest conversation session."""
+        return await self._retrieve(sender_id, fetch_events_from_all_sessions=False)
+
+    async def retrieve_full_tracker(
+        self, conversation_id: Text
+    ) -> Optional[DialogueStateTracker]:
+        """Fetching all tracker events across conversation sessions."""
+        return await self._retrieve(
+            conversation_id, fetch_events_from_all_sessions=True
         )
 
+    async def _retrieve(
+        self, sender_id: Text, fetch_events_from_all_sessions: bool
+    ) -> Optional[DialogueStateTracker]:
+        await self._ensure_tables_exist()
+
+        async with self.sessionmaker() as session:
+            result = await session.execute(
+                self._event_query(
+                    sender_id,
+                    fetch_events_from_all_sessions=fetch_events_from_all_sessions,
+                )
+            )
+            events = [self.serialiser.loads(event.data) for event in result.scalars()]
+
+        if not events:
+            logger.debug(
+                f"Can't retrieve tracker matching "
+                f"sender id '{sender_id}' from SQL storage. "
+                f"Returning `None` instead."
+            )
+            return None
+
+        logger.debug(f"Recreating tracker from sender id '{sender_id}'")
+        tracker = DialogueStateTracker.from_dict(sender_id, events, self.domain.slots)
+        tracker.number_of_persisted_events = len(events)
+        return tracker
+
+    @staticmethod
+    def _event_query(sender_id: Text, fetch_events_from_all_sessions: bool) -> "Select":
+        """Provide the query to retrieve the conversation events for a specific sender.
+
+        Args:
+            sender_id: Sender id whose conversation events should be retrieved.
+            fetch_events_from_all_sessions: Whether to fetch events from all
+                conversation sessions. If `False`, only fetch events from the
+                latest conversation session.
+
+        Returns:
+            Query to get the conversation events.
+        """
+        sql_event = SQLTrackerStore.SQLEvent
+        event_query = sa.select(sql_event).where(sql_event.sender_id == sender_id)
+
+        if not fetch_events_from_all_sessions:
+            # timestamp of the latest `SessionStarted` event
+            session_start = (
+                sa.select(sa.func.max(sql_event.timestamp))
+                .where(
+                    sql_event.sender_id == sender_id,
+                    sql_event.type_name == SessionStarted.type_name,
+                )
+                .scalar_subquery()
+            )
+            event_query = event_query.where(
+                # Find events after the latest `SessionStarted` event or return all
+                # events
+                sa.or_(sql_event.timestamp >= session_start, session_start.is_(None))
+            )
+
+        return event_query.order_by(sql_event.timestamp)
+
+    async def save(self, tracker: DialogueStateTracker) -> None:
+        """Update database with events from the current conversation."""
+        await self.stream_events(tracker)
+        await self._ensure_tables_exist()
+
+        async with self.sessionmaker() as session:
+            number_of_persisted_events = tracker.number_of_persisted_events
+            if number_of_persisted_events is None:
+                number_of_persisted_events = await session.scalar(
+                    sa.select(sa.func.count()).select_from(
+                        self._event_query(
+                            tracker.sender_id, fetch_events_from_all_sessions=False
+                        ).subquery()
+                    )
+                )
+
+            rows = [
+                SQLTrackerStore._event_row(tracker.sender_id, event, self.serialiser)
+                for event in itertools.islice(
+                    tracker.events, number_of_persisted_events, len(tracker.events)
+                )
+            ]
+            if rows:
+                await session.execute(SQLTrackerStore.SQLEvent.__table__.insert(), rows)
+            await session.commit()
+
+        tracker.number_of_persisted_events = len(tracker.events)
+
+        logger.debug(f"Tracker with sender_id '{tracker.sender_id}' stored to database")
+
 
 class FailSafeTrackerStore(TrackerStore):
     """Tracker store wrapper.
@@ -1445,6 +2248,14 @@ class FailSafeTrackerStore(TrackerStore):
             self.on_tracker_store_error(e)
             return []
 
+    async def number_of_stored_events(self, sender_id: Text) -> Optional[int]:
+        """Calls `number_of_stored_events` method of primary tracker store."""
+        try:
+            return await self._tracker_store.number_of_stored_events(sender_id)
+        except Exception as e:
+            self.on_tracker_store_retrieve_error(e)
+            return None
+
     async def save(self, tracker: DialogueStateTracker) -> None:
         """Calls `save` method of primary tracker store."""
         try:
@@ -1486,6 +2297,191 @@ class FailSafeTrackerStore(TrackerStore):
             )
 
 
+class _CachedTracker(NamedTuple):
+    tracker: DialogueStateTracker
+    number_of_stored_events: Optional[int]
+    number_of_events: int
+    last_event: Optional[Event]
+    expires_at: Optional[float]
+
+
+class CachedTrackerStore(TrackerStore):
+    """Tracker store wrapper which keeps recently used trackers in memory.
+
+    Retrieving a cached tracker only requires the wrapped tracker store to count
+    the stored events of the conversation instead of loading and deserialising
+    all of them. A cached tracker is discarded if the wrapped tracker store holds
+    a different number of events for the conversation (e.g. because another Rasa
+    worker saved it in the meantime). If the wrapped tracker store can't count
+    the events, trackers are only cached if a `ttl` is set and are used until they
+    expire.
+
+    Trackers are written through to the wrapped tracker store on `save`.
+    """
+
+    def __init__(
+        self,
+        tracker_store: TrackerStore,
+        max_size: int = DEFAULT_TRACKER_CACHE_MAX_SIZE,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Create a `CachedTrackerStore`.
+
+        Args:
+            tracker_store: The wrapped tracker store.
+            max_size: Maximum number of cached trackers. The least recently used
+                tracker is evicted when the cache is full.
+            ttl: Time in seconds after which a cached tracker expires. Required to
+                cache trackers if the wrapped tracker store can't count the stored
+                events of a conversation.
+        """
+        self._tracker_store = tracker_store
+        self._max_size = max_size
+        self._ttl = ttl
+        self._cache: "OrderedDict[Text, _CachedTracker]" = OrderedDict()
+        self._warned_about_unknown_number_of_events = False
+
+        # number of retrieved trackers which were / weren't found in the cache
+        self.hits = 0
+        self.misses = 0
+
+        super().__init__(tracker_store.domain, tracker_store.event_broker)
+
+    @property
+    def domain(self) -> Domain:
+        """Returns the domain of the wrapped tracker store."""
+        return self._tracker_store.domain
+
+    @domain.setter
+    def domain(self, domain: Optional[Domain]) -> None:
+        self._tracker_store.domain = domain or Domain.empty()
+        # cached trackers contain the slots of the previous domain
+        self._cache.clear()
+
+    @property
+    def size(self) -> int:
+        """Returns the number of cached trackers."""
+        return len(self._cache)
+
+    def _cached_tracker(self, sender_id: Text) -> Optional[_CachedTracker]:
+        """Returns the cached tracker if it is neither expired nor modified."""
+        cached = self._cache.get(sender_id)
+        if cached is None:
+            return None
+
+        tracker = cached.tracker
+        is_expired = cached.expires_at is not None and cached.expires_at < time.time()
+        # trackers are only changed by appending events, which changes the last event
+        # even if `max_event_history` is reached
+        is_modified = len(tracker.events) != cached.number_of_events or (
+            tracker.events and tracker.events[-1] is not cached.last_event
+        )
+
+        if is_expired or is_modified:
+            del self._cache[sender_id]
+            return None
+
+        return cached
+
+    def _add_to_cache(
+        self, tracker: DialogueStateTracker, number_of_stored_events: Optional[int]
+    ) -> None:
+        if number_of_stored_events is None and not self._ttl:
+            # without a count or an expiry changes of other Rasa workers would never
+            # be noticed
+            self._warn_about_unknown_number_of_events()
+            return
+
+        self._cache[tracker.sender_id] = _CachedTracker(
+            tracker=tracker,
+            number_of_stored_events=number_of_stored_events,
+            number_of_events=len(tracker.events),
+            last_event=tracker.events[-1] if tracker.events else None,
+            expires_at=time.time() + self._ttl if self._ttl else None,
+        )
+        self._cache.move_to_end(tracker.sender_id)
+
+        while len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+
+    def _warn_about_unknown_number_of_events(self) -> None:
+        if self._warned_about_unknown_number_of_events:
+            return
+
+        self._warned_about_unknown_number_of_events = True
+        rasa.shared.utils.io.raise_warning(
+            f"The '{self._tracker_store.__class__.__name__}' can't count the stored "
+            f"events of a conversation. Trackers are only cached if a 'ttl' is set "
+            f"in the 'cache' section of the tracker store configuration."
+        )
+
+    async def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        """Returns the cached tracker or retrieves it from the wrapped store.
+
+        The returned tracker is the cached instance. Changes to it are only kept in
+        the cache if the tracker is saved afterwards.
+        """
+        number_of_stored_events = await self._tracker_store.number_of_stored_events(
+            sender_id
+        )
+
+        cached = self._cached_tracker(sender_id)
+        if cached is not None and (
+            number_of_stored_events is None
+            or number_of_stored_events == cached.number_of_stored_events
+        ):
+            self.hits += 1
+            self._cache.move_to_end(sender_id)
+            return cached.tracker
+
+        self.misses += 1
+        tracker = await self._tracker_store.retrieve(sender_id)
+        if tracker is not None:
+            self._add_to_cache(tracker, number_of_stored_events)
+
+        return tracker
+
+    async def save(self, tracker: DialogueStateTracker) -> None:
+        """Saves the tracker to the wrapped tracker store and caches it."""
+        # don't keep an outdated tracker around in case saving fails
+        cached = self._cache.pop(tracker.sender_id, None)
+
+        await self._tracker_store.save(tracker)
+
+        if (
+            cached is not None
+            and cached.tracker is tracker
+            and cached.number_of_stored_events is not None
+            and len(tracker.events) >= cached.number_of_events
+        ):
+            # the wrapped tracker store appended the events which were added to the
+            # cached tracker, counting them again would require another query
+            number_of_stored_events: Optional[int] = (
+                cached.number_of_stored_events
+                + len(tracker.events)
+                - cached.number_of_events
+            )
+        else:
+            number_of_stored_events = (
+                await self._tracker_store.number_of_stored_events(tracker.sender_id)
+            )
+        self._add_to_cache(tracker, number_of_stored_events)
+
+    async def retrieve_full_tracker(
+        self, conversation_id: Text
+    ) -> Optional[DialogueStateTracker]:
+        """Calls `retrieve_full_tracker` method of the wrapped tracker store."""
+        return await self._tracker_store.retrieve_full_tracker(conversation_id)
+
+    async def keys(self) -> Iterable[Text]:
+        """Calls `keys` method of the wrapped tracker store."""
+        return await self._tracker_store.keys()
+
+    async def number_of_stored_events(self, sender_id: Text) -> Optional[int]:
+        """Calls `number_of_stored_events` method of the wrapped tracker store."""
+        return await self._tracker_store.number_of_stored_events(sender_id)
+
+
 def _create_from_endpoint_config(
     endpoint_config: Optional[EndpointConfig] = None,
     domain: Optional[Domain] = None,
@@ -1518,6 +2514,13 @@ def _create_from_endpoint_config(
             event_broker=event_broker,
             **endpoint_config.kwargs,
         )
+    elif endpoint_config.type.lower() == "async_sql":
+        tracker_store = AsyncSQLTrackerStore(
+            domain=domain,
+            host=endpoint_config.url,
+            event_broker=event_broker,
+            **endpoint_config.kwargs,
+        )
     elif endpoint_config.type.lower() == "dynamo":
         tracker_store = DynamoTrackerStore(
             domain=domain, event_broker=event_broker, **endpoint_config.kwargs
@@ -1569,6 +2572,14 @@ def create_tracker_store(
     event_broker: Optional[EventBroker] = None,
 ) -> TrackerStore:
     """Creates a tracker store based on the current configuration."""
+    cache_config = None
+    if endpoint_config and TRACKER_STORE_CACHE_CONFIG_KEY in endpoint_config.kwargs:
+        # the cache configuration is not meant for the tracker store itself
+        store_type = endpoint_config.type
+        endpoint_config = endpoint_config.copy()
+        endpoint_config.type = store_type
+        cache_config = endpoint_config.kwargs.pop(TRACKER_STORE_CACHE_CONFIG_KEY) or {}
+
     tracker_store = _create_from_endpoint_config(endpoint_config, domain, event_broker)
 
     if not check_if_tracker_store_async(tracker_store):
@@ -1582,6 +2593,9 @@ def create_tracker_store(
         )
         tracker_store = AwaitableTrackerStore(tracker_store)
 
+    if cache_config is not None:
+        tracker_store = CachedTrackerStore(tracker_store, **cache_config)
+
     return tracker_store
 
 
@@ -1643,6 +2657,14 @@ class AwaitableTrackerStore(TrackerStore):
         result = self._tracker_store.keys()
         return await result if isawaitable(result) else result
 
+    async def number_of_stored_events(self, sender_id: Text) -> Optional[int]:
+        """Wrapper to call `number_of_stored_events` of primary tracker store."""
+        if not hasattr(self._tracker_store, "number_of_stored_events"):
+            return None
+
+        result = self._tracker_store.number_of_stored_events(sender_id)
+        return await result if isawaitable(result) else result
+
     async def save(self, tracker: DialogueStateTracker) -> None:
         """Wrapper to call `save` method of primary tracker store."""
         result = self._tracker_store.save(tracker)
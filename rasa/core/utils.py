@@ -1,9 +1,10 @@
 import json
 import logging
+import math
 import os
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, Optional, Set, Text, Tuple, Union
+from typing import Any, Callable, Dict, Optional, Set, Text, Tuple, Type, Union
 
 import numpy as np
 
@@ -243,11 +244,14 @@ def replace_floats_with_decimals(obj: Any, round_digits: int = 9) -> Any:
         Input `obj` with all `float` types replaced by `Decimal`s rounded to
         `round_digits` decimal places.
     """
+    exponent = Decimal(10) ** -round_digits
 
-    def _float_to_rounded_decimal(s: Text) -> Decimal:
-        return Decimal(s).quantize(Decimal(10) ** -round_digits)
+    def _float_to_rounded_decimal(value: float) -> Any:
+        if not math.isfinite(value):
+            return value
+        return Decimal(repr(value)).quantize(exponent)
 
-    return json.loads(json.dumps(obj), parse_float=_float_to_rounded_decimal)
+    return _replace_values(obj, float, _float_to_rounded_decimal)
 
 
 class DecimalEncoder(json.JSONEncoder):
@@ -277,7 +281,27 @@ def replace_decimals_with_floats(obj: Any) -> Any:
     Returns:
         Input `obj` with all `Decimal` types replaced by `float`s.
     """
-    return json.loads(json.dumps(obj, cls=DecimalEncoder))
+    return _replace_values(obj, Decimal, float)
+
+
+def _replace_values(obj: Any, value_type: Type, convert: Callable[[Any], Any]) -> Any:
+    """Replaces all values of `value_type` in a JSON-like object.
+
+    Dictionaries and lists are copied in the process. Tuples become lists and
+    dictionary keys become strings, as they would in a JSON round trip.
+    """
+    if isinstance(obj, value_type):
+        return convert(obj)
+    if isinstance(obj, dict):
+        return {
+            key if isinstance(key, str) else json.dumps(key): _replace_values(
+                value, value_type, convert
+            )
+            for key, value in obj.items()
+        }
+    if isinstance(obj, (list, tuple)):
+        return [_replace_values(value, value_type, convert) for value in obj]
+    return obj
 
 
 def _lock_store_is_multi_worker_compatible(
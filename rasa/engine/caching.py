@@ -4,6 +4,7 @@ import abc
 import logging
 import os
 import shutil
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Text, Any, Optional, Tuple, List
@@ -24,11 +25,17 @@ import sqlalchemy.orm
 from sqlalchemy.ext.declarative import declarative_base, DeclarativeMeta
 
 from rasa.engine.storage.storage import ModelStorage
+from rasa.shared.utils.yaml_cache import YAML_CACHE_DIRECTORY
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_CACHE_LOCATION = Path(".rasa", "cache")
 DEFAULT_CACHE_NAME = "cache.db"
+# name of the database in the cache directory which stores the features of single
+# training examples (see `rasa.nlu.featurizers.feature_cache`)
+FEATURE_CACHE_NAME = "features.db"
+# files which SQLite creates next to a database while writing to it
+SQLITE_TEMPORARY_FILE_SUFFIXES = ["-journal", "-wal", "-shm"]
 DEFAULT_CACHE_SIZE_MB = 1000
 
 CACHE_LOCATION_ENV = "RASA_CACHE_DIRECTORY"
@@ -186,6 +193,9 @@ class LocalTrainingCache(TrainingCache):
             self._cache_location.mkdir(parents=True)
 
         self._sessionmaker = self._create_database()
+        # graph nodes which run in parallel threads may cache their outputs at the
+        # same time
+        self._lock = threading.Lock()
 
         self._drop_cache_entries_from_incompatible_versions()
 
@@ -265,19 +275,22 @@ class LocalTrainingCache(TrainingCache):
         if self._is_disabled():
             return
 
-        cache_dir, output_type = None, None
-        if isinstance(output, Cacheable):
-            cache_dir, output_type = self._cache_output_to_disk(output, model_storage)
+        with self._lock:
+            cache_dir, output_type = None, None
+            if isinstance(output, Cacheable):
+                cache_dir, output_type = self._cache_output_to_disk(
+                    output, model_storage
+                )
 
-        try:
-            self._add_cache_entry(
-                cache_dir, fingerprint_key, output_fingerprint, output_type
-            )
-        except OperationalError:
-            if cache_dir:
-                shutil.rmtree(cache_dir)
+            try:
+                self._add_cache_entry(
+                    cache_dir, fingerprint_key, output_fingerprint, output_type
+                )
+            except OperationalError:
+                if cache_dir:
+                    shutil.rmtree(cache_dir)
 
-            raise
+                raise
 
     def _add_cache_entry(
         self,
@@ -336,19 +349,39 @@ class LocalTrainingCache(TrainingCache):
             while (
                 rasa.utils.common.directory_size_in_mb(
                     self._cache_location,
-                    filenames_to_exclude=[self._cache_database_name],
+                    filenames_to_exclude=self._files_not_counted_towards_size(),
+                    subdirectories_to_exclude=[YAML_CACHE_DIRECTORY],
                 )
                 + output_size
                 > self._max_cache_size
             ):
-                self._drop_least_recently_used_item()
+                if not self._drop_least_recently_used_item():
+                    # everything which counts towards the size was deleted
+                    break
 
             output_type = rasa.shared.utils.common.module_path_from_instance(output)
             cache_path = shutil.move(temp_dir, self._cache_location)
 
             return cache_path, output_type
 
-    def _drop_least_recently_used_item(self) -> None:
+    def _files_not_counted_towards_size(self) -> List[Text]:
+        # the feature cache and the cache of parsed YAML files limit their own size
+        # (see `rasa.nlu.featurizers.feature_cache` and `rasa.shared.utils.yaml_cache`)
+        return [
+            f"{database_name}{suffix}"
+            for database_name in [self._cache_database_name, FEATURE_CACHE_NAME]
+            for suffix in ["", *SQLITE_TEMPORARY_FILE_SUFFIXES]
+        ]
+
+    def _drop_least_recently_used_item(self) -> bool:
+        """Deletes the least recently used cached result.
+
+        Content of the cache directory which is unknown to the cache is deleted if
+        there are no cached results.
+
+        Returns:
+            `False` if there was nothing left to delete.
+        """
         with self._sessionmaker.begin() as session:
             query_for_least_recently_used_entry = sa.select(self.CacheEntry).order_by(
                 self.CacheEntry.last_used.asc()
@@ -358,8 +391,7 @@ class LocalTrainingCache(TrainingCache):
             )
 
             if not oldest_cache_item:
-                self._purge_cache_dir_content()
-                return
+                return self._purge_cache_dir_content()
 
             self._delete_cached_result(oldest_cache_item)
             delete_query = sa.delete(self.CacheEntry).where(
@@ -371,16 +403,22 @@ class LocalTrainingCache(TrainingCache):
                 f"Deleted item with fingerprint "
                 f"'{oldest_cache_item.fingerprint_key}' to free space."
             )
+            return True
 
-    def _purge_cache_dir_content(self) -> None:
+    def _purge_cache_dir_content(self) -> bool:
+        files_to_keep = [*self._files_not_counted_towards_size(), YAML_CACHE_DIRECTORY]
+        purged_any_item = False
         for item in self._cache_location.glob("*"):
-            if item.name == self._cache_database_name:
+            if item.name in files_to_keep:
                 continue
 
             if item.is_dir():
                 shutil.rmtree(item)
             else:
                 item.unlink()
+            purged_any_item = True
+
+        return purged_any_item
 
     def get_cached_output_fingerprint(self, fingerprint_key: Text) -> Optional[Text]:
         """Returns cached output fingerprint (see parent class for full docstring)."""
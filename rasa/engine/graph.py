@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 import dataclasses
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
@@ -263,6 +264,15 @@ class GraphComponent(ABC):
         """
         return None
 
+    @staticmethod
+    def is_thread_safe() -> bool:
+        """Whether the component can run at the same time as other graph nodes.
+
+        Graph runners which run independent nodes in parallel threads never run
+        nodes of components which are not thread-safe at the same time.
+        """
+        return True
+
 
 class GraphNodeHook(ABC):
     """Holds functionality to be run before and after a `GraphNode`."""
@@ -577,6 +587,25 @@ class GraphNode:
             hooks=hooks,
         )
 
+    def with_fn(self, fn_name: Text, inputs: Dict[Text, Text]) -> GraphNode:
+        """Creates a node which runs a different function of the same component.
+
+        The new node shares the instantiated component with this node, so that the
+        component doesn't need to be loaded again.
+
+        Args:
+            fn_name: The function on the component to be run when the node executes.
+            inputs: A map from input name to parent node name that provides it.
+
+        Returns:
+            The new node.
+        """
+        node = copy.copy(self)
+        node._fn_name = fn_name
+        node._fn = getattr(self._component_class, fn_name)
+        node._inputs = inputs
+        return node
+
 
 @dataclass()
 class GraphModelConfiguration:
@@ -1,17 +1,36 @@
 from __future__ import annotations
 
+import copy
 import logging
-from typing import Any, Dict, List, Optional, Text
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Text, Tuple
 
-import dask
+import dask.threaded
 
 from rasa.engine.exceptions import GraphRunError
-from rasa.engine.graph import ExecutionContext, GraphNode, GraphNodeHook, GraphSchema
+from rasa.engine.graph import (
+    ExecutionContext,
+    GraphNode,
+    GraphNodeHook,
+    GraphSchema,
+    SchemaNode,
+)
 from rasa.engine.runner.interface import GraphRunner
 from rasa.engine.storage.storage import ModelStorage
 
 logger = logging.getLogger(__name__)
 
+# `sync` runs one node after another without dask, `threads` runs independent nodes in
+# parallel threads using dask
+GRAPH_SCHEDULER_ENV = "RASA_GRAPH_SCHEDULER"
+GRAPH_MAX_WORKERS_ENV = "RASA_GRAPH_MAX_WORKERS"
+SCHEDULER_SYNC = "sync"
+SCHEDULER_THREADS = "threads"
+SCHEDULERS = [SCHEDULER_SYNC, SCHEDULER_THREADS]
+
 
 class DaskGraphRunner(GraphRunner):
     """Dask implementation of a `GraphRunner`."""
@@ -22,6 +41,8 @@ class DaskGraphRunner(GraphRunner):
         model_storage: ModelStorage,
         execution_context: ExecutionContext,
         hooks: Optional[List[GraphNodeHook]] = None,
+        scheduler: Optional[Text] = None,
+        max_workers: Optional[int] = None,
     ) -> None:
         """Initializes a `DaskGraphRunner`.
 
@@ -32,12 +53,46 @@ class DaskGraphRunner(GraphRunner):
             execution_context: Information about the current graph run to be passed to
                 each node.
             hooks: These are called before and after the execution of each node.
+            scheduler: `sync` to run one node after another or `threads` to run
+                independent nodes in parallel threads. Defaults to the value of the
+                environment variable `RASA_GRAPH_SCHEDULER` or `sync`.
+            max_workers: Maximum number of nodes which run at the same time if
+                `scheduler` is `threads`. Defaults to the value of the environment
+                variable `RASA_GRAPH_MAX_WORKERS` or the number of CPUs.
         """
         self._graph_schema = graph_schema
         self._instantiated_nodes: Dict[Text, GraphNode] = self._instantiate_nodes(
             graph_schema, model_storage, execution_context, hooks
         )
         self._execution_context: ExecutionContext = execution_context
+        self._scheduler, self._max_workers = self._get_scheduler_config(
+            scheduler, max_workers
+        )
+        # held by nodes of components which are not thread-safe
+        self._thread_unsafe_lock = threading.Lock()
+        # execution plans by their sorted targets
+        self._plans: Dict[Tuple[Text, ...], _ExecutionPlan] = {}
+
+    @staticmethod
+    def _get_scheduler_config(
+        scheduler: Optional[Text], max_workers: Optional[int]
+    ) -> Tuple[Text, Optional[int]]:
+        scheduler = scheduler or os.environ.get(GRAPH_SCHEDULER_ENV, SCHEDULER_SYNC)
+        if scheduler not in SCHEDULERS:
+            raise GraphRunError(
+                f"Unknown graph scheduler '{scheduler}'. Valid values are: "
+                f"{SCHEDULERS}."
+            )
+
+        if max_workers is None and os.environ.get(GRAPH_MAX_WORKERS_ENV):
+            max_workers = int(os.environ[GRAPH_MAX_WORKERS_ENV])
+        if max_workers is not None and max_workers < 1:
+            raise GraphRunError(
+                f"The maximum number of graph workers has to be at least 1, but it "
+                f"is {max_workers}."
+            )
+
+        return scheduler, max_workers
 
     @classmethod
     def create(
@@ -50,6 +105,26 @@ class DaskGraphRunner(GraphRunner):
         """Creates the runner (see parent class for full docstring)."""
         return cls(graph_schema, model_storage, execution_context, hooks)
 
+    def with_graph_schema(self, graph_schema: GraphSchema) -> DaskGraphRunner:
+        """Creates a runner for a variant of the graph (see parent class for docs)."""
+        instantiated_nodes = {}
+        for node_name, schema_node in graph_schema.nodes.items():
+            original_node = self._graph_schema.nodes.get(node_name)
+            if original_node is None or original_node.uses != schema_node.uses:
+                raise GraphRunError(
+                    f"Node '{node_name}' of the graph variant has to use the same "
+                    f"component as the node with the same name in the original graph."
+                )
+            instantiated_nodes[node_name] = self._instantiated_nodes[
+                node_name
+            ].with_fn(schema_node.fn, schema_node.needs)
+
+        runner = copy.copy(self)
+        runner._graph_schema = graph_schema
+        runner._instantiated_nodes = instantiated_nodes
+        runner._plans = {}
+        return runner
+
     @staticmethod
     def _instantiate_nodes(
         graph_schema: GraphSchema,
@@ -72,13 +147,23 @@ class DaskGraphRunner(GraphRunner):
         """
         run_graph = {
             node_name: (
-                self._instantiated_nodes[node_name],
+                self._node_callable(node_name, schema_node),
                 *schema_node.needs.values(),
             )
             for node_name, schema_node in schema.nodes.items()
         }
         return run_graph
 
+    def _node_callable(self, node_name: Text, schema_node: SchemaNode) -> Any:
+        node = self._instantiated_nodes[node_name]
+        if (
+            self._scheduler == SCHEDULER_THREADS
+            and not schema_node.uses.is_thread_safe()
+        ):
+            return _LockedGraphNode(node, self._thread_unsafe_lock)
+
+        return node
+
     def run(
         self,
         inputs: Optional[Dict[Text, Any]] = None,
@@ -86,23 +171,75 @@ class DaskGraphRunner(GraphRunner):
     ) -> Dict[Text, Any]:
         """Runs the graph (see parent class for full docstring)."""
         run_targets = targets if targets else self._graph_schema.target_names
-        minimal_schema = self._graph_schema.minimal_graph_schema(run_targets)
-        run_graph = self._build_dask_graph(minimal_schema)
+        plan = self._get_plan(run_targets)
+        run_graph = dict(plan.dask_graph)
 
         if inputs:
             self._add_inputs_to_graph(inputs, run_graph)
 
-        logger.debug(
-            f"Running graph with inputs: {inputs}, targets: {targets} "
-            f"and {self._execution_context}."
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Running graph with inputs: {inputs}, targets: {targets} "
+                f"and {self._execution_context}."
+            )
 
         try:
-            dask_result = dask.get(run_graph, run_targets)
+            if self._scheduler == SCHEDULER_THREADS:
+                dask_result = dask.threaded.get(
+                    run_graph, run_targets, num_workers=self._max_workers
+                )
+            else:
+                dask_result = self._run_plan(plan, run_graph, run_targets)
             return dict(dask_result)
         except RuntimeError as e:
             raise GraphRunError("Error running runner.") from e
 
+    def _get_plan(self, targets: List[Text]) -> _ExecutionPlan:
+        """Returns the cached execution plan for the targets or creates it."""
+        key = tuple(sorted(set(targets)))
+        plan = self._plans.get(key)
+        if plan is None:
+            minimal_schema = self._graph_schema.minimal_graph_schema(list(key))
+            plan = _ExecutionPlan.create(
+                minimal_schema, self._build_dask_graph(minimal_schema), key
+            )
+            self._plans[key] = plan
+
+        return plan
+
+    @staticmethod
+    def _run_plan(
+        plan: _ExecutionPlan, run_graph: Dict[Text, Any], targets: List[Text]
+    ) -> List[Tuple[Text, Any]]:
+        """Runs the nodes one after another in the order of the plan.
+
+        Behaves like `dask.get`: Node inputs which refer to other nodes or graph
+        inputs are replaced with their results, and all other inputs are passed as
+        they are.
+        """
+        # graph inputs are added as literals of the form `(input_name, input_value)`
+        results = {
+            name: task
+            for name, task in run_graph.items()
+            if name not in plan.dask_graph
+        }
+        durations = {}
+        start = time.perf_counter()
+
+        for node_name in plan.order:
+            node, *needs = run_graph[node_name]
+            node_start = time.perf_counter()
+            results[node_name] = node(*[results.get(need, need) for need in needs])
+            durations[node_name] = time.perf_counter() - node_start
+
+            for name in plan.releasable_results[node_name]:
+                results.pop(name, None)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            _log_durations(durations, time.perf_counter() - start)
+
+        return [results[target] for target in targets]
+
     @staticmethod
     def _add_inputs_to_graph(inputs: Optional[Dict[Text, Any]], graph: Any) -> None:
         if inputs is None:
@@ -116,3 +253,102 @@ class DaskGraphRunner(GraphRunner):
                     f"same as node names in the graph schema."
                 )
             graph[input_name] = (input_name, input_value)
+
+
+class _LockedGraphNode:
+    """Runs a graph node while holding a lock.
+
+    Nodes of components which are not thread-safe share the same lock so that they
+    never run at the same time.
+    """
+
+    def __init__(self, node: GraphNode, lock: threading.Lock) -> None:
+        self._node = node
+        self._lock = lock
+
+    def __call__(self, *inputs_from_previous_nodes: Any) -> Tuple[Text, Any]:
+        with self._lock:
+            return self._node(*inputs_from_previous_nodes)
+
+
+@dataclass
+class _ExecutionPlan:
+    """Everything needed to run the graph for a set of targets.
+
+    Plans are created once per set of targets and reused by all following runs.
+    """
+
+    # the dask graph without inputs
+    dask_graph: Dict[Text, Any]
+    # the node names in topological order
+    order: List[Text]
+    # results which aren't needed anymore once a node ran
+    releasable_results: Dict[Text, List[Text]]
+
+    @classmethod
+    def create(
+        cls,
+        minimal_schema: GraphSchema,
+        dask_graph: Dict[Text, Any],
+        targets: Tuple[Text, ...],
+    ) -> _ExecutionPlan:
+        order = _topological_order(minimal_schema)
+
+        last_consumers = {}
+        for node_name in order:
+            for need in minimal_schema.nodes[node_name].needs.values():
+                last_consumers[need] = node_name
+
+        releasable_results: Dict[Text, List[Text]] = {
+            node_name: [] for node_name in order
+        }
+        for name, last_consumer in last_consumers.items():
+            if name not in targets:
+                releasable_results[last_consumer].append(name)
+
+        return cls(dask_graph, order, releasable_results)
+
+
+def _topological_order(schema: GraphSchema) -> List[Text]:
+    remaining_dependencies = {
+        node_name: {need for need in node.needs.values() if need in schema.nodes}
+        for node_name, node in schema.nodes.items()
+    }
+    dependents: Dict[Text, List[Text]] = {node_name: [] for node_name in schema.nodes}
+    for node_name, dependencies in remaining_dependencies.items():
+        for dependency in dependencies:
+            dependents[dependency].append(node_name)
+
+    ready = [
+        node_name
+        for node_name, dependencies in remaining_dependencies.items()
+        if not dependencies
+    ]
+    order = []
+    while ready:
+        node_name = ready.pop(0)
+        order.append(node_name)
+        for dependent in dependents[node_name]:
+            remaining_dependencies[dependent].discard(node_name)
+            if not remaining_dependencies[dependent]:
+                ready.append(dependent)
+
+    if len(order) != len(schema.nodes):
+        raise GraphRunError("The graph contains a cycle and can't be run.")
+
+    return order
+
+
+def _log_durations(durations: Dict[Text, float], total_duration: float) -> None:
+    nodes_duration = sum(durations.values())
+    per_node = ", ".join(
+        f"{node_name}: {duration * 1000:.2f} ms"
+        for node_name, duration in sorted(
+            durations.items(), key=lambda item: item[1], reverse=True
+        )
+    )
+    logger.debug(
+        f"Ran graph in {total_duration * 1000:.2f} ms, of which the nodes took "
+        f"{nodes_duration * 1000:.2f} ms and the runner "
+        f"{(total_duration - nodes_duration) * 1000:.2f} ms ({per_node})."
+    )
@@ -47,3 +47,25 @@ class GraphRunner(ABC):
         Returns: A mapping of target node name to output value.
         """
         ...
+
+    def with_graph_schema(self, graph_schema: GraphSchema) -> GraphRunner:
+        """Creates a runner for a variant of the graph which shares its components.
+
+        The nodes of the variant may run different functions with different inputs,
+        but every node has to exist in the graph of this runner and use the same
+        component. This allows e.g. running batched versions of inference functions
+        without loading the components a second time.
+
+        Args:
+            graph_schema: The variant of the graph schema of this runner.
+
+        Returns:
+            A runner for the variant of the graph.
+
+        Raises:
+            NotImplementedError: If the runner doesn't support sharing its components.
+        """
+        raise NotImplementedError(
+            f"'{self.__class__.__name__}' doesn't support running variants of its "
+            f"graph."
+        )
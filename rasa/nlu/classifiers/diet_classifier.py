@@ -146,6 +146,13 @@ class DIETClassifier(GraphComponent, IntentClassifier, EntityExtractorMixin):
         """Components that should be included in the pipeline before this component."""
         return [Featurizer]
 
+    @staticmethod
+    def is_thread_safe() -> bool:
+        """Whether the component can run at the same time as other graph nodes."""
+        # the model sets the global `random`, `numpy` and `tensorflow` seeds which
+        # would make parallel training runs influence each other
+        return False
+
     @staticmethod
     def get_default_config() -> Dict[Text, Any]:
         """The component's default config (see parent class for full docstring)."""
@@ -971,6 +978,64 @@ class DIETClassifier(GraphComponent, IntentClassifier, EntityExtractorMixin):
             return None
         return self.model.run_inference(model_data)
 
+    def _predict_batch(
+        self, messages: List[Message]
+    ) -> List[Optional[Dict[Text, Union[tf.Tensor, Dict[Text, tf.Tensor]]]]]:
+        """Predicts all messages with a single run of the model.
+
+        Diagnostic data can't be split up per message. Messages are hence predicted
+        one by one if diagnostic data should be added to them.
+
+        Args:
+            messages: The messages which should be predicted.
+
+        Returns:
+            The model output for each message (`None` if the message wasn't
+            predicted).
+        """
+        if (
+            self.model is None
+            or len(messages) <= 1
+            or self._execution_context.should_add_diagnostic_data
+        ):
+            return [self._predict(message) for message in messages]
+
+        # messages without features are not included in the model data
+        featurized_indices = [
+            index
+            for index, message in enumerate(messages)
+            if message.features_present(
+                attribute=TEXT, featurizers=self.component_config.get(FEATURIZERS)
+            )
+        ]
+        outputs: List[Optional[Dict[Text, Any]]] = [None] * len(messages)
+        if not featurized_indices:
+            return outputs
+
+        model_data = self._create_model_data(
+            [messages[index] for index in featurized_indices], training=False
+        )
+        if model_data.is_empty():
+            return outputs
+
+        batch_out = self.model.run_inference(
+            model_data, batch_size=len(featurized_indices)
+        )
+        sequence_lengths = model_data.data[TEXT].get(SEQUENCE_LENGTH)
+
+        for row, index in enumerate(featurized_indices):
+            out: Dict[Text, Any] = {}
+            for key, value in batch_out.items():
+                if key == DIAGNOSTIC_DATA:
+                    continue
+                out[key] = value[row : row + 1]
+                if key.startswith("e_") and sequence_lengths:
+                    # remove the entity predictions for the padding of the batch
+                    out[key] = out[key][:, : sequence_lengths[0][row]]
+            outputs[index] = out
+
+        return outputs
+
     def _predict_label(
         self, predict_out: Optional[Dict[Text, tf.Tensor]]
     ) -> Tuple[Dict[Text, Any], List[Dict[Text, Any]]]:
@@ -1039,9 +1104,7 @@ class DIETClassifier(GraphComponent, IntentClassifier, EntityExtractorMixin):
 
     def process(self, messages: List[Message]) -> List[Message]:
         """Augments the message with intents, entities, and diagnostic data."""
-        for message in messages:
-            out = self._predict(message)
-
+        for message, out in zip(messages, self._predict_batch(messages)):
             if self.component_config[INTENT_CLASSIFICATION]:
                 label, label_ranking = self._predict_label(out)
 
@@ -73,5 +73,6 @@ RESPONSE_IDENTIFIER_DELIMITER = "/"
 DEFAULT_TRANSFORMER_SIZE = 256
 
 FEATURIZER_CLASS_ALIAS = "alias"
+FEATURIZER_CACHE_FEATURES = "cache_features"
 
 NO_LENGTH_RESTRICTION = -1
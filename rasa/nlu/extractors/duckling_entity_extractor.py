@@ -1,10 +1,13 @@
 from __future__ import annotations
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import time
 import json
 import logging
 import os
 import requests
-from typing import Any, List, Optional, Text, Dict
+from requests.adapters import HTTPAdapter
+from typing import Any, List, NamedTuple, Optional, Text, Dict, Tuple
 
 import rasa.utils.endpoints as endpoints_utils
 from rasa.engine.graph import GraphComponent, ExecutionContext
@@ -20,6 +23,8 @@ import rasa.shared.utils.io
 
 logger = logging.getLogger(__name__)
 
+DucklingCacheKey = Tuple[Text, Optional[Text], Optional[Text], Text, int]
+
 
 def extract_value(match: Dict[Text, Any]) -> Dict[Text, Any]:
     if match["value"].get("type") == "interval":
@@ -55,6 +60,11 @@ def convert_duckling_format_to_rasa(
     return extracted
 
 
+class _CachedMatches(NamedTuple):
+    matches: List[Dict[Text, Any]]
+    expires_at: float
+
+
 @DefaultV1Recipe.register(
     DefaultV1Recipe.ComponentType.ENTITY_EXTRACTOR, is_trainable=False
 )
@@ -80,6 +90,17 @@ class DucklingEntityExtractor(GraphComponent, EntityExtractorMixin):
             # duckling server. If not set the default timeout of duckling HTTP URL
             # is set to 3 seconds.
             "timeout": 3,
+            # maximum number of requests which are sent to the duckling server
+            # at the same time when processing multiple messages
+            "max_concurrent_requests": 8,
+            # number of duckling responses which are kept in memory,
+            # set to 0 to disable caching
+            "cache_size": 1000,
+            # time in seconds after which a cached response expires
+            "cache_ttl": 60,
+            # messages whose reference times are within the same interval of
+            # this many seconds share cached responses
+            "cache_reference_time_resolution": 1,
         }
 
     def __init__(self, config: Dict[Text, Any]) -> None:
@@ -90,6 +111,16 @@ class DucklingEntityExtractor(GraphComponent, EntityExtractorMixin):
         """
         self.component_config = config
 
+        # re-use connections to the duckling server across requests
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_maxsize=max(self.component_config["max_concurrent_requests"], 1)
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        self._cache: "OrderedDict[DucklingCacheKey, _CachedMatches]" = OrderedDict()
+
     @classmethod
     def create(
         cls,
@@ -118,7 +149,9 @@ class DucklingEntityExtractor(GraphComponent, EntityExtractorMixin):
             "reftime": reference_time,
         }
 
-    def _duckling_parse(self, text: Text, reference_time: int) -> List[Dict[Text, Any]]:
+    def _duckling_parse(
+        self, text: Text, reference_time: int
+    ) -> Optional[List[Dict[Text, Any]]]:
         """Sends the request to the duckling server and parses the result.
 
         Args:
@@ -126,7 +159,8 @@ class DucklingEntityExtractor(GraphComponent, EntityExtractorMixin):
             reference_time: Reference time in milliseconds.
 
         Returns:
-            JSON response from duckling server with parse data.
+            JSON response from duckling server with parse data. `None` if the request
+            failed.
         """
         parse_url = endpoints_utils.concat_url(self._url(), "/parse")
         try:
@@ -134,7 +168,7 @@ class DucklingEntityExtractor(GraphComponent, EntityExtractorMixin):
             headers = {
                 "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8"
             }
-            response = requests.post(
+            response = self._session.post(
                 parse_url,
                 data=payload,
                 headers=headers,
@@ -149,7 +183,7 @@ class DucklingEntityExtractor(GraphComponent, EntityExtractorMixin):
                     f"Status Code: {response.status_code}. "
                     f"Response: {response.text}"
                 )
-                return []
+                return None
         except (
             requests.exceptions.ConnectionError,
             requests.exceptions.ReadTimeout,
@@ -163,7 +197,99 @@ class DucklingEntityExtractor(GraphComponent, EntityExtractorMixin):
                 "https://github.com/facebook/duckling#quickstart "
                 "Error: {}".format(e)
             )
-            return []
+            return None
+
+    def _cache_key(self, text: Text, reference_time: int) -> DucklingCacheKey:
+        resolution = self.component_config["cache_reference_time_resolution"] * 1000
+        return (
+            text,
+            self.component_config["locale"],
+            self.component_config.get("timezone"),
+            json.dumps(self.component_config["dimensions"]),
+            int(reference_time // resolution) if resolution > 0 else reference_time,
+        )
+
+    def _cached_matches(self, key: DucklingCacheKey) -> Optional[List[Dict[Text, Any]]]:
+        cached = self._cache.get(key)
+        if cached is None:
+            return None
+
+        if cached.expires_at < time.time():
+            del self._cache[key]
+            return None
+
+        self._cache.move_to_end(key)
+        return cached.matches
+
+    def _add_to_cache(
+        self, key: DucklingCacheKey, matches: List[Dict[Text, Any]]
+    ) -> None:
+        self._cache[key] = _CachedMatches(
+            matches=matches,
+            expires_at=time.time() + self.component_config["cache_ttl"],
+        )
+        self._cache.move_to_end(key)
+
+        while len(self._cache) > self.component_config["cache_size"]:
+            self._cache.popitem(last=False)
+
+    def _duckling_parse_all(
+        self, texts_and_reference_times: List[Tuple[Text, int]]
+    ) -> List[List[Dict[Text, Any]]]:
+        """Parses multiple texts with concurrent requests to the duckling server.
+
+        Responses are served from the cache if possible. Every distinct text is only
+        sent once.
+
+        Args:
+            texts_and_reference_times: Texts to parse and their reference times in
+                milliseconds.
+
+        Returns:
+            The matches for every text in the same order.
+        """
+        use_cache = self.component_config["cache_size"] > 0
+        keys = [
+            self._cache_key(text, reference_time)
+            for text, reference_time in texts_and_reference_times
+        ]
+
+        matches_by_key: Dict[DucklingCacheKey, List[Dict[Text, Any]]] = {}
+        requests_by_key: Dict[DucklingCacheKey, Tuple[Text, int]] = {}
+        for key, text_and_reference_time in zip(keys, texts_and_reference_times):
+            cached = self._cached_matches(key) if use_cache else None
+            if cached is not None:
+                matches_by_key[key] = cached
+            else:
+                requests_by_key.setdefault(key, text_and_reference_time)
+
+        max_workers = min(
+            self.component_config["max_concurrent_requests"], len(requests_by_key)
+        )
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                responses = list(
+                    executor.map(
+                        lambda request: self._duckling_parse(*request),
+                        requests_by_key.values(),
+                    )
+                )
+        else:
+            responses = [
+                self._duckling_parse(*request) for request in requests_by_key.values()
+            ]
+
+        for key, response in zip(requests_by_key.keys(), responses):
+            if response is None:
+                # don't cache failed requests so that they are retried
+                matches_by_key[key] = []
+                continue
+
+            matches_by_key[key] = response
+            if use_cache:
+                self._add_to_cache(key, response)
+
+        return [matches_by_key[key] for key in keys]
 
     @staticmethod
     def _reference_time_from_message(message: Message) -> int:
@@ -192,9 +318,14 @@ class DucklingEntityExtractor(GraphComponent, EntityExtractorMixin):
             )
             return messages
 
-        for message in messages:
-            reference_time = self._reference_time_from_message(message)
-            matches = self._duckling_parse(message.get(TEXT), reference_time)
+        all_matches = self._duckling_parse_all(
+            [
+                (message.get(TEXT), self._reference_time_from_message(message))
+                for message in messages
+            ]
+        )
+
+        for message, matches in zip(messages, all_matches):
             all_extracted = convert_duckling_format_to_rasa(matches)
             dimensions = self.component_config["dimensions"]
             extracted = self.filter_irrelevant_entities(all_extracted, dimensions)
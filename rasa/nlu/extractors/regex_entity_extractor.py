@@ -1,6 +1,5 @@
 from __future__ import annotations
 import logging
-import re
 from typing import Any, Dict, List, Optional, Text
 
 from rasa.engine.graph import GraphComponent, ExecutionContext
@@ -92,6 +91,8 @@ class RegexEntityExtractor(GraphComponent, EntityExtractorMixin):
         # extractor
         self.case_sensitive = self._config["case_sensitive"]
         self.patterns = patterns or []
+        # compiled versions of `patterns`, created when they're first used
+        self._matchers: Optional[List[pattern_utils.PatternMatcher]] = None
 
     def train(self, training_data: TrainingData) -> Resource:
         """Extract patterns from the training data.
@@ -106,6 +107,7 @@ class RegexEntityExtractor(GraphComponent, EntityExtractorMixin):
             use_only_entities=True,
             use_word_boundaries=self._config["use_word_boundaries"],
         )
+        self._matchers = None
 
         if not self.patterns:
             rasa.shared.utils.io.raise_warning(
@@ -159,16 +161,8 @@ class RegexEntityExtractor(GraphComponent, EntityExtractorMixin):
         """
         entities = []
 
-        flags = 0  # default flag
-        if not self.case_sensitive:
-            flags = re.IGNORECASE
-
-        for pattern in self.patterns:
-            matches = re.finditer(pattern["pattern"], message.get(TEXT), flags=flags)
-
-            for match in matches:
-                start_index = match.start()
-                end_index = match.end()
+        for pattern, matcher in zip(self.patterns, self._pattern_matchers()):
+            for start_index, end_index in matcher.spans(message.get(TEXT)):
                 entities.append(
                     {
                         ENTITY_ATTRIBUTE_TYPE: pattern["name"],
@@ -182,6 +176,14 @@ class RegexEntityExtractor(GraphComponent, EntityExtractorMixin):
 
         return entities
 
+    def _pattern_matchers(self) -> List[pattern_utils.PatternMatcher]:
+        if self._matchers is None:
+            self._matchers = [
+                pattern_utils.PatternMatcher(pattern, self.case_sensitive)
+                for pattern in self.patterns
+            ]
+        return self._matchers
+
     @classmethod
     def load(
         cls,
@@ -2,7 +2,8 @@ from __future__ import annotations
 import numpy as np
 import logging
 
-from typing import Any, Text, List, Dict, Tuple, Type
+from collections import OrderedDict
+from typing import Any, Text, List, Dict, Optional, Tuple, Type
 import tensorflow as tf
 
 from rasa.engine.graph import ExecutionContext, GraphComponent
@@ -15,6 +16,7 @@ from rasa.shared.nlu.training_data.training_data import TrainingData
 from rasa.shared.nlu.training_data.message import Message
 from rasa.nlu.constants import (
     DENSE_FEATURIZABLE_ATTRIBUTES,
+    FEATURIZER_CACHE_FEATURES,
     SEQUENCE_FEATURES,
     SENTENCE_FEATURES,
     NO_LENGTH_RESTRICTION,
@@ -37,6 +39,9 @@ MAX_SEQUENCE_LENGTHS = {
     "camembert": 512,
 }
 
+# token ids of an example and number of sub-tokens of each of its tokens
+DocsCacheKey = Tuple[Tuple[int, ...], Tuple[int, ...]]
+
 
 @DefaultV1Recipe.register(
     DefaultV1Recipe.ComponentType.MESSAGE_FEATURIZER, is_trainable=False
@@ -66,6 +71,9 @@ class LanguageModelFeaturizer(DenseFeaturizer, GraphComponent):
         self._load_model_metadata()
         self._load_model_instance()
 
+        # language model docs of recently processed messages during inference
+        self._docs_cache: "OrderedDict[DocsCacheKey, Dict[Text, Any]]" = OrderedDict()
+
     @staticmethod
     def get_default_config() -> Dict[Text, Any]:
         """Returns LanguageModelFeaturizer's default config."""
@@ -78,6 +86,14 @@ class LanguageModelFeaturizer(DenseFeaturizer, GraphComponent):
             # an optional path to a specific directory to download
             # and cache the pre-trained model weights.
             "cache_dir": None,
+            # maximum number of messages which are fed to the language model at once
+            "batch_size": 64,
+            # number of recently processed messages for which the computed features
+            # are kept during inference, set to 0 to disable the cache
+            "cache_size": 1000,
+            # whether to reuse the features of training examples which didn't
+            # change since a previous training run
+            FEATURIZER_CACHE_FEATURES: True,
         }
 
     @classmethod
@@ -660,6 +676,8 @@ class LanguageModelFeaturizer(DenseFeaturizer, GraphComponent):
 
     def _get_docs_for_batch(
         self,
+        batch_token_ids: List[List[int]],
+        batch_tokens: List[List[Token]],
         batch_examples: List[Message],
         attribute: Text,
         inference_mode: bool = False,
@@ -667,20 +685,16 @@ class LanguageModelFeaturizer(DenseFeaturizer, GraphComponent):
         """Computes language model docs for all examples in the batch.
 
         Args:
-            batch_examples: Batch of message objects for which language model docs
-            need to be computed.
+            batch_token_ids: List of token ids of each example in the batch.
+            batch_tokens: List of token objects for each example in the batch.
+            batch_examples: List of examples in the batch.
             attribute: Property of message to be processed, one of ``TEXT`` or
             ``RESPONSE``.
             inference_mode: Whether the call is during inference or during training.
 
-
         Returns:
             List of language model docs for each message in batch.
         """
-        batch_tokens, batch_token_ids = self._get_token_ids_for_batch(
-            batch_examples, attribute
-        )
-
         (
             batch_sentence_features,
             batch_sequence_features,
@@ -700,62 +714,140 @@ class LanguageModelFeaturizer(DenseFeaturizer, GraphComponent):
 
         return batch_docs
 
-    def process_training_data(self, training_data: TrainingData) -> TrainingData:
-        """Computes tokens and dense features for each message in training data.
+    @staticmethod
+    def _docs_cache_key(tokens: List[Token], token_ids: List[int]) -> DocsCacheKey:
+        """Returns the key under which the doc of a tokenized example is cached.
+
+        The features only depend on the token ids which are fed to the language
+        model and on the number of sub-tokens per token, which is used to align the
+        features with the tokens.
 
         Args:
-            training_data: NLU training data to be tokenized and featurized
-            config: NLU pipeline config consisting of all components.
+            tokens: Token objects of the example.
+            token_ids: Token ids of the example.
+
+        Returns:
+            The cache key.
         """
-        batch_size = 64
+        return (
+            tuple(token_ids),
+            tuple(token.get(NUMBER_OF_SUB_TOKENS) for token in tokens),
+        )
 
-        for attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
+    def _add_doc_to_cache(self, key: DocsCacheKey, doc: Dict[Text, Any]) -> None:
+        self._docs_cache[key] = doc
+        self._docs_cache.move_to_end(key)
 
-            non_empty_examples = list(
-                filter(lambda x: x.get(attribute), training_data.training_examples)
-            )
+        while len(self._docs_cache) > self._config["cache_size"]:
+            self._docs_cache.popitem(last=False)
 
-            batch_start_index = 0
+    def _get_docs_for_examples(
+        self, examples: List[Message], attribute: Text, inference_mode: bool = False
+    ) -> List[Dict[Text, Any]]:
+        """Computes language model docs for any number of examples.
 
-            while batch_start_index < len(non_empty_examples):
+        The examples are sorted by their number of token ids and split into batches
+        of at most `batch_size` examples, so that every batch needs as little
+        padding as possible. Examples with the same token ids are only fed to the
+        language model once. During inference, docs are taken from and added to the
+        cache of recently processed examples.
 
-                batch_end_index = min(
-                    batch_start_index + batch_size, len(non_empty_examples)
-                )
-                # Collect batch examples
-                batch_messages = non_empty_examples[batch_start_index:batch_end_index]
+        Args:
+            examples: Message objects for which language model docs need to be
+            computed.
+            attribute: Property of message to be processed, one of ``TEXT`` or
+            ``RESPONSE``.
+            inference_mode: Whether the call is during inference or during training.
+
+        Returns:
+            List of language model docs for each example.
+        """
+        all_tokens, all_token_ids = self._get_token_ids_for_batch(examples, attribute)
+        # the keys are computed upfront as the token ids are modified in-place when
+        # the special tokens of the language model are added
+        keys = [
+            self._docs_cache_key(tokens, token_ids)
+            for tokens, token_ids in zip(all_tokens, all_token_ids)
+        ]
+        use_cache = inference_mode and self._config["cache_size"] > 0
+
+        docs: List[Optional[Dict[Text, Any]]] = [None] * len(examples)
+        # indices of the examples which need to be fed to the model by cache key
+        pending: Dict[DocsCacheKey, List[int]] = {}
+
+        for index, key in enumerate(keys):
+            if use_cache and key in self._docs_cache:
+                self._docs_cache.move_to_end(key)
+                docs[index] = self._docs_cache[key]
+            else:
+                pending.setdefault(key, []).append(index)
+
+        # bucket examples of similar length together
+        unique_indices = sorted(
+            (indices[0] for indices in pending.values()),
+            key=lambda index: len(all_token_ids[index]),
+        )
+        batch_size = self._config["batch_size"]
+
+        for batch_start in range(0, len(unique_indices), batch_size):
+            batch_indices = unique_indices[batch_start : batch_start + batch_size]
+            batch_docs = self._get_docs_for_batch(
+                [all_token_ids[index] for index in batch_indices],
+                [all_tokens[index] for index in batch_indices],
+                [examples[index] for index in batch_indices],
+                attribute,
+                inference_mode,
+            )
 
-                # Construct a doc with relevant features
-                # extracted(tokens, dense_features)
-                batch_docs = self._get_docs_for_batch(batch_messages, attribute)
+            for index, doc in zip(batch_indices, batch_docs):
+                for example_index in pending[keys[index]]:
+                    docs[example_index] = doc
+                if use_cache:
+                    self._add_doc_to_cache(keys[index], doc)
 
-                for index, ex in enumerate(batch_messages):
-                    self._set_lm_features(batch_docs[index], ex, attribute)
-                batch_start_index += batch_size
+        return docs
 
+    def process_training_data(self, training_data: TrainingData) -> TrainingData:
+        """Computes tokens and dense features for each message in training data.
+
+        Args:
+            training_data: NLU training data to be tokenized and featurized
+            config: NLU pipeline config consisting of all components.
+        """
+        self.featurize_training_examples_with_cache(
+            training_data.training_examples, self._featurize_training_examples
+        )
         return training_data
 
+    def _featurize_training_examples(self, examples: List[Message]) -> None:
+        for attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
+
+            non_empty_examples = list(filter(lambda x: x.get(attribute), examples))
+
+            # Construct a doc with relevant features
+            # extracted(tokens, dense_features)
+            docs = self._get_docs_for_examples(non_empty_examples, attribute)
+
+            for doc, ex in zip(docs, non_empty_examples):
+                self._set_lm_features(doc, ex, attribute)
+
     def process(self, messages: List[Message]) -> List[Message]:
         """Processes messages by computing tokens and dense features."""
-        for message in messages:
-            self._process_message(message)
-        return messages
-
-    def _process_message(self, message: Message) -> Message:
-        """Processes a message by computing tokens and dense features."""
         # processing featurizers operates only on TEXT and ACTION_TEXT attributes,
         # because all other attributes are labels which are featurized during
         # training and their features are stored by the model itself.
-        for attribute in {TEXT, ACTION_TEXT}:
-            if message.get(attribute):
-                self._set_lm_features(
-                    self._get_docs_for_batch(
-                        [message], attribute=attribute, inference_mode=True
-                    )[0],
-                    message,
-                    attribute,
-                )
-        return message
+        for attribute in [TEXT, ACTION_TEXT]:
+            non_empty_messages = [
+                message for message in messages if message.get(attribute)
+            ]
+            docs = self._get_docs_for_examples(
+                non_empty_messages, attribute, inference_mode=True
+            )
+
+            for doc, message in zip(docs, non_empty_messages):
+                self._set_lm_features(doc, message, attribute)
+
+        return messages
 
     def _set_lm_features(
         self, doc: Dict[Text, Any], message: Message, attribute: Text = TEXT
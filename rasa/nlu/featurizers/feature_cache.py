@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import io
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Text
+
+import numpy as np
+import scipy.sparse
+import sqlalchemy as sa
+import sqlalchemy.orm
+from sqlalchemy.engine import URL
+from sqlalchemy.ext.declarative import declarative_base, DeclarativeMeta
+
+from rasa.engine.caching import (
+    CACHE_SIZE_ENV,
+    DEFAULT_CACHE_SIZE_MB,
+    FEATURE_CACHE_NAME,
+    LocalTrainingCache,
+)
+from rasa.shared.nlu.training_data.features import Features
+
+logger = logging.getLogger(__name__)
+
+FEATURE_CACHE_SIZE_ENV = "RASA_MAX_FEATURE_CACHE_SIZE"
+DEFAULT_FEATURE_CACHE_SIZE_MB = 1000
+
+# SQLite limits the number of parameters of a single statement
+MAX_KEYS_PER_QUERY = 500
+
+METADATA_KEY = "metadata"
+
+# featurizers which run in parallel threads may write to the cache at the same time
+_write_lock = threading.Lock()
+
+
+class FeatureCache:
+    """Stores the features which featurizers computed for single training examples.
+
+    The features are stored in a SQLite database in the directory of the
+    `LocalTrainingCache`. If the training data changes only slightly in between
+    training runs, featurizers can take the features of the unchanged examples from
+    the cache instead of computing them again. The size of the cache is limited by
+    the environment variable `RASA_MAX_FEATURE_CACHE_SIZE` (in MB). The least
+    recently used entries are dropped if the cache exceeds this size. The database
+    doesn't count towards the size limit of the `LocalTrainingCache`. The cache is
+    disabled if either this limit or the size limit of the `LocalTrainingCache` is
+    `0`.
+    """
+
+    Base: DeclarativeMeta = declarative_base()
+
+    class CacheEntry(Base):
+        """Stores the features of a single training example."""
+
+        __tablename__ = "feature_cache_entry"
+
+        key = sa.Column(sa.String(), primary_key=True)
+        features = sa.Column(sa.LargeBinary(), nullable=False)
+        size = sa.Column(sa.Integer(), nullable=False)
+        last_used = sa.Column(sa.DateTime(timezone=True), nullable=False, index=True)
+
+    def __init__(self) -> None:
+        """Creates the cache.
+
+        The cache can be configured via environment variables.
+        """
+        self._cache_location = LocalTrainingCache._get_cache_location()
+        self._max_cache_size = min(
+            float(os.environ.get(CACHE_SIZE_ENV, DEFAULT_CACHE_SIZE_MB)),
+            float(
+                os.environ.get(FEATURE_CACHE_SIZE_ENV, DEFAULT_FEATURE_CACHE_SIZE_MB)
+            ),
+        )
+
+        if not self._cache_location.exists() and not self.is_disabled():
+            self._cache_location.mkdir(parents=True)
+
+        self._engine = self._create_database()
+        self._sessionmaker = sa.orm.sessionmaker(self._engine)
+
+    def is_disabled(self) -> bool:
+        """Returns whether caching features is disabled."""
+        return self._max_cache_size == 0.0
+
+    def _create_database(self) -> sa.engine.Engine:
+        if self.is_disabled():
+            # Use in-memory database as mock to avoid having to check `is_disabled`
+            # everywhere
+            database = ""
+        else:
+            database = str(self._cache_location / FEATURE_CACHE_NAME)
+
+        # Use `future=True` as we are using the 2.x query style
+        engine = sa.create_engine(
+            URL.create(drivername="sqlite", database=database), future=True
+        )
+        self.Base.metadata.create_all(engine)
+
+        return engine
+
+    def get_cached_features(self, keys: List[Text]) -> Dict[Text, List[Features]]:
+        """Retrieves the cached features for the given keys.
+
+        Args:
+            keys: The keys of the training examples.
+
+        Returns:
+            The cached features by key. Keys without cached features are omitted.
+        """
+        if self.is_disabled():
+            return {}
+
+        cached_features = {}
+        now = datetime.utcnow()
+        with self._sessionmaker.begin() as session:
+            for chunk in _chunks(list(set(keys))):
+                query = sa.select(self.CacheEntry.key, self.CacheEntry.features).where(
+                    self.CacheEntry.key.in_(chunk)
+                )
+                for key, serialized in session.execute(query):
+                    try:
+                        cached_features[key] = _deserialize_features(serialized)
+                    except Exception as e:
+                        # treat unreadable entries as missing, they are replaced
+                        # when the features are cached again
+                        logger.debug(f"Failed to load cached features: {e}")
+
+                session.execute(
+                    sa.update(self.CacheEntry)
+                    .where(self.CacheEntry.key.in_(chunk))
+                    .values(last_used=now)
+                )
+
+        return cached_features
+
+    def cache_features(self, features_by_key: Dict[Text, List[Features]]) -> None:
+        """Adds the features of training examples to the cache.
+
+        Args:
+            features_by_key: The features which a featurizer added to the training
+                examples by the keys of the examples.
+        """
+        if self.is_disabled() or not features_by_key:
+            return
+
+        now = datetime.utcnow()
+        entries = []
+        for key, features in features_by_key.items():
+            serialized = _serialize_features(features)
+            entries.append(
+                {
+                    "key": key,
+                    "features": serialized,
+                    "size": len(serialized),
+                    "last_used": now,
+                }
+            )
+
+        with _write_lock:
+            with self._sessionmaker.begin() as session:
+                for chunk in _chunks(entries):
+                    session.execute(
+                        sa.delete(self.CacheEntry).where(
+                            self.CacheEntry.key.in_([entry["key"] for entry in chunk])
+                        )
+                    )
+                    session.execute(sa.insert(self.CacheEntry), chunk)
+
+            self._drop_least_recently_used_entries()
+
+    def _drop_least_recently_used_entries(self) -> None:
+        max_size_in_bytes = self._max_cache_size * 1e6
+        with self._sessionmaker.begin() as session:
+            cache_size = session.execute(
+                sa.select(sa.func.sum(self.CacheEntry.size))
+            ).scalar()
+            if not cache_size or cache_size <= max_size_in_bytes:
+                return
+
+            query = sa.select(self.CacheEntry.key, self.CacheEntry.size).order_by(
+                self.CacheEntry.last_used.asc()
+            )
+            keys_to_drop = []
+            for key, size in session.execute(query).all():
+                if cache_size <= max_size_in_bytes:
+                    break
+                keys_to_drop.append(key)
+                cache_size -= size
+
+            for chunk in _chunks(keys_to_drop):
+                session.execute(
+                    sa.delete(self.CacheEntry).where(self.CacheEntry.key.in_(chunk))
+                )
+
+        logger.debug(f"Dropped {len(keys_to_drop)} features from the cache.")
+        self._vacuum()
+
+    def _vacuum(self) -> None:
+        # SQLite doesn't shrink the database file when entries are deleted
+        try:
+            with self._engine.connect().execution_options(
+                isolation_level="AUTOCOMMIT"
+            ) as connection:
+                connection.exec_driver_sql("VACUUM")
+        except sa.exc.OperationalError as e:
+            # e.g. if another process reads from the cache at the same time
+            logger.debug(f"Failed to shrink the feature cache: {e}")
+
+
+def _chunks(items: List[Any]) -> Iterator[List[Any]]:
+    for start in range(0, len(items), MAX_KEYS_PER_QUERY):
+        yield items[start : start + MAX_KEYS_PER_QUERY]
+
+
+def _serialize_features(features: List[Features]) -> bytes:
+    """Converts features to bytes without using `pickle`.
+
+    Sparse matrices are stored in COO format and converted back to their original
+    format when loading them.
+    """
+    metadata = []
+    arrays = {}
+    for index, feature in enumerate(features):
+        metadata.append(
+            {
+                "type": feature.type,
+                "attribute": feature.attribute,
+                "origin": feature.origin,
+                "format": feature.features.format if feature.is_sparse() else None,
+                "shape": list(feature.features.shape),
+            }
+        )
+        if feature.is_sparse():
+            matrix = feature.features.tocoo()
+            arrays[f"{index}_data"] = matrix.data
+            arrays[f"{index}_row"] = matrix.row
+            arrays[f"{index}_col"] = matrix.col
+        else:
+            arrays[f"{index}_data"] = feature.features
+
+    buffer = io.BytesIO()
+    np.savez(buffer, **{METADATA_KEY: np.array(json.dumps(metadata))}, **arrays)
+    return buffer.getvalue()
+
+
+def _deserialize_features(serialized: bytes) -> List[Features]:
+    features = []
+    with np.load(io.BytesIO(serialized), allow_pickle=False) as arrays:
+        metadata = json.loads(str(arrays[METADATA_KEY]))
+        for index, feature_metadata in enumerate(metadata):
+            data = arrays[f"{index}_data"]
+            if feature_metadata["format"]:
+                matrix = scipy.sparse.coo_matrix(
+                    (data, (arrays[f"{index}_row"], arrays[f"{index}_col"])),
+                    shape=tuple(feature_metadata["shape"]),
+                ).asformat(feature_metadata["format"])
+            else:
+                matrix = data
+
+            features.append(
+                Features(
+                    matrix,
+                    feature_metadata["type"],
+                    feature_metadata["attribute"],
+                    feature_metadata["origin"],
+                )
+            )
+
+    return features
+
@@ -1,9 +1,21 @@
 from __future__ import annotations
 from abc import abstractmethod, ABC
 from collections import Counter
-from typing import Generic, Iterable, Text, Optional, Dict, Any, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Text,
+    TypeVar,
+)
 
-from rasa.nlu.constants import FEATURIZER_CLASS_ALIAS
+import rasa.shared.utils.io
+from rasa.nlu.constants import FEATURIZER_CACHE_FEATURES, FEATURIZER_CLASS_ALIAS
+from rasa.nlu.featurizers.feature_cache import FeatureCache
 from rasa.shared.nlu.training_data.features import Features
 from rasa.shared.nlu.training_data.message import Message
 from rasa.shared.exceptions import InvalidConfigException
@@ -62,6 +74,70 @@ class Featurizer(Generic[FeatureType], ABC):
                 wrapped_feature = Features(features, type, attribute, self._identifier)
                 message.add_features(wrapped_feature)
 
+    def featurize_training_examples_with_cache(
+        self,
+        messages: List[Message],
+        featurize: Callable[[List[Message]], Any],
+        trained_state: Any = None,
+        restore_from_cache: Optional[Callable[[Message, List[Features]], Any]] = None,
+    ) -> None:
+        """Featurizes training examples and reuses features from previous runs.
+
+        Features which this featurizer computed for unchanged training examples in
+        previous training runs are taken from the `FeatureCache`. Only the remaining
+        examples are featurized, and their features are added to the cache. Caching
+        is skipped if the `cache_features` option of the featurizer is disabled.
+
+        Args:
+          messages: the training examples which are featurized in-place
+          featurize: adds the features of this featurizer to the given messages
+          trained_state: anything which the featurizer learned during training and
+            which influences the features, e.g. a vocabulary
+          restore_from_cache: applies any changes besides adding features which
+            `featurize` makes to a message, given the cached features of the message
+        """
+        if not self._config.get(FEATURIZER_CACHE_FEATURES):
+            featurize(messages)
+            return
+
+        cache = FeatureCache()
+        if cache.is_disabled():
+            featurize(messages)
+            return
+
+        component_fingerprint = rasa.shared.utils.io.deep_container_fingerprint(
+            [self.__class__.__name__, self._identifier, self._config, trained_state]
+        )
+        # the features of other featurizers are not part of the key as featurizers
+        # only depend on the message data, e.g. the text and its tokens
+        keys = [
+            component_fingerprint
+            + rasa.shared.utils.io.deep_container_fingerprint(message.data)
+            for message in messages
+        ]
+        cached_features = cache.get_cached_features(keys)
+
+        missing = []
+        for message, key in zip(messages, keys):
+            if key in cached_features:
+                for features in cached_features[key]:
+                    message.add_features(features)
+                if restore_from_cache:
+                    restore_from_cache(message, cached_features[key])
+            else:
+                missing.append((message, key, len(message.features)))
+
+        if not missing:
+            return
+
+        featurize([message for message, _, _ in missing])
+        cache.cache_features(
+            {
+                key: message.features[number_of_features_before:]
+                for message, key, number_of_features_before in missing
+            }
+        )
+
     @staticmethod
     def raise_if_featurizer_configs_are_not_compatible(
         featurizer_configs: Iterable[Dict[Text, Any]]
@@ -22,6 +22,7 @@ from rasa.nlu.constants import (
     TOKENS_NAMES,
     MESSAGE_ATTRIBUTES,
     DENSE_FEATURIZABLE_ATTRIBUTES,
+    FEATURIZER_CACHE_FEATURES,
 )
 from rasa.shared.nlu.constants import TEXT, INTENT, INTENT_RESPONSE_KEY, ACTION_NAME
 
@@ -56,6 +57,9 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
         """Returns the component's default config."""
         return {
             **SparseFeaturizer.get_default_config(),
+            # whether to reuse the features of training examples which didn't
+            # change since a previous training run
+            FEATURIZER_CACHE_FEATURES: True,
             # whether to use a shared vocab
             "use_shared_vocab": False,
             # the parameters are taken from
@@ -269,11 +273,7 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
             attribute_vocab = self._get_attribute_vocabulary(attribute)
             if attribute_vocab is not None and self.OOV_token in attribute_vocab:
                 # CountVectorizer is trained, process for prediction
-                attribute_vocabulary_tokens = set(attribute_vocab.keys())
-                tokens = [
-                    t if t in attribute_vocabulary_tokens else self.OOV_token
-                    for t in tokens
-                ]
+                tokens = [t if t in attribute_vocab else self.OOV_token for t in tokens]
             elif self.OOV_words:
                 # CountVectorizer is not trained, process for train
                 tokens = [self.OOV_token if t in self.OOV_words else t for t in tokens]
@@ -546,42 +546,58 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
     ) -> Tuple[
         List[Optional[scipy.sparse.spmatrix]], List[Optional[scipy.sparse.spmatrix]]
     ]:
-        if not self.vectorizers.get(attribute):
-            return [None], [None]
+        """Creates the features of an attribute for a batch of messages.
 
-        sequence_features: List[Optional[scipy.sparse.spmatrix]] = []
-        sentence_features: List[Optional[scipy.sparse.spmatrix]] = []
+        All tokens of the batch are transformed by a single call to the vectorizer.
+        The resulting sparse matrix is then sliced into the features of the
+        individual messages.
 
-        for i, tokens in enumerate(all_tokens):
-            if not tokens:
-                # nothing to featurize
-                sequence_features.append(None)
-                sentence_features.append(None)
-                continue
+        Args:
+            attribute: the attribute which is featurized
+            all_tokens: the processed tokens of each message
 
-            # vectorizer.transform returns a sparse matrix of size
-            # [n_samples, n_features]
-            # set input to list of tokens if sequence should be returned
-            # otherwise join all tokens to a single string and pass that as a list
-            if not tokens:
-                # attribute is not set (e.g. response not present)
-                sequence_features.append(None)
-                sentence_features.append(None)
-                continue
+        Returns:
+            sequence and sentence features for each message (`None` if the
+            message has no tokens for the attribute)
+        """
+        if not self.vectorizers.get(attribute):
+            return [None] * len(all_tokens), [None] * len(all_tokens)
 
-            seq_vec = self.vectorizers[attribute].transform(tokens)
-            seq_vec.sort_indices()
+        sequence_features: List[Optional[scipy.sparse.spmatrix]] = [None] * len(
+            all_tokens
+        )
+        sentence_features: List[Optional[scipy.sparse.spmatrix]] = [None] * len(
+            all_tokens
+        )
 
-            sequence_features.append(seq_vec.tocoo())
+        # messages without tokens (e.g. response not present) have nothing to
+        # featurize
+        non_empty_indices = [i for i, tokens in enumerate(all_tokens) if tokens]
+        if not non_empty_indices:
+            return sequence_features, sentence_features
 
-            if attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
-                tokens_text = [" ".join(tokens)]
-                sentence_vec = self.vectorizers[attribute].transform(tokens_text)
-                sentence_vec.sort_indices()
+        # vectorizer.transform returns a sparse matrix of size
+        # [n_samples, n_features]; every token of every message is one sample
+        batch_tokens = [token for i in non_empty_indices for token in all_tokens[i]]
+        seq_vecs = self.vectorizers[attribute].transform(batch_tokens).tocsr()
+        seq_vecs.sort_indices()
 
-                sentence_features.append(sentence_vec.tocoo())
-            else:
-                sentence_features.append(None)
+        sentence_vecs = None
+        if attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
+            # join all tokens of a message to a single string to get one
+            # sentence sample per message
+            tokens_texts = [" ".join(all_tokens[i]) for i in non_empty_indices]
+            sentence_vecs = self.vectorizers[attribute].transform(tokens_texts).tocsr()
+            sentence_vecs.sort_indices()
+
+        offset = 0
+        for row, i in enumerate(non_empty_indices):
+            end = offset + len(all_tokens[i])
+            sequence_features[i] = seq_vecs[offset:end].tocoo()
+            offset = end
+
+            if sentence_vecs is not None:
+                sentence_features[i] = sentence_vecs[row : row + 1].tocoo()
 
         return sequence_features, sentence_features
 
@@ -640,7 +656,11 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
         Returns:
           same training data after processing
         """
-        self.process(training_data.training_examples)
+        self.featurize_training_examples_with_cache(
+            training_data.training_examples,
+            self.process,
+            trained_state=self._collect_vectorizer_vocabularies(),
+        )
         return training_data
 
     def process(self, messages: List[Message]) -> List[Message]:
@@ -653,20 +673,20 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
             )
             return messages
 
-        for message in messages:
-            for attribute in self._attributes:
-
-                message_tokens = self._get_processed_message_tokens_by_attribute(
-                    message, attribute
-                )
+        for attribute in self._attributes:
+            all_tokens = [
+                self._get_processed_message_tokens_by_attribute(message, attribute)
+                for message in messages
+            ]
 
-                # features shape (1, seq, dim)
-                sequence_features, sentence_features = self._create_features(
-                    attribute, [message_tokens]
-                )
-                self.add_features_to_message(
-                    sequence_features[0], sentence_features[0], attribute, message
-                )
+            # features shape (seq, dim) and (1, dim) per message
+            sequence_features, sentence_features = self._create_features(
+                attribute, all_tokens
+            )
+            for message, sequence, sentence in zip(
+                messages, sequence_features, sentence_features
+            ):
+                self.add_features_to_message(sequence, sentence, attribute, message)
 
         return messages
 
@@ -24,7 +24,7 @@ from rasa.engine.storage.storage import ModelStorage
 from rasa.nlu.tokenizers.spacy_tokenizer import POS_TAG_KEY, SpacyTokenizer
 from rasa.nlu.tokenizers.tokenizer import Token, Tokenizer
 from rasa.nlu.featurizers.sparse_featurizer.sparse_featurizer import SparseFeaturizer
-from rasa.nlu.constants import TOKENS_NAMES
+from rasa.nlu.constants import FEATURIZER_CACHE_FEATURES, TOKENS_NAMES
 from rasa.shared.constants import DOCS_URL_COMPONENTS
 from rasa.shared.nlu.training_data.training_data import TrainingData
 from rasa.shared.nlu.training_data.message import Message
@@ -134,6 +134,9 @@ class LexicalSyntacticFeaturizer(SparseFeaturizer, GraphComponent):
         """Returns the component's default config."""
         return {
             **SparseFeaturizer.get_default_config(),
+            # whether to reuse the features of training examples which didn't
+            # change since a previous training run
+            FEATURIZER_CACHE_FEATURES: True,
             FEATURES: [
                 ["low", "title", "upper"],
                 ["BOS", "EOS", "low", "upper", "title", "digit"],
@@ -416,7 +419,11 @@ class LexicalSyntacticFeaturizer(SparseFeaturizer, GraphComponent):
         Returns:
           same training data after processing
         """
-        self.process(training_data.training_examples)
+        self.featurize_training_examples_with_cache(
+            training_data.training_examples,
+            self.process,
+            trained_state=self._feature_to_idx_dict,
+        )
         return training_data
 
     def _process_message(self, message: Message) -> None:
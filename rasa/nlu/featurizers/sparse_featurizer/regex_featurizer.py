@@ -1,6 +1,6 @@
 from __future__ import annotations
+import bisect
 import logging
-import re
 from typing import Any, Dict, List, Optional, Text, Tuple, Type
 import numpy as np
 import scipy.sparse
@@ -13,9 +13,15 @@ from rasa.engine.graph import ExecutionContext, GraphComponent
 from rasa.engine.recipes.default_recipe import DefaultV1Recipe
 from rasa.engine.storage.resource import Resource
 from rasa.engine.storage.storage import ModelStorage
-from rasa.nlu.constants import TOKENS_NAMES
+from rasa.nlu.constants import FEATURIZER_CACHE_FEATURES, TOKENS_NAMES
 from rasa.nlu.featurizers.sparse_featurizer.sparse_featurizer import SparseFeaturizer
-from rasa.shared.nlu.constants import TEXT, RESPONSE, ACTION_TEXT
+from rasa.shared.nlu.constants import (
+    ACTION_TEXT,
+    FEATURE_TYPE_SEQUENCE,
+    RESPONSE,
+    TEXT,
+)
+from rasa.shared.nlu.training_data.features import Features
 from rasa.shared.nlu.training_data.training_data import TrainingData
 from rasa.shared.nlu.training_data.message import Message
 
@@ -38,6 +44,9 @@ class RegexFeaturizer(SparseFeaturizer, GraphComponent):
         """Returns the component's default config."""
         return {
             **SparseFeaturizer.get_default_config(),
+            # whether to reuse the features of training examples which didn't
+            # change since a previous training run
+            FEATURIZER_CACHE_FEATURES: True,
             # text will be processed with case sensitive as default
             "case_sensitive": True,
             # use lookup tables to generate features
@@ -75,6 +84,7 @@ class RegexFeaturizer(SparseFeaturizer, GraphComponent):
         self.known_patterns = known_patterns if known_patterns else []
         self.case_sensitive = config["case_sensitive"]
         self.finetune_mode = execution_context.is_finetuning
+        self._compile_patterns()
 
     @classmethod
     def create(
@@ -106,9 +116,9 @@ class RegexFeaturizer(SparseFeaturizer, GraphComponent):
             # Some patterns may have just new examples added
             # to them. These do not count as additional pattern.
             if new_pattern_name in pattern_name_index_map:
-                self.known_patterns[pattern_name_index_map[new_pattern_name]][
-                    "pattern"
-                ] = extra_pattern["pattern"]
+                self.known_patterns[
+                    pattern_name_index_map[new_pattern_name]
+                ] = extra_pattern
             else:
                 self.known_patterns.append(extra_pattern)
 
@@ -125,37 +135,79 @@ class RegexFeaturizer(SparseFeaturizer, GraphComponent):
             self._merge_new_patterns(patterns_from_data)
         else:
             self.known_patterns = patterns_from_data
+        self._compile_patterns()
 
         self._persist()
         return self._resource
 
     def process_training_data(self, training_data: TrainingData) -> TrainingData:
         """Processes the training examples (see parent class for full docstring)."""
-        for example in training_data.training_examples:
-            for attribute in [TEXT, RESPONSE, ACTION_TEXT]:
-                self._text_features_with_regex(example, attribute)
-
+        self.featurize_training_examples_with_cache(
+            training_data.training_examples,
+            self._featurize_training_examples,
+            trained_state=self.known_patterns,
+            restore_from_cache=self._set_token_patterns_from_features,
+        )
         return training_data
 
+    def _compile_patterns(self) -> None:
+        """Compiles the known patterns once so that every message reuses them."""
+        self._matchers = [
+            pattern_utils.PatternMatcher(pattern, self.case_sensitive)
+            for pattern in self.known_patterns
+        ]
+        self._pattern_names = [pattern["name"] for pattern in self.known_patterns]
+
+    def _featurize_training_examples(self, examples: List[Message]) -> None:
+        for attribute in [TEXT, RESPONSE, ACTION_TEXT]:
+            self._text_features_with_regex(examples, attribute)
+
     def process(self, messages: List[Message]) -> List[Message]:
         """Featurizes all given messages in-place.
 
         Returns:
           the given list of messages which have been modified in-place
         """
-        for message in messages:
-            self._text_features_with_regex(message, TEXT)
+        self._text_features_with_regex(messages, TEXT)
 
         return messages
 
-    def _text_features_with_regex(self, message: Message, attribute: Text) -> None:
-        """Helper method to extract features and set them appropriately in the message.
+    def _set_token_patterns_from_features(
+        self, message: Message, features: List[Features]
+    ) -> None:
+        """Marks the tokens with the patterns they match given their features.
+
+        This has the same effect on the tokens as `_features_for_patterns`.
 
         Args:
-            message: Message to be featurized.
-            attribute: Attribute of message to be featurized.
+            message: Message whose features were taken from the cache.
+            features: The features which this component added to the message.
+        """
+        for feature in features:
+            if feature.type != FEATURE_TYPE_SEQUENCE:
+                continue
+
+            matched = feature.features.toarray() != 0
+            tokens = message.get(TOKENS_NAMES[feature.attribute], [])
+            for t, token_matches in zip(tokens, matched):
+                patterns = t.get("pattern", default={})
+                for pattern, is_match in zip(self.known_patterns, token_matches):
+                    patterns[pattern["name"]] = bool(is_match)
+                t.set("pattern", patterns)
+
+    def _text_features_with_regex(
+        self, messages: List[Message], attribute: Text
+    ) -> None:
+        """Helper method to extract features and set them appropriately in messages.
+
+        Args:
+            messages: Messages to be featurized.
+            attribute: Attribute of the messages to be featurized.
         """
-        if self.known_patterns:
+        if not self.known_patterns:
+            return
+
+        for message in messages:
             sequence_features, sentence_features = self._features_for_patterns(
                 message, attribute
             )
@@ -191,41 +243,64 @@ class RegexFeaturizer(SparseFeaturizer, GraphComponent):
             # nothing to featurize
             return None, None
 
-        flags = 0  # default flag
-        if not self.case_sensitive:
-            flags = re.IGNORECASE
-
-        sequence_length = len(tokens)
-
         num_patterns = len(self.known_patterns)
+        token_starts = [t.start for t in tokens]
+        token_ends = [t.end for t in tokens]
+        # `bisect` needs the tokens in order, which is what the tokenizers produce
+        tokens_are_sorted = _is_sorted(token_starts) and _is_sorted(token_ends)
+
+        matched_tokens_by_pattern = []
+        for matcher in self._matchers:
+            matched_tokens = set()
+            for match_start, match_end in matcher.spans(message.get(attribute)):
+                if tokens_are_sorted:
+                    # the tokens which overlap with the match
+                    matched_tokens.update(
+                        range(
+                            bisect.bisect_right(token_ends, match_start),
+                            bisect.bisect_left(token_starts, match_end),
+                        )
+                    )
+                else:
+                    matched_tokens.update(
+                        token_index
+                        for token_index, t in enumerate(tokens)
+                        if t.start < match_end and t.end > match_start
+                    )
+            matched_tokens_by_pattern.append(matched_tokens)
+
+        for token_index, t in enumerate(tokens):
+            patterns = t.get("pattern", default={})
+            for name, matched_tokens in zip(
+                self._pattern_names, matched_tokens_by_pattern
+            ):
+                patterns[name] = token_index in matched_tokens
+            t.set("pattern", patterns)
+
+        rows = []
+        columns = []
+        for pattern_index, matched_tokens in enumerate(matched_tokens_by_pattern):
+            rows.extend(sorted(matched_tokens))
+            columns.extend([pattern_index] * len(matched_tokens))
+
+        sequence_features = scipy.sparse.coo_matrix(
+            (np.ones(len(rows)), (rows, columns)), shape=(len(tokens), num_patterns)
+        )
 
-        sequence_features = np.zeros([sequence_length, num_patterns])
-        sentence_features = np.zeros([1, num_patterns])
-
-        for pattern_index, pattern in enumerate(self.known_patterns):
-            matches = list(
-                re.finditer(pattern["pattern"], message.get(attribute), flags=flags)
-            )
-
-            for token_index, t in enumerate(tokens):
-                patterns = t.get("pattern", default={})
-                patterns[pattern["name"]] = False
-
-                for match in matches:
-                    if t.start < match.end() and t.end > match.start():
-                        patterns[pattern["name"]] = True
-                        sequence_features[token_index][pattern_index] = 1.0
-                        if attribute in [RESPONSE, TEXT, ACTION_TEXT]:
-                            # sentence vector should contain all patterns
-                            sentence_features[0][pattern_index] = 1.0
-
-                t.set("pattern", patterns)
-
-        return (
-            scipy.sparse.coo_matrix(sequence_features),
-            scipy.sparse.coo_matrix(sentence_features),
+        # sentence vector should contain all patterns
+        matched_patterns = sorted(set(columns))
+        if attribute not in [RESPONSE, TEXT, ACTION_TEXT]:
+            matched_patterns = []
+        sentence_features = scipy.sparse.coo_matrix(
+            (
+                np.ones(len(matched_patterns)),
+                ([0] * len(matched_patterns), matched_patterns),
+            ),
+            shape=(1, num_patterns),
         )
 
+        return sequence_features, sentence_features
+
     @classmethod
     def load(
         cls,
@@ -267,3 +342,7 @@ class RegexFeaturizer(SparseFeaturizer, GraphComponent):
     def validate_config(cls, config: Dict[Text, Any]) -> None:
         """Validates that the component is configured properly."""
         pass
+
+
+def _is_sorted(values: List[int]) -> bool:
+    return all(a <= b for a, b in zip(values, values[1:]))
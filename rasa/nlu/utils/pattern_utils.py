@@ -1,10 +1,44 @@
+import functools
 import re
-from typing import Dict, List, Text, Union
+from typing import Any, Dict, List, Optional, Text, Tuple, Union
 
 import rasa.shared.utils.io
 from rasa.shared.nlu.training_data.training_data import TrainingData
 from rasa.shared.exceptions import InvalidConfigException
 
+# keys of patterns created from lookup tables, in addition to `name` and `pattern`
+LOOKUP_ELEMENTS = "elements"
+LOOKUP_USE_WORD_BOUNDARIES = "use_word_boundaries"
+
+# Characters which `re` considers equal when ignoring case, even though their
+# lowercase forms differ (see `sre_compile._equivalences`)
+_CASE_INSENSITIVE_EQUIVALENT_CHARACTERS = [
+    "iı",
+    "sſ",
+    "µμ",
+    "\u0345ι\u1fbe",
+    "\u0390\u1fd3",
+    "\u03b0\u1fe3",
+    "βϐ",
+    "εϵ",
+    "θϑ",
+    "κϰ",
+    "πϖ",
+    "ρϱ",
+    "ςσ",
+    "φϕ",
+    "ṡẛ",
+    "\ufb05\ufb06",
+]
+_CASE_INSENSITIVE_REPRESENTATIVES = {
+    character: equivalent_characters[0]
+    for equivalent_characters in _CASE_INSENSITIVE_EQUIVALENT_CHARACTERS
+    for character in equivalent_characters
+}
+
+# marks the end of a lookup table element in a `_LookupTableTrie`
+_ELEMENT_INDEX = ""
+
 
 def _convert_lookup_tables_to_regex(
     training_data: TrainingData,
@@ -21,18 +55,39 @@ def _convert_lookup_tables_to_regex(
           for each lookup table expressions.
 
     Returns:
-        A list of regex patterns.
+        A list of regex patterns. Each pattern also contains the elements of its
+        lookup table, which allows matching them without the regex.
     """
     patterns = []
     for table in training_data.lookup_tables:
         if use_only_entities and table["name"] not in training_data.entities:
             continue
-        regex_pattern = _generate_lookup_regex(table, use_word_boundaries)
-        lookup_regex = {"name": table["name"], "pattern": regex_pattern}
+        elements = _get_lookup_elements(table)
+        regex_pattern = _generate_lookup_regex(
+            {**table, "elements": elements}, use_word_boundaries
+        )
+        lookup_regex = {
+            "name": table["name"],
+            "pattern": regex_pattern,
+            LOOKUP_ELEMENTS: elements,
+            LOOKUP_USE_WORD_BOUNDARIES: use_word_boundaries,
+        }
         patterns.append(lookup_regex)
     return patterns
 
 
+def _get_lookup_elements(
+    lookup_table: Dict[Text, Union[Text, List[Text]]]
+) -> List[Text]:
+    lookup_elements = lookup_table["elements"]
+
+    # if it's a list, it should be the elements directly
+    if isinstance(lookup_elements, list):
+        return lookup_elements
+    # otherwise it's a file path.
+    return read_lookup_table_file(lookup_elements)
+
+
 def _generate_lookup_regex(
     lookup_table: Dict[Text, Union[Text, List[Text]]], use_word_boundaries: bool = True
 ) -> Text:
@@ -48,14 +103,7 @@ def _generate_lookup_regex(
     Returns:
         The regex pattern.
     """
-    lookup_elements = lookup_table["elements"]
-
-    # if it's a list, it should be the elements directly
-    if isinstance(lookup_elements, list):
-        elements_to_regex = lookup_elements
-    # otherwise it's a file path.
-    else:
-        elements_to_regex = read_lookup_table_file(lookup_elements)
+    elements_to_regex = _get_lookup_elements(lookup_table)
 
     # sanitize the regex, escape special characters
     elements_sanitized = [re.escape(e) for e in elements_to_regex]
@@ -156,6 +204,9 @@ def extract_patterns(
 
     # validate regexes, raise Error when invalid
     for pattern in patterns:
+        if LOOKUP_ELEMENTS in pattern:
+            # lookup table elements are escaped and always form a valid regex
+            continue
         try:
             re.compile(pattern["pattern"])
         except re.error:
@@ -166,3 +217,132 @@ def extract_patterns(
             )
 
     return patterns
+
+
+class PatternMatcher:
+    """Finds the matches of a pattern created by `extract_patterns` in texts.
+
+    Patterns created from lookup tables are matched with a trie of their elements,
+    which takes time proportional to the length of the text instead of the size of
+    the lookup table. The matches are the same as the ones of the regex of the
+    pattern. Any other patterns are matched with their regex.
+    """
+
+    def __init__(self, pattern: Dict[Text, Any], case_sensitive: bool = True) -> None:
+        """Compiles the pattern.
+
+        Args:
+            pattern: The pattern as created by `extract_patterns`.
+            case_sensitive: Whether the case of texts and patterns has to match.
+        """
+        self._regex: Optional[re.Pattern] = None
+        self._trie: Optional[_LookupTableTrie] = None
+
+        elements = pattern.get(LOOKUP_ELEMENTS)
+        # empty elements match empty strings, which only the regex handles
+        if elements and all(elements):
+            self._trie = _LookupTableTrie(
+                elements, pattern.get(LOOKUP_USE_WORD_BOUNDARIES, True), case_sensitive
+            )
+        else:
+            self._regex = re.compile(
+                pattern["pattern"], flags=0 if case_sensitive else re.IGNORECASE
+            )
+
+    def spans(self, text: Text) -> List[Tuple[int, int]]:
+        """Returns the start and end of each match in the same order as `finditer`."""
+        if self._trie is not None:
+            return self._trie.spans(text)
+
+        return [match.span() for match in self._regex.finditer(text)]
+
+
+class _LookupTableTrie:
+    """Matches the elements of a lookup table like the regex of the lookup table.
+
+    The regex is an alternation of the elements, so at every position of the text
+    the element which occurs first in the lookup table wins, and the search for the
+    next match continues after the end of the previous match.
+    """
+
+    def __init__(
+        self, elements: List[Text], use_word_boundaries: bool, case_sensitive: bool
+    ) -> None:
+        self._use_word_boundaries = use_word_boundaries
+        self._case_sensitive = case_sensitive
+        self._root: Dict[Text, Any] = {}
+
+        for index, element in enumerate(elements):
+            node = self._root
+            for character in self._normalize(element):
+                node = node.setdefault(character, {})
+            # the first occurrence of an element takes precedence
+            node.setdefault(_ELEMENT_INDEX, index)
+
+    def _normalize(self, text: Text) -> Text:
+        if self._case_sensitive:
+            return text
+        return "".join(map(_case_insensitive_character, text))
+
+    def spans(self, text: Text) -> List[Tuple[int, int]]:
+        normalized = self._normalize(text)
+        length = len(text)
+        spans = []
+
+        start = 0
+        while start < length:
+            end = self._match_at(text, normalized, start)
+            if end is None:
+                start += 1
+            else:
+                spans.append((start, end))
+                start = end
+
+        return spans
+
+    def _match_at(self, text: Text, normalized: Text, start: int) -> Optional[int]:
+        """Returns the end of the element which matches at `start`, if any."""
+        if normalized[start] not in self._root or (
+            self._use_word_boundaries and not _is_word_boundary(text, start)
+        ):
+            return None
+
+        best_index, best_end = None, None
+        node = self._root
+        for position in range(start, len(text)):
+            node = node.get(normalized[position])
+            if node is None:
+                break
+
+            index = node.get(_ELEMENT_INDEX)
+            if (
+                index is not None
+                and (best_index is None or index < best_index)
+                and (
+                    not self._use_word_boundaries
+                    or _is_word_boundary(text, position + 1)
+                )
+            ):
+                best_index, best_end = index, position + 1
+
+        return best_end
+
+
+@functools.lru_cache(maxsize=None)
+def _case_insensitive_character(character: Text) -> Text:
+    """Maps characters which `re.IGNORECASE` considers equal to the same character."""
+    # only the first character, as `re` uses the simple lowercase mapping, e.g. the
+    # lowercase of "İ" is "i̇", but `re` matches it with "i"
+    lowercase = character.lower()[0]
+    return _CASE_INSENSITIVE_REPRESENTATIVES.get(lowercase, lowercase)
+
+
+def _is_word_character(character: Text) -> bool:
+    return character.isalnum() or character == "_"
+
+
+def _is_word_boundary(text: Text, position: int) -> bool:
+    """Checks if `\\b` matches at the position of the text."""
+    is_word_before = position > 0 and _is_word_character(text[position - 1])
+    is_word_after = position < len(text) and _is_word_character(text[position])
+    return is_word_before != is_word_after
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import dataclasses
+import threading
 import typing
 import logging
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Text, Tuple
 
 from rasa.engine.graph import ExecutionContext, GraphComponent
@@ -61,6 +63,10 @@ class SpacyNLP(GraphComponent):
         self._model = model
         self._config = config
 
+        # docs of recently processed texts, by text
+        self._doc_cache: OrderedDict[Text, Doc] = OrderedDict()
+        self._doc_cache_lock = threading.Lock()
+
     @staticmethod
     def get_default_config() -> Dict[Text, Any]:
         """Default config."""
@@ -70,7 +76,20 @@ class SpacyNLP(GraphComponent):
             # retrieve the same vector, if set to `False`. For some
             # applications and models it makes sense to differentiate
             # between these two words, therefore setting this to `True`.
-            "case_sensitive": False
+            "case_sensitive": False,
+            # number of texts which spaCy processes together
+            "batch_size": 50,
+            # number of processes which spaCy uses to process texts, `-1` uses
+            # all available CPU cores
+            "n_process": 1,
+            # names of spaCy pipeline components which are not used by any
+            # component in the pipeline and hence don't need to run
+            "disable": [],
+            # number of docs of recently processed texts which are reused if the
+            # same text is processed again, `0` disables the cache
+            "doc_cache_size": 0,
+            # only docs of texts with at most this many characters are cached
+            "doc_cache_max_text_length": 100,
         }
 
     @staticmethod
@@ -212,25 +231,60 @@ class SpacyNLP(GraphComponent):
         )
         return docs_to_pipe, empty_docs
 
-    @staticmethod
     def _process_content_bearing_samples(
-        model: Language, samples_to_pipe: List[Tuple[int, Text]]
+        self, model: Language, samples_to_pipe: List[Tuple[int, Text]]
     ) -> List[Tuple[int, Doc]]:
         """Sends content bearing training samples to SpaCy's pipe."""
         docs = [
             (to_pipe_sample[0], doc)
             for to_pipe_sample, doc in zip(
                 samples_to_pipe,
-                [
-                    doc
-                    for doc in model.pipe(
-                        [txt for _, txt in samples_to_pipe], batch_size=50
-                    )
-                ],
+                self._pipe(model, [txt for _, txt in samples_to_pipe]),
             )
         ]
         return docs
 
+    def _pipe(self, model: Language, texts: List[Text]) -> List[Doc]:
+        """Processes the texts in batches with the configured spaCy pipeline."""
+        return list(
+            model.pipe(
+                texts,
+                batch_size=self._config.get("batch_size", 50),
+                n_process=self._config.get("n_process", 1),
+                disable=self._config.get("disable") or [],
+            )
+        )
+
+    def _docs_for_texts(self, model: Language, texts: List[Text]) -> List[Doc]:
+        """Makes SpaCy doc objects from preprocessed texts.
+
+        Docs of texts which were processed recently are taken from the doc cache,
+        if it is enabled. All other texts are processed together.
+        """
+        cache_size = self._config.get("doc_cache_size", 0)
+        if cache_size <= 0:
+            return self._pipe(model, texts)
+
+        max_text_length = self._config.get("doc_cache_max_text_length", 100)
+        docs: Dict[Text, Doc] = {}
+        with self._doc_cache_lock:
+            for text in texts:
+                if text in self._doc_cache:
+                    self._doc_cache.move_to_end(text)
+                    docs[text] = self._doc_cache[text]
+
+        texts_to_pipe = [text for text in dict.fromkeys(texts) if text not in docs]
+        docs.update(zip(texts_to_pipe, self._pipe(model, texts_to_pipe)))
+
+        with self._doc_cache_lock:
+            for text in texts_to_pipe:
+                if len(text) <= max_text_length:
+                    self._doc_cache[text] = docs[text]
+            while len(self._doc_cache) > cache_size:
+                self._doc_cache.popitem(last=False)
+
+        return [docs[text] for text in texts]
+
     @staticmethod
     def _process_non_content_bearing_samples(
         model: Language, empty_samples: List[Tuple[int, Text]]
@@ -300,13 +354,20 @@ class SpacyNLP(GraphComponent):
         return training_data
 
     def process(self, messages: List[Message], model: SpacyModel) -> List[Message]:
-        """Adds SpaCy tokens and features to messages."""
-        for message in messages:
-            for attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
-                if message.get(attribute):
-                    message.set(
-                        SPACY_DOCS[attribute],
-                        self._doc_for_text(model.model, message.get(attribute)),
-                    )
+        """Adds SpaCy tokens and features to messages.
+
+        The texts of all messages are processed together in batches.
+        """
+        for attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
+            messages_with_attribute = [
+                message for message in messages if message.get(attribute)
+            ]
+            texts = [
+                self._get_text(message, attribute)
+                for message in messages_with_attribute
+            ]
+            docs = self._docs_for_texts(model.model, texts)
+            for message, doc in zip(messages_with_attribute, docs):
+                message.set(SPACY_DOCS[attribute], doc)
 
         return messages
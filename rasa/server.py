@@ -1292,6 +1292,64 @@ def create_app(
                 f"An unexpected error occurred. Error: {e}",
             )
 
+    @app.post("/model/predict/batch")
+    @requires_auth(app, auth_token)
+    @ensure_loaded_agent(app, require_core_is_ready=True)
+    async def tracker_predict_batch(request: Request) -> HTTPResponse:
+        """Given multiple lists of events, predicts the next action for each."""
+        request_params = request.json
+        if not isinstance(request_params, list) or not all(
+            isinstance(events, list) for events in request_params
+        ):
+            raise ErrorResponse(
+                HTTPStatus.BAD_REQUEST,
+                "BadRequest",
+                "The request body has to be a list of event lists.",
+                {"parameter": "", "in": "body"},
+            )
+
+        for events in request_params:
+            try:
+                jsonschema.validate(events, EVENTS_SCHEMA)
+            except jsonschema.ValidationError as error:
+                raise ErrorResponse(
+                    HTTPStatus.BAD_REQUEST,
+                    "BadRequest",
+                    f"Failed to validate the events format. "
+                    f"For more information about the format visit the docs. "
+                    f"Error: {error}",
+                    help_url=_docs("/pages/http-api"),
+                ) from error
+
+        verbosity = event_verbosity_parameter(request, EventVerbosity.AFTER_RESTART)
+        try:
+            trackers = [
+                DialogueStateTracker.from_dict(
+                    DEFAULT_SENDER_ID, events, app.ctx.agent.domain.slots
+                )
+                for events in request_params
+            ]
+        except Exception as e:
+            logger.debug(traceback.format_exc())
+            raise ErrorResponse(
+                HTTPStatus.BAD_REQUEST,
+                "BadRequest",
+                f"Supplied events are not valid. {e}",
+                {"parameter": "", "in": "body"},
+            )
+
+        try:
+            result = app.ctx.agent.predict_next_with_trackers(trackers, verbosity)
+
+            return response.json(result)
+        except Exception as e:
+            logger.debug(traceback.format_exc())
+            raise ErrorResponse(
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                "PredictionError",
+                f"An unexpected error occurred. Error: {e}",
+            )
+
     @app.post("/model/parse")
     @requires_auth(app, auth_token)
     @ensure_loaded_agent(app)
@@ -1264,6 +1264,10 @@ class Domain:
             if sub_state
         }
 
+    @staticmethod
+    def _copy_state(state: State) -> State:
+        return {state_type: dict(sub_state) for state_type, sub_state in state.items()}
+
     def get_active_state(
         self, tracker: "DialogueStateTracker", omit_unset_slots: bool = False
     ) -> State:
@@ -1353,25 +1357,29 @@ class Domain:
         states: List[State] = []
         last_ml_action_sub_state = None
         turn_was_hidden = False
-        for tr, hide_rule_turn in tracker.generate_all_prior_trackers():
+        for prior in tracker.prior_tracker_states(
+            self, omit_unset_slots=omit_unset_slots
+        ):
             if ignore_rule_only_turns:
                 # remember previous ml action based on the last non hidden turn
                 # we need this to override previous action in the ml state
                 if not turn_was_hidden:
-                    last_ml_action_sub_state = self._get_prev_action_sub_state(tr)
+                    last_ml_action_sub_state = prior.latest_action
 
                 # followup action or happy path loop prediction
                 # don't change the fact whether dialogue turn should be hidden
                 if (
-                    not tr.followup_action
-                    and not tr.latest_action_name == tr.active_loop_name
+                    not prior.followup_action
+                    and not prior.latest_action_name == prior.active_loop_name
                 ):
-                    turn_was_hidden = hide_rule_turn
+                    turn_was_hidden = prior.hide_rule_turn
 
                 if turn_was_hidden:
                     continue
 
-            state = self.get_active_state(tr, omit_unset_slots=omit_unset_slots)
+            # the prior states are cached on the tracker, hence copy them before
+            # they are modified
+            state = self._copy_state(prior.state)
 
             if ignore_rule_only_turns:
                 # clean state from only rule features
@@ -1386,7 +1394,7 @@ class Domain:
                     # a larger refactoring (e.g. switch to dataclass)
                     state[rasa.shared.core.constants.PREVIOUS_ACTION] = cast(
                         SubState,
-                        last_ml_action_sub_state,
+                        dict(last_ml_action_sub_state),
                     )
 
             states.append(self._clean_state(state))
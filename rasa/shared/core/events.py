@@ -276,6 +276,10 @@ class Event(ABC):
 
     type_name = "event"
 
+    # Maps the `type_name`s to the event classes. Built on first use and reset
+    # whenever a new event class is defined.
+    _classes_by_type_name: Optional[Dict[Text, Type["Event"]]] = None
+
     def __init__(
         self,
         timestamp: Optional[float] = None,
@@ -284,6 +288,10 @@ class Event(ABC):
         self.timestamp = timestamp or time.time()
         self.metadata = metadata or {}
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        Event._classes_by_type_name = None
+
     def __ne__(self, other: Any) -> bool:
         # Not strictly necessary, but to avoid having both x==y and x!=y
         # True at the same time
@@ -376,9 +384,9 @@ class Event(ABC):
         type_name: Text, default: Optional[Type["Event"]] = None
     ) -> Optional[Type["Event"]]:
         """Returns a slots class by its type name."""
-        for cls in rasa.shared.utils.common.all_subclasses(Event):
-            if cls.type_name == type_name:
-                return cls
+        event_class = Event._event_classes_by_type_name().get(type_name)
+        if event_class is not None:
+            return event_class
         if type_name == "topic":
             return None  # backwards compatibility to support old TopicSet evts
         elif default is not None:
@@ -386,6 +394,18 @@ class Event(ABC):
         else:
             raise ValueError(f"Unknown event name '{type_name}'.")
 
+    @staticmethod
+    def _event_classes_by_type_name() -> Dict[Text, Type["Event"]]:
+        classes_by_type_name = Event._classes_by_type_name
+        if classes_by_type_name is None:
+            classes_by_type_name = {}
+            for cls in rasa.shared.utils.common.all_subclasses(Event):
+                # the first matching class wins, as it did for the linear search
+                classes_by_type_name.setdefault(cls.type_name, cls)
+            Event._classes_by_type_name = classes_by_type_name
+
+        return classes_by_type_name
+
     def apply_to(self, tracker: "DialogueStateTracker") -> None:
         """Applies event to current conversation state.
 
@@ -33,7 +33,11 @@ from rasa.shared.core.events import (
     SlotSet,
     ActiveLoop,
 )
-from rasa.shared.core.trackers import DialogueStateTracker, FrozenState
+from rasa.shared.core.trackers import (
+    DialogueStateTracker,
+    FrozenState,
+    PriorTrackerState,
+)
 from rasa.shared.core.slots import Slot
 from rasa.shared.core.training_data.structures import (
     StoryGraph,
@@ -171,6 +175,20 @@ class TrackerWithCachedStates(DialogueStateTracker):
         )
         return self._unfreeze_states(states_for_hashing)
 
+    def prior_tracker_states(
+        self, domain: Domain, omit_unset_slots: bool = False
+    ) -> List[PriorTrackerState]:
+        """Returns the states of the prior trackers without caching them.
+
+        Training trackers are featurized only once, hence keeping the incremental
+        state cache around would only increase the memory usage during training.
+        """
+        prior_states = super().prior_tracker_states(
+            domain, omit_unset_slots=omit_unset_slots
+        )
+        self._prior_states_caches.clear()
+        return prior_states
+
     def clear_states(self) -> None:
         """Reset the states."""
         self._states_for_hashing = deque()
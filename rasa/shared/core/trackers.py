@@ -82,6 +82,22 @@ class TrackerActiveLoop:
     trigger_message: Optional[Dict]
 
 
+@dataclasses.dataclass
+class PriorTrackerState:
+    """Dataclass for the state of a tracker before one of its actions was executed.
+
+    Contains everything `Domain.states_for_tracker_history` needs to know about the
+    prior tracker so that the prior tracker itself doesn't have to be kept around.
+    """
+
+    state: State
+    hide_rule_turn: bool
+    latest_action: Optional[Dict[Text, Text]]
+    latest_action_name: Optional[Text]
+    followup_action: Optional[Text]
+    active_loop_name: Optional[Text]
+
+
 logger = logging.getLogger(__name__)
 
 # same as State but with Dict[...] substituted with FrozenSet[Tuple[...]]
@@ -227,6 +243,13 @@ class DialogueStateTracker:
         self.model_id: Optional[Text] = None
         self.assistant_id: Optional[Text] = None
 
+        # number of events of this tracker which are already persisted by the
+        # tracker store it was retrieved from (`None` if unknown)
+        self.number_of_persisted_events: Optional[int] = None
+
+        # incrementally built states of the prior trackers per `omit_unset_slots`
+        self._prior_states_caches: Dict[bool, _PriorStatesCache] = {}
+
     ###
     # Public tracker interface
     ###
@@ -501,6 +524,35 @@ class DialogueStateTracker:
 
         yield tracker, False
 
+    def prior_tracker_states(
+        self, domain: Domain, omit_unset_slots: bool = False
+    ) -> List[PriorTrackerState]:
+        """Returns the states of the trackers yielded by `generate_all_prior_trackers`.
+
+        The states are cached on the tracker and only the events which were applied
+        since the last call are processed. The cache is rebuilt from scratch if the
+        applied events were rewound in the meantime (e.g. by `UserUtteranceReverted`,
+        `ActionReverted` or `Restarted`) or if a different domain is used.
+
+        Args:
+            domain: The Domain.
+            omit_unset_slots: If `True` do not include the initial values of slots.
+
+        Returns:
+            The states of the prior trackers, followed by the current state.
+            The returned states must not be modified.
+        """
+        applied_events = self.applied_events()
+
+        cache = self._prior_states_caches.get(omit_unset_slots)
+        if cache is None or not cache.is_valid_for(domain, applied_events):
+            cache = _PriorStatesCache(self.init_copy(), domain, omit_unset_slots)
+            self._prior_states_caches[omit_unset_slots] = cache
+
+        cache.extend(applied_events)
+
+        return [*cache.prior_states, cache.current_state(hide_rule_turn=False)]
+
     def applied_events(self) -> List[Event]:
         """Returns all actions that should be applied - w/o reverted events.
 
@@ -987,3 +1039,57 @@ def get_trackers_for_conversation_sessions(
         )
         for evts in split_conversations
     ]
+
+
+class _PriorStatesCache:
+    """Incrementally built states of the prior trackers of a tracker.
+
+    The applied events of the tracker are replayed on a separate tracker. Only
+    events which weren't replayed yet are processed on subsequent lookups, which
+    keeps the cost of generating the states of a conversation linear in the number
+    of its events instead of quadratic.
+    """
+
+    def __init__(
+        self, tracker: DialogueStateTracker, domain: Domain, omit_unset_slots: bool
+    ) -> None:
+        self._tracker = tracker
+        self._domain = domain
+        self._omit_unset_slots = omit_unset_slots
+        self._replayed_events: List[Event] = []
+        self.prior_states: List[PriorTrackerState] = []
+
+    def is_valid_for(self, domain: Domain, applied_events: List[Event]) -> bool:
+        """Checks if the already replayed events are a prefix of `applied_events`."""
+        if domain is not self._domain:
+            return False
+
+        if len(applied_events) < len(self._replayed_events):
+            return False
+
+        return all(
+            replayed is applied
+            for replayed, applied in zip(self._replayed_events, applied_events)
+        )
+
+    def extend(self, applied_events: List[Event]) -> None:
+        """Replays the applied events which weren't replayed yet."""
+        for event in applied_events[len(self._replayed_events) :]:
+            if isinstance(event, ActionExecuted):
+                self.prior_states.append(self.current_state(event.hide_rule_turn))
+
+            self._tracker.update(event)
+            self._replayed_events.append(event)
+
+    def current_state(self, hide_rule_turn: bool) -> PriorTrackerState:
+        """Captures the state of the replayed tracker."""
+        return PriorTrackerState(
+            state=self._domain.get_active_state(
+                self._tracker, omit_unset_slots=self._omit_unset_slots
+            ),
+            hide_rule_turn=hide_rule_turn,
+            latest_action=self._tracker.latest_action,
+            latest_action_name=self._tracker.latest_action_name,
+            followup_action=self._tracker.followup_action,
+            active_loop_name=self._tracker.active_loop_name,
+        )
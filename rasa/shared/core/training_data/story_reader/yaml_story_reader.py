@@ -32,6 +32,7 @@ from rasa.shared.nlu.constants import (
 )
 from rasa.shared.nlu.training_data import entities_parser
 import rasa.shared.utils.validation
+import rasa.shared.utils.yaml_cache
 
 from rasa.shared.constants import (
     INTENT_MESSAGE_PREFIX,
@@ -129,10 +130,12 @@ class YAMLStoryReader(StoryReader):
         Returns:
             `StoryStep`s read from `string`.
         """
-        if not skip_validation:
-            rasa.shared.utils.validation.validate_yaml_schema(string, CORE_SCHEMA_FILE)
-
-        yaml_content = rasa.shared.utils.io.read_yaml(string)
+        if skip_validation:
+            yaml_content = rasa.shared.utils.io.read_yaml(string)
+        else:
+            yaml_content = rasa.shared.utils.yaml_cache.parse_validated_yaml(
+                string, CORE_SCHEMA_FILE
+            )
 
         return self.read_from_parsed_yaml(yaml_content)
 
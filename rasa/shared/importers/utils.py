@@ -1,5 +1,6 @@
 from typing import Iterable, Text, Optional, List
 
+import rasa.shared.utils.yaml_cache
 from rasa.shared.core.domain import Domain
 from rasa.shared.core.training_data.structures import StoryGraph
 from rasa.shared.nlu.training_data.training_data import TrainingData
@@ -7,6 +8,10 @@ from rasa.shared.nlu.training_data.training_data import TrainingData
 
 def training_data_from_paths(paths: Iterable[Text], language: Text) -> TrainingData:
     from rasa.shared.nlu.training_data import loading
+    from rasa.shared.nlu.training_data.formats.rasa_yaml import NLU_SCHEMA_FILE
+
+    paths = list(paths)
+    rasa.shared.utils.yaml_cache.parse_files_in_parallel(paths, NLU_SCHEMA_FILE)
 
     training_data_sets = [loading.load_data(nlu_file, language) for nlu_file in paths]
     return TrainingData().merge(*training_data_sets)
@@ -17,6 +22,11 @@ def story_graph_from_paths(
 ) -> StoryGraph:
     """Returns the `StoryGraph` from paths."""
     from rasa.shared.core.training_data import loading
+    from rasa.shared.core.training_data.story_reader.yaml_story_reader import (
+        CORE_SCHEMA_FILE,
+    )
+
+    rasa.shared.utils.yaml_cache.parse_files_in_parallel(files, CORE_SCHEMA_FILE)
 
     story_steps = loading.load_data_from_files(files, domain, exclusion_percentage)
     return StoryGraph(story_steps)
@@ -20,6 +20,7 @@ from rasa.shared.nlu.training_data.formats.readerwriter import (
     TrainingDataWriter,
 )
 import rasa.shared.utils.io
+import rasa.shared.utils.yaml_cache
 import rasa.shared.nlu.training_data.util
 from rasa.shared.nlu.training_data.training_data import TrainingData
 from rasa.shared.nlu.training_data.message import Message
@@ -81,9 +82,13 @@ class RasaYAMLReader(TrainingDataReader):
         Returns:
             New `TrainingData` object with parsed training data.
         """
-        self.validate(string)
-
-        yaml_content = rasa.shared.utils.io.read_yaml(string)
+        try:
+            yaml_content = rasa.shared.utils.yaml_cache.parse_validated_yaml(
+                string, NLU_SCHEMA_FILE
+            )
+        except YamlException as e:
+            e.filename = self.filename
+            raise e
 
         if not validation.validate_training_data_format_version(
             yaml_content, self.filename
@@ -1,5 +1,6 @@
 from collections import OrderedDict
 import errno
+import functools
 import glob
 from hashlib import md5
 from io import StringIO
@@ -12,6 +13,7 @@ from typing import Any, Dict, List, Optional, Text, Type, Union
 import warnings
 import random
 import string
+import threading
 import portalocker
 
 from ruamel import yaml as yaml
@@ -305,29 +307,32 @@ def fix_yaml_loader() -> None:
     yaml.SafeLoader.add_constructor("tag:yaml.org,2002:str", construct_yaml_str)
 
 
+# eg. ${USER_NAME}, ${PASSWORD}
+ENV_VAR_PATTERN = re.compile(r"^(.*)\$\{(.*)\}(.*)$")
+ENV_VAR_TAG = "!env_var"
+
+
 def replace_environment_variables() -> None:
     """Enable yaml loader to process the environment variables in the yaml."""
-    # eg. ${USER_NAME}, ${PASSWORD}
-    env_var_pattern = re.compile(r"^(.*)\$\{(.*)\}(.*)$")
-    yaml.Resolver.add_implicit_resolver("!env_var", env_var_pattern, None)
-
-    def env_var_constructor(loader: BaseConstructor, node: ScalarNode) -> Text:
-        """Process environment variables found in the YAML."""
-        value = loader.construct_scalar(node)
-        expanded_vars = os.path.expandvars(value)
-        not_expanded = [
-            w for w in expanded_vars.split() if w.startswith("$") and w in value
-        ]
-        if not_expanded:
-            raise RasaException(
-                f"Error when trying to expand the "
-                f"environment variables in '{value}'. "
-                f"Please make sure to also set these "
-                f"environment variables: '{not_expanded}'."
-            )
-        return expanded_vars
-
-    yaml.SafeConstructor.add_constructor("!env_var", env_var_constructor)
+    yaml.Resolver.add_implicit_resolver(ENV_VAR_TAG, ENV_VAR_PATTERN, None)
+    yaml.SafeConstructor.add_constructor(ENV_VAR_TAG, _env_var_constructor)
+
+
+def _env_var_constructor(loader: BaseConstructor, node: ScalarNode) -> Text:
+    """Process environment variables found in the YAML."""
+    value = loader.construct_scalar(node)
+    expanded_vars = os.path.expandvars(value)
+    not_expanded = [
+        w for w in expanded_vars.split() if w.startswith("$") and w in value
+    ]
+    if not_expanded:
+        raise RasaException(
+            f"Error when trying to expand the "
+            f"environment variables in '{value}'. "
+            f"Please make sure to also set these "
+            f"environment variables: '{not_expanded}'."
+        )
+    return expanded_vars
 
 
 fix_yaml_loader()
@@ -337,6 +342,10 @@ replace_environment_variables()
 def read_yaml(content: Text, reader_type: Union[Text, List[Text]] = "safe") -> Any:
     """Parses yaml from a text.
 
+    The "safe" reader type uses the C implementation of `libyaml` if it's available,
+    which gives the same results as `ruamel.yaml` for YAML 1.2 content. Content
+    which it doesn't support in the same way is parsed with `ruamel.yaml`.
+
     Args:
         content: A text containing yaml content.
         reader_type: Reader type to use. By default "safe" will be used.
@@ -344,24 +353,148 @@ def read_yaml(content: Text, reader_type: Union[Text, List[Text]] = "safe") -> A
     Raises:
         ruamel.yaml.parser.ParserError: If there was an error when parsing the YAML.
     """
-    if _is_ascii(content):
-        # Required to make sure emojis are correctly parsed
+    content = _unescape_unicode(content)
+
+    if reader_type == "safe" and _libyaml_loader() is not None:
+        try:
+            return _load_yaml_with_libyaml(content) or {}
+        except Exception:
+            # e.g. duplicate keys, which `ruamel.yaml` reports as errors
+            pass
+
+    return _load_yaml_with_ruamel(content, reader_type) or {}
+
+
+def _unescape_unicode(content: Text) -> Text:
+    """Converts escaped unicode characters, e.g. emojis, in ASCII text."""
+    if content.isascii() and ("\\u" in content or "\\U" in content):
         content = (
             content.encode("utf-8")
             .decode("raw_unicode_escape")
             .encode("utf-16", "surrogatepass")
             .decode("utf-16")
         )
+    return content
+
+
+_ruamel_parsers = threading.local()
+
+
+def _load_yaml_with_ruamel(content: Text, reader_type: Union[Text, List[Text]]) -> Any:
+    if _YAML_DIRECTIVE.search(content):
+        # a directive changes the YAML version of the parser for all later content
+        return _create_ruamel_parser(reader_type).load(content)
+
+    # parsers are reused, but they can't be used by multiple threads at once
+    parsers = getattr(_ruamel_parsers, "by_reader_type", None)
+    if parsers is None:
+        parsers = _ruamel_parsers.by_reader_type = {}
+    key = reader_type if isinstance(reader_type, str) else tuple(reader_type)
+    if key not in parsers:
+        parsers[key] = _create_ruamel_parser(reader_type)
+
+    return parsers[key].load(content)
+
 
+def _create_ruamel_parser(reader_type: Union[Text, List[Text]]) -> yaml.YAML:
     yaml_parser = yaml.YAML(typ=reader_type)
     yaml_parser.version = YAML_VERSION  # type: ignore[assignment]
     yaml_parser.preserve_quotes = True  # type: ignore[assignment]
+    return yaml_parser
 
-    return yaml_parser.load(content) or {}
 
+def _load_yaml_with_libyaml(content: Text) -> Any:
+    """Parses YAML with `libyaml` like the "safe" reader type of `ruamel.yaml`.
+
+    Raises:
+        ValueError: If the content has to be parsed by `ruamel.yaml`.
+    """
+    if _YAML_DIRECTIVE.search(content):
+        raise ValueError("YAML directives are only supported by `ruamel.yaml`.")
+
+    import yaml as pyyaml
+
+    return pyyaml.load(content, Loader=_libyaml_loader())  # nosec
+
+
+# directives like `%YAML 1.1` can change how the content is parsed
+_YAML_DIRECTIVE = re.compile(r"^%", re.MULTILINE)
+
+_MERGE_TAG = "tag:yaml.org,2002:merge"
+# tags which `ruamel.yaml` constructs differently than `PyYAML`
+_TAGS_ONLY_SUPPORTED_BY_RUAMEL = [
+    "tag:yaml.org,2002:binary",
+    "tag:yaml.org,2002:omap",
+    "tag:yaml.org,2002:pairs",
+    "tag:yaml.org,2002:set",
+    "tag:yaml.org,2002:timestamp",
+]
+
+
+@functools.lru_cache(maxsize=None)
+def _libyaml_loader() -> Optional[Type]:
+    """Creates a `PyYAML` loader which uses `libyaml` and resolves like YAML 1.2.
+
+    `PyYAML` implements YAML 1.1, in which e.g. `yes` is a boolean. The loader uses
+    the YAML 1.2 resolvers of `ruamel.yaml` instead, so that the parsed content is
+    the same.
+
+    Returns:
+        The loader or `None` if `PyYAML` was built without `libyaml`.
+    """
+    try:
+        import yaml as pyyaml
+        from ruamel.yaml.resolver import implicit_resolvers
+    except ImportError:
+        return None
+
+    if not getattr(pyyaml, "__with_libyaml__", False):
+        return None
+
+    class LibyamlLoader(pyyaml.CSafeLoader):
+        # don't inherit the YAML 1.1 resolvers
+        yaml_implicit_resolvers: Dict[Optional[Text], List] = {}
+
+        def construct_mapping(self, node: Any, deep: bool = False) -> Dict:
+            for key_node, _ in node.value:
+                if key_node.tag == _MERGE_TAG:
+                    raise ValueError("Merge keys are only supported by `ruamel.yaml`.")
+                if not isinstance(key_node, pyyaml.ScalarNode):
+                    raise ValueError(
+                        "Complex keys are only supported by `ruamel.yaml`."
+                    )
+            mapping = super().construct_mapping(node, deep=deep)
+            if len(mapping) != len(node.value):
+                raise ValueError("Duplicate keys are reported by `ruamel.yaml`.")
+            return mapping
+
+        def construct_yaml_int(self, node: Any) -> int:
+            # YAML 1.2 integers, e.g. `010` is `10` and not an octal number
+            value = self.construct_scalar(node).replace("_", "")
+            sign = -1 if value[0] == "-" else 1
+            if value[0] in "+-":
+                value = value[1:]
+            for prefix, base in [("0b", 2), ("0o", 8), ("0x", 16)]:
+                if value.startswith(prefix):
+                    return sign * int(value[len(prefix) :], base)
+            return sign * int(value)
+
+        def construct_unsupported(self, node: Any) -> Any:
+            raise ValueError(f"'{node.tag}' is only supported by `ruamel.yaml`.")
+
+    for versions, tag, regexp, first in implicit_resolvers:
+        if YAML_VERSION in versions:
+            LibyamlLoader.add_implicit_resolver(tag, regexp, first)
+    LibyamlLoader.add_implicit_resolver(ENV_VAR_TAG, ENV_VAR_PATTERN, None)
+
+    LibyamlLoader.add_constructor(
+        "tag:yaml.org,2002:int", LibyamlLoader.construct_yaml_int
+    )
+    LibyamlLoader.add_constructor(ENV_VAR_TAG, _env_var_constructor)
+    for tag in _TAGS_ONLY_SUPPORTED_BY_RUAMEL:
+        LibyamlLoader.add_constructor(tag, LibyamlLoader.construct_unsupported)
 
-def _is_ascii(text: Text) -> bool:
-    return all(ord(character) < 128 for character in text)
+    return LibyamlLoader
 
 
 def read_yaml_file(
@@ -1,6 +1,9 @@
+import copy
+import functools
 import logging
 import os
-from typing import Text, Dict, List, Optional, Any
+import typing
+from typing import Text, Dict, List, Optional, Any, Tuple
 
 from packaging import version
 from packaging.version import LegacyVersion
@@ -23,6 +26,9 @@ from rasa.shared.constants import (
     RESPONSES_SCHEMA_FILE,
 )
 
+if typing.TYPE_CHECKING:
+    from pykwalify.core import Core
+
 logger = logging.getLogger(__name__)
 
 KEY_TRAINING_DATA_FORMAT_VERSION = "version"
@@ -128,15 +134,25 @@ def validate_yaml_schema(
         package_name: the name of the package the schema is located in. defaults
             to `rasa`.
     """
-    from pykwalify.core import Core
     from pykwalify.errors import SchemaError
     from ruamel.yaml import YAMLError
-    import pkg_resources
     import logging
 
     log = logging.getLogger("pykwalify")
     log.setLevel(logging.CRITICAL)
 
+    # Most content is valid, so it's first validated after parsing it with the
+    # fast "safe" reader type. The content is only parsed again to point the user
+    # to the right line if it's invalid.
+    try:
+        _schema_validator(
+            rasa.shared.utils.io.read_yaml(yaml_file_content), schema_path, package_name
+        ).validate(raise_exception=True)
+        return
+    except Exception:
+        # errors are raised below
+        pass
+
     try:
         # we need "rt" since
         # it will add meta information to the parsed output. this meta information
@@ -149,6 +165,24 @@ def validate_yaml_schema(
     except (YAMLError, DuplicateKeyError) as e:
         raise YamlSyntaxException(underlying_yaml_exception=e)
 
+    c = _schema_validator(source_data, schema_path, package_name)
+
+    try:
+        c.validate(raise_exception=True)
+    except SchemaError:
+        raise YamlValidationException(
+            "Please make sure the file is correct and all "
+            "mandatory parameters are specified. Here are the errors "
+            "found during validation",
+            c.errors,
+            content=source_data,
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def _load_schema(schema_path: Text, package_name: Text) -> Tuple[Dict[Text, Any], Text]:
+    import pkg_resources
+
     schema_file = pkg_resources.resource_filename(package_name, schema_path)
     schema_utils_file = pkg_resources.resource_filename(
         PACKAGE_NAME, RESPONSES_SCHEMA_FILE
@@ -163,23 +197,23 @@ def validate_yaml_schema(
     schema_utils_content = rasa.shared.utils.io.read_yaml_file(schema_utils_file)
     schema_content = dict(schema_content, **schema_utils_content)
 
-    c = Core(
+    return schema_content, schema_extensions
+
+
+def _schema_validator(
+    source_data: Any, schema_path: Text, package_name: Text
+) -> "Core":
+    from pykwalify.core import Core
+
+    schema_content, schema_extensions = _load_schema(schema_path, package_name)
+
+    return Core(
         source_data=source_data,
-        schema_data=schema_content,
+        # the validator must not change the cached schema
+        schema_data=copy.deepcopy(schema_content),
         extensions=[schema_extensions],
     )
 
-    try:
-        c.validate(raise_exception=True)
-    except SchemaError:
-        raise YamlValidationException(
-            "Please make sure the file is correct and all "
-            "mandatory parameters are specified. Here are the errors "
-            "found during validation",
-            c.errors,
-            content=source_data,
-        )
-
 
 def validate_training_data(json_data: Dict[Text, Any], schema: Dict[Text, Any]) -> None:
     """Validate rasa training data format to ensure proper training.
@@ -0,0 +1,302 @@
+import concurrent.futures
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Text, Tuple, Union
+
+import rasa.shared.data
+import rasa.shared.utils.io
+import rasa.shared.utils.validation
+from rasa.version import __version__
+
+logger = logging.getLogger(__name__)
+
+# same environment variables as for the cache of the training graph (see
+# `rasa.engine.caching`), setting the maximum cache size to `0` disables the cache
+CACHE_LOCATION_ENV = "RASA_CACHE_DIRECTORY"
+CACHE_SIZE_ENV = "RASA_MAX_CACHE_SIZE"
+DEFAULT_CACHE_LOCATION = Path(".rasa", "cache")
+YAML_CACHE_DIRECTORY = "parsed_yaml"
+YAML_CACHE_FILE_EXTENSION = ".pkl"
+
+# the parsed files don't count towards the size of the training graph cache, but
+# have their own size limit (in MB)
+YAML_CACHE_SIZE_ENV = "RASA_MAX_YAML_CACHE_SIZE"
+DEFAULT_YAML_CACHE_SIZE_MB = 100
+# the least recently used files are deleted until the cache is below this fraction
+# of its size limit, so that this doesn't happen again for the next few files
+SIZE_AFTER_EVICTION = 0.8
+
+# environment variables in the content are expanded when it's parsed, so content
+# with environment variables is parsed again every time
+ENVIRONMENT_VARIABLE_MARKER = "${"
+
+# number of processes which parse training data files, `1` disables parallel parsing
+DATA_LOADING_WORKERS_ENV = "RASA_DATA_LOADING_WORKERS"
+# parsing only a few files in parallel is slower than starting the processes
+MIN_FILES_FOR_PARALLEL_PARSING = 8
+
+# the only classes besides builtin containers and scalars which the YAML reader
+# creates for training data
+_ALLOWED_CLASSES = {
+    ("datetime", "date"),
+    ("datetime", "datetime"),
+    ("datetime", "timedelta"),
+    ("datetime", "timezone"),
+}
+
+# files which were parsed in parallel but can't be cached on disk, by cache key
+_parsed_files: Dict[Text, Any] = {}
+
+# estimated sizes of cache directories in bytes, once they were measured
+_cache_sizes: Dict[Path, float] = {}
+
+
+def parse_validated_yaml(content: Text, schema_path: Text) -> Any:
+    """Validates YAML content with a schema and parses it.
+
+    The parsed content of valid YAML is cached on disk by the hash of the content,
+    so that unchanged training data files don't need to be validated and parsed
+    again the next time they are loaded. Content with environment variables isn't
+    cached as their values might change.
+
+    Args:
+        content: The YAML content.
+        schema_path: The path of the schema within the `rasa` package.
+
+    Returns:
+        The parsed content.
+
+    Raises:
+        YamlException: If the content is not valid.
+    """
+    key = _cache_key(content, schema_path)
+    if key in _parsed_files:
+        return _parsed_files.pop(key)
+
+    if not _can_be_cached(content):
+        return _parse(content, schema_path)
+
+    parsed = _read_from_cache(key)
+    if parsed is not None:
+        return parsed
+
+    parsed = _parse(content, schema_path)
+    _write_to_cache(key, parsed)
+    return parsed
+
+
+def parse_files_in_parallel(
+    filenames: List[Union[Text, Path]], schema_path: Text
+) -> None:
+    """Validates and parses YAML files in multiple processes ahead of time.
+
+    The parsed files are added to the cache, so that `parse_validated_yaml` can take
+    them from there when the files are read one by one afterwards. Files which
+    are already cached or aren't valid are skipped, so that errors are raised with
+    the usual context when the files are read.
+
+    Args:
+        filenames: The files which will be read.
+        schema_path: The path of the schema within the `rasa` package.
+    """
+    max_workers = _max_workers()
+    if max_workers <= 1 or len(filenames) < MIN_FILES_FOR_PARALLEL_PARSING:
+        return
+
+    contents_by_key = {}
+    for filename in filenames:
+        if not rasa.shared.data.is_likely_yaml_file(filename):
+            continue
+        try:
+            content = rasa.shared.utils.io.read_file(filename)
+        except Exception:
+            continue
+        key = _cache_key(content, schema_path)
+        if key not in _parsed_files and not _cache_file(key).exists():
+            contents_by_key[key] = content
+
+    if len(contents_by_key) < MIN_FILES_FOR_PARALLEL_PARSING:
+        return
+
+    logger.debug(f"Parsing {len(contents_by_key)} files with {max_workers} processes.")
+    try:
+        with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+            results = executor.map(
+                _parse_if_valid,
+                contents_by_key.values(),
+                [schema_path] * len(contents_by_key),
+                chunksize=max(1, len(contents_by_key) // (4 * max_workers)),
+            )
+            for (key, content), parsed in zip(contents_by_key.items(), results):
+                if parsed is None:
+                    continue
+                if _is_cache_disabled() or not _can_be_cached(content):
+                    _parsed_files[key] = parsed
+                else:
+                    _write_to_cache(key, parsed)
+    except Exception as e:
+        # the remaining files are parsed sequentially when they are read
+        logger.debug(f"Failed to parse files in parallel: {e}")
+
+
+def _parse(content: Text, schema_path: Text) -> Any:
+    rasa.shared.utils.validation.validate_yaml_schema(content, schema_path)
+    return rasa.shared.utils.io.read_yaml(content)
+
+
+def _parse_if_valid(content: Text, schema_path: Text) -> Optional[Any]:
+    try:
+        return _parse(content, schema_path)
+    except Exception:
+        return None
+
+
+def _max_workers() -> int:
+    try:
+        return int(os.environ.get(DATA_LOADING_WORKERS_ENV, os.cpu_count() or 1))
+    except ValueError:
+        rasa.shared.utils.io.raise_warning(
+            f"The value of the environment variable '{DATA_LOADING_WORKERS_ENV}' "
+            f"has to be an integer. Training data files are parsed sequentially."
+        )
+        return 1
+
+
+def _cache_key(content: Text, schema_path: Text) -> Text:
+    # the schemas and the parsing can change between Rasa versions
+    return rasa.shared.utils.io.get_text_hash(
+        f"{__version__}\n{schema_path}\n{content}"
+    )
+
+
+def _can_be_cached(content: Text) -> bool:
+    return ENVIRONMENT_VARIABLE_MARKER not in content
+
+
+def _max_cache_size_in_bytes() -> float:
+    try:
+        max_cache_size = min(
+            float(os.environ.get(CACHE_SIZE_ENV, DEFAULT_YAML_CACHE_SIZE_MB)),
+            float(os.environ.get(YAML_CACHE_SIZE_ENV, DEFAULT_YAML_CACHE_SIZE_MB)),
+        )
+    except ValueError:
+        max_cache_size = DEFAULT_YAML_CACHE_SIZE_MB
+    return max_cache_size * 1e6
+
+
+def _is_cache_disabled() -> bool:
+    return _max_cache_size_in_bytes() == 0.0
+
+
+def _cache_file(key: Text) -> Path:
+    cache_location = Path(os.environ.get(CACHE_LOCATION_ENV, DEFAULT_CACHE_LOCATION))
+    return cache_location / YAML_CACHE_DIRECTORY / f"{key}{YAML_CACHE_FILE_EXTENSION}"
+
+
+def _read_from_cache(key: Text) -> Optional[Any]:
+    if _is_cache_disabled():
+        return None
+
+    cache_file = _cache_file(key)
+    try:
+        with cache_file.open("rb") as file:
+            parsed = _RestrictedUnpickler(file).load()
+        # the modification time marks when the file was used for the last time
+        os.utime(cache_file)
+        return parsed
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        # treat unreadable entries as missing, they are replaced once the file
+        # was parsed again
+        logger.debug(f"Failed to load parsed YAML from the cache: {e}")
+        return None
+
+
+def _write_to_cache(key: Text, parsed: Any) -> None:
+    if _is_cache_disabled():
+        return
+
+    cache_file = _cache_file(key)
+    temporary_file = None
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first so that concurrent readers never see
+        # incomplete entries
+        with tempfile.NamedTemporaryFile(
+            dir=cache_file.parent, suffix=".tmp", delete=False
+        ) as file:
+            temporary_file = Path(file.name)
+            pickle.dump(parsed, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_file, cache_file)
+        _add_to_cache_size(cache_file)
+    except Exception as e:
+        logger.debug(f"Failed to cache parsed YAML: {e}")
+        if temporary_file is not None:
+            temporary_file.unlink(missing_ok=True)
+
+
+def _add_to_cache_size(cache_file: Path) -> None:
+    """Drops the least recently used files if the cache exceeds its size limit.
+
+    The size of the cache directory is only measured once per process and then
+    increased by the size of every added file. Files which other processes add at
+    the same time are only noticed when the directory is measured again.
+    """
+    directory = cache_file.parent
+    if directory not in _cache_sizes:
+        _cache_sizes[directory] = sum(size for _, size, _ in _cache_files(directory))
+    else:
+        _cache_sizes[directory] += cache_file.stat().st_size
+
+    max_cache_size = _max_cache_size_in_bytes()
+    if _cache_sizes[directory] > max_cache_size:
+        _cache_sizes[directory] = _drop_least_recently_used_files(
+            directory, SIZE_AFTER_EVICTION * max_cache_size
+        )
+
+
+def _cache_files(directory: Path) -> List[Tuple[Path, int, float]]:
+    """Returns the path, size and modification time of every cached file."""
+    cache_files = []
+    for cache_file in directory.glob(f"*{YAML_CACHE_FILE_EXTENSION}"):
+        try:
+            stat = cache_file.stat()
+        except FileNotFoundError:
+            # deleted by another process
+            continue
+        cache_files.append((cache_file, stat.st_size, stat.st_mtime))
+    return cache_files
+
+
+def _drop_least_recently_used_files(directory: Path, max_size: float) -> float:
+    """Deletes the least recently used files until the cache fits `max_size`.
+
+    Returns:
+        The size of the remaining files in bytes.
+    """
+    cache_files = sorted(_cache_files(directory), key=lambda entry: entry[2])
+    cache_size = sum(size for _, size, _ in cache_files)
+    dropped_files = 0
+    for cache_file, size, _ in cache_files:
+        if cache_size <= max_size:
+            break
+        cache_file.unlink(missing_ok=True)
+        cache_size -= size
+        dropped_files += 1
+
+    logger.debug(f"Dropped {dropped_files} parsed YAML files from the cache.")
+    return cache_size
+
+
+class _RestrictedUnpickler(pickle.Unpickler):
+    """Only loads the types which parsed YAML training data consists of."""
+
+    def find_class(self, module: Text, name: Text) -> Any:
+        if (module, name) in _ALLOWED_CLASSES:
+            return super().find_class(module, name)
+
+        raise pickle.UnpicklingError(f"'{module}.{name}' is not allowed.")
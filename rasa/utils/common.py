@@ -493,20 +493,27 @@ async def call_potential_coroutine(
 
 
 def directory_size_in_mb(
-    path: Path, filenames_to_exclude: Optional[List[Text]] = None
+    path: Path,
+    filenames_to_exclude: Optional[List[Text]] = None,
+    subdirectories_to_exclude: Optional[List[Text]] = None,
 ) -> float:
     """Calculates the size of a directory.
 
     Args:
         path: The path to the directory.
         filenames_to_exclude: Allows excluding certain files from the calculation.
+        subdirectories_to_exclude: Allows excluding direct subdirectories of `path`
+            from the calculation.
 
     Returns:
         Directory size in MiB.
     """
     filenames_to_exclude = filenames_to_exclude or []
+    subdirectories_to_exclude = subdirectories_to_exclude or []
     size = 0.0
-    for root, _dirs, files in os.walk(path):
+    for root, dirs, files in os.walk(path):
+        if Path(root) == Path(path):
+            dirs[:] = [d for d in dirs if d not in subdirectories_to_exclude]
         for filename in files:
             if filename in filenames_to_exclude:
                 continue
@@ -16,6 +16,7 @@ from spacy import Language
 from pytest import WarningsRecorder
 
 from rasa.engine.caching import LocalTrainingCache
+import rasa.shared.utils.yaml_cache
 from rasa.engine.graph import ExecutionContext, GraphSchema
 from rasa.engine.storage.local_model_storage import LocalModelStorage
 from rasa.engine.storage.storage import ModelStorage
@@ -829,6 +830,11 @@ def temp_cache_for_fixtures(tmp_path_factory: TempPathFactory) -> None:
     LocalTrainingCache._get_cache_location = lambda: tmp_path_factory.mktemp(
         f"cache-{uuid.uuid4()}"
     )
+    os.environ[rasa.shared.utils.yaml_cache.CACHE_LOCATION_ENV] = str(
+        tmp_path_factory.mktemp("yaml-cache")
+    )
+    # starting processes to parse the small test projects isn't worth it
+    os.environ[rasa.shared.utils.yaml_cache.DATA_LOADING_WORKERS_ENV] = "1"
 
     # We can omit reverting the monkeypatch as this fixture is torn down after all the
     # tests ran
@@ -842,6 +848,7 @@ def use_temp_dir_for_cache(
     # cache.
     cache_dir = tmp_path_factory.mktemp(uuid.uuid4().hex)
     monkeypatch.setattr(LocalTrainingCache, "_get_cache_location", lambda: cache_dir)
+    monkeypatch.setenv(rasa.shared.utils.yaml_cache.CACHE_LOCATION_ENV, str(cache_dir))
 
 
 @contextlib.contextmanager
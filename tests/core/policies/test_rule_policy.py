@@ -53,7 +53,14 @@ from rasa.shared.core.events import (
     FollowupAction,
 )
 from rasa.core.nlg import TemplatedNaturalLanguageGenerator
-from rasa.core.policies.rule_policy import RulePolicy, InvalidRule, RULES
+from rasa.core.policies.rule_policy import (
+    RulePolicy,
+    InvalidRule,
+    RULES,
+    RULES_FOR_LOOP_UNHAPPY_PATH,
+    RULES_NOT_IN_STORIES,
+    CompactRuleLookup,
+)
 from rasa.graph_components.providers.rule_only_provider import RuleOnlyDataProvider
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.shared.core.generator import TrackerWithCachedStates
@@ -3169,3 +3176,90 @@ def test_initial_values_are_not_incorporated_into_rule_policy(
     policy.train(trackers, domain)
 
     assert not any(["has_said_hi" in rule for rule in policy.lookup[RULES]])
+
+
+@pytest.mark.parametrize(
+    "domain_path, data_path",
+    [
+        ("examples/rules/domain.yml", "examples/rules/data/rules.yml"),
+        ("examples/formbot/domain.yml", "examples/formbot/data"),
+        ("examples/concertbot/domain.yml", "examples/concertbot/data"),
+    ],
+)
+def test_possible_keys_from_rule_index_match_all_rules(
+    policy: RulePolicy, domain_path: Text, data_path: Text
+):
+    domain = Domain.load(domain_path)
+    trackers = training.load_data(data_path, domain, augmentation_factor=0)
+    policy.train(trackers, domain)
+
+    for lookup in (policy.lookup[RULES], policy.lookup[RULES_FOR_LOOP_UNHAPPY_PATH]):
+        for tracker in trackers:
+            states = tracker.past_states(domain)
+            for end in range(1, len(states) + 1):
+                conversation_states = states[:end]
+                # match the conversation against all rules
+                expected = {
+                    key
+                    for key in lookup
+                    if all(
+                        policy._is_rule_applicable(key, turn_index, state)
+                        for turn_index, state in enumerate(
+                            reversed(conversation_states)
+                        )
+                    )
+                }
+
+                assert (
+                    policy._get_possible_keys(lookup, conversation_states) == expected
+                )
+
+
+@pytest.mark.parametrize(
+    "domain_path, data_path",
+    [
+        ("examples/rules/domain.yml", "examples/rules/data/rules.yml"),
+        ("examples/formbot/domain.yml", "examples/formbot/data"),
+        ("examples/concertbot/domain.yml", "examples/concertbot/data"),
+    ],
+)
+def test_compact_lookup_matches_default_lookup(
+    policy_with_config: Callable[..., RulePolicy],
+    default_model_storage: ModelStorage,
+    default_execution_context: ExecutionContext,
+    resource: Resource,
+    domain_path: Text,
+    data_path: Text,
+):
+    domain = Domain.load(domain_path)
+    trackers = training.load_data(data_path, domain, augmentation_factor=0)
+    policy = policy_with_config()
+    policy.train(trackers, domain)
+    compact_policy = policy_with_config({"use_compact_lookup": True})
+    compact_policy.train(trackers, domain)
+
+    loaded_policy = RulePolicy.load(
+        {**RulePolicy.get_default_config(), "use_compact_lookup": True},
+        default_model_storage,
+        resource,
+        default_execution_context,
+    )
+
+    for compact in (compact_policy, loaded_policy):
+        for key in (RULES, RULES_FOR_LOOP_UNHAPPY_PATH):
+            lookup = policy.lookup[key]
+            compact_lookup = compact.lookup[key]
+            assert isinstance(compact_lookup, CompactRuleLookup)
+            assert dict(compact_lookup.items()) == lookup
+
+            for tracker in trackers:
+                states = tracker.past_states(domain)
+                for end in range(1, len(states) + 1):
+                    assert compact._get_possible_keys(
+                        compact_lookup, states[:end]
+                    ) == policy._get_possible_keys(lookup, states[:end])
+
+        assert all(
+            source in compact.lookup[RULES_NOT_IN_STORIES]
+            for source in policy.lookup[RULES_NOT_IN_STORIES]
+        )
@@ -15,7 +15,8 @@ from rasa.core.featurizers.tracker_featurizers import MaxHistoryTrackerFeaturize
 from rasa.core.featurizers.single_state_featurizer import SingleStateFeaturizer
 from rasa.core.policies.policy import Policy as Policy
 from rasa.core.policies.ted_policy import TEDPolicy
-from rasa.engine.graph import ExecutionContext
+from rasa.engine.graph import ExecutionContext, GraphSchema, SchemaNode
+from rasa.engine.runner.dask import DaskGraphRunner, SCHEDULER_THREADS
 from rasa.engine.storage.local_model_storage import LocalModelStorage
 from rasa.engine.storage.resource import Resource
 from rasa.engine.storage.storage import ModelStorage
@@ -51,6 +52,7 @@ from rasa.utils.tensorflow.constants import (
     IDS,
     EPOCHS,
     EPOCH_OVERRIDE,
+    RANDOM_SEED,
 )
 from rasa.shared.nlu.constants import ACTION_NAME
 from rasa.utils.tensorflow import model_data_utils
@@ -98,6 +100,64 @@ def test_diagnostics(
     assert isinstance(prediction.diagnostic_data.get("attention_weights"), np.ndarray)
 
 
+@pytest.mark.timeout(300, func_only=True)
+def test_parallel_training_is_reproducible(tmp_path: Path):
+    domain = Domain.from_yaml(DOMAIN_YAML)
+    tracker = DialogueStateTracker.from_events(
+        "greet rule",
+        evts=[
+            UserUttered(intent={"name": GREET_INTENT_NAME}),
+            ActionExecuted(UTTER_GREET_ACTION),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered(intent={"name": GREET_INTENT_NAME}),
+            ActionExecuted(ACTION_LISTEN_NAME),
+        ],
+    )
+    config = {**TEDPolicy.get_default_config(), EPOCHS: 2, RANDOM_SEED: 42}
+    graph_schema = GraphSchema(
+        {
+            f"train_{index}": SchemaNode(
+                needs={"training_trackers": "trackers", "domain": "domain"},
+                uses=TEDPolicy,
+                fn="train",
+                constructor_name="create",
+                config=config,
+                is_target=True,
+            )
+            for index in range(2)
+        }
+    )
+
+    def train_in_parallel(run: int) -> List[List[float]]:
+        storage_path = tmp_path / str(run)
+        storage_path.mkdir()
+        model_storage = LocalModelStorage(storage_path)
+        execution_context = ExecutionContext(graph_schema=graph_schema, model_id="1")
+        runner = DaskGraphRunner(
+            graph_schema=graph_schema,
+            model_storage=model_storage,
+            execution_context=execution_context,
+            scheduler=SCHEDULER_THREADS,
+            max_workers=2,
+        )
+        resources = runner.run(inputs={"trackers": [tracker], "domain": domain})
+
+        predictions = []
+        for node_name in sorted(resources):
+            policy = TEDPolicy.load(
+                config, model_storage, resources[node_name], execution_context
+            )
+            prediction = policy.predict_action_probabilities(tracker, domain)
+            predictions.append(prediction.probabilities)
+        return predictions
+
+    first_run = train_in_parallel(0)
+    second_run = train_in_parallel(1)
+
+    assert np.allclose(first_run[0], first_run[1])
+    assert np.allclose(first_run, second_run)
+
+
 class TestTEDPolicy(PolicyTestCollection):
     @staticmethod
     def _policy_class_to_test() -> Type[TEDPolicy]:
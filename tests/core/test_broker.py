@@ -1,8 +1,11 @@
 import json
 import logging
 import textwrap
+import threading
+import time
 from pathlib import Path
-from typing import Union, Text, List, Optional, Type
+from unittest.mock import Mock
+from typing import Any, Dict, Union, Text, List, Optional, Type
 
 import aio_pika.exceptions
 import aiormq.exceptions
@@ -272,6 +275,213 @@ async def test_kafka_broker_from_config():
     assert actual.partition_by_sender == expected.partition_by_sender
 
 
+class FakeKafkaProducer:
+    """Stand-in for `confluent_kafka.Producer` which records the produced events."""
+
+    def __init__(self, buffer_errors: int = 0) -> None:
+        self.produced = []
+        self.flushes = 0
+        self._buffer_errors = buffer_errors
+        self._pending_callbacks = []
+
+    def produce(self, topic: Text, value: bytes, on_delivery, **kwargs) -> None:
+        if self._buffer_errors:
+            self._buffer_errors -= 1
+            raise BufferError("Local: Queue full")
+        self.produced.append(json.loads(value))
+        self._pending_callbacks.append(on_delivery)
+
+    def poll(self, timeout: float = 0) -> int:
+        callbacks, self._pending_callbacks = self._pending_callbacks, []
+        for callback in callbacks:
+            callback(None, Mock())
+        return len(callbacks)
+
+    def flush(self, timeout: float = 0) -> int:
+        self.flushes += 1
+        self.poll()
+        return 0
+
+    def list_topics(self, timeout: float = 0) -> None:
+        pass
+
+
+def _kafka_broker_with_fake_producer(
+    monkeypatch: MonkeyPatch, producer: FakeKafkaProducer, **kwargs: Any
+) -> KafkaEventBroker:
+    broker = KafkaEventBroker("localhost", topic="topic", **kwargs)
+    monkeypatch.setattr(broker, "_create_producer", lambda: producer)
+    return broker
+
+
+def test_kafka_broker_publishes_events_in_order(monkeypatch: MonkeyPatch):
+    producer = FakeKafkaProducer()
+    broker = _kafka_broker_with_fake_producer(
+        monkeypatch, producer, publish_batch_size=3
+    )
+
+    events = [{"event": "user", "text": str(i)} for i in range(10)]
+    for event in events:
+        broker.publish(event)
+    broker._close()
+
+    assert producer.produced == events
+    assert broker.queue_depth == 0
+    assert broker.delivered_events == len(events)
+    assert broker.average_delivery_latency >= 0
+    assert broker.max_delivery_latency >= broker.average_delivery_latency
+
+
+def test_kafka_broker_retries_on_buffer_error(monkeypatch: MonkeyPatch):
+    producer = FakeKafkaProducer(buffer_errors=2)
+    broker = _kafka_broker_with_fake_producer(monkeypatch, producer)
+
+    broker.publish({"event": "user", "text": "hello"}, retries=3)
+    broker._close()
+
+    assert producer.produced == [{"event": "user", "text": "hello"}]
+    assert broker.failed_deliveries == 0
+
+
+def test_kafka_broker_gives_up_after_retries(monkeypatch: MonkeyPatch):
+    producer = FakeKafkaProducer(buffer_errors=2)
+    broker = _kafka_broker_with_fake_producer(monkeypatch, producer)
+
+    broker.publish({"event": "user", "text": "hello"}, retries=2)
+    broker.publish({"event": "user", "text": "bye"}, retries=2)
+    broker._close()
+
+    assert producer.produced == [{"event": "user", "text": "bye"}]
+    assert broker.failed_deliveries == 1
+
+
+async def test_kafka_broker_close_publishes_pending_events(
+    monkeypatch: MonkeyPatch,
+):
+    producer = FakeKafkaProducer()
+    broker = _kafka_broker_with_fake_producer(monkeypatch, producer)
+
+    events = [{"event": "user", "text": str(i)} for i in range(250)]
+    for event in events:
+        broker.publish(event)
+    await broker.close()
+
+    assert producer.produced == events
+    assert producer.flushes >= 1
+    assert broker.delivered_events == len(events)
+
+
+@pytest.mark.parametrize(
+    "overflow_policy, expected_texts",
+    [("drop_newest", ["0", "1"]), ("drop_oldest", ["2", "3"])],
+)
+def test_kafka_broker_drops_events_if_queue_is_full(
+    monkeypatch: MonkeyPatch, overflow_policy: Text, expected_texts: List[Text]
+):
+    producer = FakeKafkaProducer()
+    broker = _kafka_broker_with_fake_producer(
+        monkeypatch, producer, max_pending_events=2, overflow_policy=overflow_policy
+    )
+    # prevent the publishing thread from taking events off the queue
+    monkeypatch.setattr(broker, "_publishing_thread", Mock())
+
+    for i in range(4):
+        broker.publish({"event": "user", "text": str(i)})
+
+    assert broker.queue_depth == 2
+    assert broker.dropped_events == 2
+    assert [
+        pending_event.event["text"] for pending_event in broker._pending_events
+    ] == expected_texts
+
+
+class StalledKafkaProducer(FakeKafkaProducer):
+    """Stand-in for a producer which can't reach Kafka until it's released."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.released = threading.Event()
+
+    def produce(self, *args: Any, **kwargs: Any) -> None:
+        self.released.wait()
+        super().produce(*args, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "overflow_kwargs",
+    [{}, {"overflow_policy": "block", "block_timeout_in_seconds": 0.01}],
+)
+def test_kafka_broker_publish_returns_if_kafka_is_stalled(
+    monkeypatch: MonkeyPatch, overflow_kwargs: Dict[Text, Any]
+):
+    producer = StalledKafkaProducer()
+    broker = _kafka_broker_with_fake_producer(
+        monkeypatch, producer, max_pending_events=2, **overflow_kwargs
+    )
+
+    start = time.monotonic()
+    for i in range(10):
+        broker.publish({"event": "user", "text": str(i)})
+
+    assert time.monotonic() - start < 5
+    # at most two events are pending and two are taken by the publishing thread
+    assert broker.dropped_events >= 6
+
+    producer.released.set()
+    broker._close()
+
+    assert broker.dropped_events + len(producer.produced) == 10
+
+
+class FlushFailingKafkaProducer(FakeKafkaProducer):
+    """Stand-in for a producer which can't reach any broker during the first flush."""
+
+    def flush(self, timeout: float = 0) -> int:
+        self.flushes += 1
+        if self.flushes == 1:
+            raise confluent_kafka.KafkaException(
+                confluent_kafka.KafkaError(confluent_kafka.KafkaError._ALL_BROKERS_DOWN)
+            )
+        return super().flush(timeout)
+
+
+def test_kafka_broker_keeps_publishing_if_flush_fails(monkeypatch: MonkeyPatch):
+    producer = FlushFailingKafkaProducer()
+    broker = _kafka_broker_with_fake_producer(
+        monkeypatch, producer, publish_batch_size=3
+    )
+
+    # the publishing thread takes the events in batches once they were all added
+    with broker._condition:
+        for i in range(4):
+            broker.publish({"event": "user", "text": str(i)})
+    broker._close()
+
+    assert len(producer.produced) == 4
+    # the events of the first batch are only counted once
+    assert broker.failed_deliveries == 3
+    assert broker.delivered_events == 1
+
+
+def test_kafka_broker_restarts_publishing_thread(monkeypatch: MonkeyPatch):
+    producer = FakeKafkaProducer()
+    broker = _kafka_broker_with_fake_producer(monkeypatch, producer)
+    stopped_thread = threading.Thread(target=lambda: None)
+    stopped_thread.start()
+    stopped_thread.join()
+    monkeypatch.setattr(broker, "_publishing_thread", stopped_thread)
+
+    broker.publish({"event": "user", "text": "hello"})
+    broker._close()
+
+    assert producer.produced == [{"event": "user", "text": "hello"}]
+
+
+def test_kafka_broker_invalid_overflow_policy():
+    with pytest.raises(ValueError):
+        KafkaEventBroker("localhost", topic="topic", overflow_policy="ignore")
+
+
 @pytest.mark.parametrize(
     "file,exception",
     [
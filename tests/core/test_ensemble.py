@@ -57,6 +57,45 @@ def test_default_predict_ignores_other_kwargs(
     assert final_prediction.policy_name == prediction.policy_name
 
 
+def test_default_predict_for_multiple_trackers(
+    default_ensemble: DefaultPolicyPredictionEnsemble,
+):
+    domain = Domain.load("data/test_domains/default.yml")
+    trackers = [
+        DialogueStateTracker.from_events(sender_id=sender_id, evts=[])
+        for sender_id in ["first", "second"]
+    ]
+
+    final_predictions = default_ensemble.combine_predictions_for_trackers_from_kwargs(
+        domain=domain,
+        trackers=trackers,
+        **{
+            "policy-1": [
+                PolicyPrediction(
+                    policy_name="policy-1", probabilities=[1.0], policy_priority=1
+                ),
+                PolicyPrediction(
+                    policy_name="policy-1", probabilities=[0.1], policy_priority=1
+                ),
+            ],
+            "policy-2": [
+                PolicyPrediction(
+                    policy_name="policy-2", probabilities=[0.5], policy_priority=1
+                ),
+                PolicyPrediction(
+                    policy_name="policy-2", probabilities=[0.5], policy_priority=1
+                ),
+            ],
+            "another-random-component": domain,
+        },
+    )
+
+    assert [prediction.policy_name for prediction in final_predictions] == [
+        "policy-1",
+        "policy-2",
+    ]
+
+
 def test_default_predict_excludes_rejected_action(
     default_ensemble: DefaultPolicyPredictionEnsemble,
 ):
@@ -3,9 +3,10 @@ import logging
 import sys
 import time
 from pathlib import Path
-from typing import Text
+from typing import Optional, Text
 from unittest.mock import Mock, patch
 
+import fakeredis
 import numpy as np
 import pytest
 import rasa.core.lock_store
@@ -32,10 +33,13 @@ class FakeRedisLockStore(RedisLockStore):
 
     # skipcq: PYL-W0231
     # noinspection PyMissingConstructor
-    def __init__(self):
+    def __init__(self, server: Optional[fakeredis.FakeServer] = None):
         import fakeredis
+        import fakeredis.aioredis
 
-        self.red = fakeredis.FakeStrictRedis()
+        server = server or fakeredis.FakeServer()
+        self.red = fakeredis.FakeStrictRedis(server=server)
+        self.async_red = fakeredis.aioredis.FakeRedis(server=server)
 
         # added in redis==3.3.0, but not yet in fakeredis
         self.red.connection_pool.connection_class.health_check_interval = 0
@@ -335,8 +339,8 @@ async def test_redis_lock_store_timeout(monkeypatch: MonkeyPatch):
 
     lock_store = FakeRedisLockStore()
     monkeypatch.setattr(
-        lock_store,
-        lock_store.get_or_create_lock.__name__,
+        lock_store.red,
+        lock_store.red.transaction.__name__,
         Mock(side_effect=redis.exceptions.TimeoutError),
     )
 
@@ -355,8 +359,8 @@ async def test_redis_lock_store_with_invalid_prefix(monkeypatch: MonkeyPatch):
     assert lock_store.key_prefix == DEFAULT_REDIS_LOCK_STORE_KEY_PREFIX
 
     monkeypatch.setattr(
-        lock_store,
-        lock_store.get_or_create_lock.__name__,
+        lock_store.red,
+        lock_store.red.transaction.__name__,
         Mock(side_effect=redis.exceptions.TimeoutError),
     )
 
@@ -375,8 +379,8 @@ async def test_redis_lock_store_with_valid_prefix(monkeypatch: MonkeyPatch):
     assert lock_store.key_prefix == prefix + ":" + DEFAULT_REDIS_LOCK_STORE_KEY_PREFIX
 
     monkeypatch.setattr(
-        lock_store,
-        lock_store.get_or_create_lock.__name__,
+        lock_store.red,
+        lock_store.red.transaction.__name__,
         Mock(side_effect=redis.exceptions.TimeoutError),
     )
 
@@ -385,6 +389,70 @@ async def test_redis_lock_store_with_valid_prefix(monkeypatch: MonkeyPatch):
             pass
 
 
+def test_redis_lock_store_retries_concurrent_update():
+    server = fakeredis.FakeServer()
+    lock_store = FakeRedisLockStore(server)
+    other_lock_store = FakeRedisLockStore(server)
+    conversation_id = "test_redis_lock_store_retries_concurrent_update"
+
+    tickets = []
+
+    def issue_ticket(lock: TicketLock) -> int:
+        if not tickets:
+            # another Rasa server issues a ticket while this one updates the lock
+            tickets.append(other_lock_store.issue_ticket(conversation_id, 10))
+        return lock.issue_ticket(10)
+
+    # noinspection PyProtectedMember
+    ticket = lock_store._update_lock(
+        conversation_id, issue_ticket, create_if_missing=True
+    )
+
+    assert tickets == [0]
+    assert ticket == 1
+    assert lock_store.get_lock(conversation_id).last_issued == 1
+
+
+def test_redis_lock_store_deletes_lock_without_tickets():
+    lock_store = FakeRedisLockStore()
+    conversation_id = "test_redis_lock_store_deletes_lock_without_tickets"
+
+    ticket_0 = lock_store.issue_ticket(conversation_id, 10)
+    ticket_1 = lock_store.issue_ticket(conversation_id, 10)
+
+    lock_store.cleanup(conversation_id, ticket_0)
+    assert lock_store.get_lock(conversation_id).now_serving == ticket_1
+
+    lock_store.cleanup(conversation_id, ticket_1)
+    assert lock_store.get_lock(conversation_id) is None
+
+
+async def test_redis_lock_store_wakes_up_waiting_tickets():
+    lock_store = FakeRedisLockStore()
+    conversation_id = "test_redis_lock_store_wakes_up_waiting_tickets"
+
+    async def locking_task() -> None:
+        # waiting tasks are notified when the lock is released instead of
+        # waiting for `wait_time_in_seconds`
+        async with lock_store.lock(conversation_id, wait_time_in_seconds=60):
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(asyncio.gather(locking_task(), locking_task()), 5)
+
+    assert lock_store.get_lock(conversation_id) is None
+
+
+async def test_redis_lock_store_subscribes_only_if_lock_is_taken():
+    lock_store = FakeRedisLockStore()
+    lock_store.async_red.pubsub = Mock(wraps=lock_store.async_red.pubsub)
+    conversation_id = "test_redis_lock_store_subscribes_only_if_lock_is_taken"
+
+    async with lock_store.lock(conversation_id):
+        pass
+
+    lock_store.async_red.pubsub.assert_not_called()
+
+
 def test_create_lock_store_from_endpoint_config(endpoints_path: Text):
     store = read_endpoint_config(endpoints_path, endpoint_type="lock_store")
     tracker_store = RedisLockStore(
@@ -0,0 +1,81 @@
+import asyncio
+from typing import List, Text
+
+import pytest
+
+from rasa.core.channels.channel import UserMessage
+from rasa.core.nlu_batching import NLUMessageBatcher
+from rasa.shared.nlu.constants import TEXT
+from rasa.shared.nlu.training_data.message import Message
+
+
+class ParseRecorder:
+    def __init__(self) -> None:
+        self.batches: List[List[Text]] = []
+
+    def __call__(self, messages: List[UserMessage]) -> List[Message]:
+        self.batches.append([message.text for message in messages])
+        return [Message({TEXT: message.text.upper()}) for message in messages]
+
+
+async def test_batcher_parses_full_batch_immediately():
+    recorder = ParseRecorder()
+    batcher = NLUMessageBatcher(recorder, max_batch_size=2, max_wait_time=10)
+
+    parsed = await asyncio.wait_for(
+        asyncio.gather(
+            batcher.parse(UserMessage("a")), batcher.parse(UserMessage("b"))
+        ),
+        timeout=1,
+    )
+
+    assert recorder.batches == [["a", "b"]]
+    assert [message.get(TEXT) for message in parsed] == ["A", "B"]
+
+
+async def test_batcher_parses_incomplete_batch_after_wait_time():
+    recorder = ParseRecorder()
+    batcher = NLUMessageBatcher(recorder, max_batch_size=3, max_wait_time=0.05)
+
+    parsed = await asyncio.gather(
+        *[batcher.parse(UserMessage(text)) for text in ["a", "b", "c", "d"]]
+    )
+
+    assert recorder.batches == [["a", "b", "c"], ["d"]]
+    assert [message.get(TEXT) for message in parsed] == ["A", "B", "C", "D"]
+
+
+async def test_batcher_passes_error_to_all_messages_of_batch():
+    def parse_messages(messages: List[UserMessage]) -> List[Message]:
+        raise ValueError("parsing failed")
+
+    batcher = NLUMessageBatcher(parse_messages, max_batch_size=2, max_wait_time=0.05)
+
+    results = await asyncio.gather(
+        batcher.parse(UserMessage("a")),
+        batcher.parse(UserMessage("b")),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+    # the batcher can still be used afterwards
+    batcher._process_batch = ParseRecorder()
+    parsed = await batcher.parse(UserMessage("c"))
+    assert parsed.get(TEXT) == "C"
+
+
+async def test_batcher_ignores_cancelled_messages():
+    recorder = ParseRecorder()
+    batcher = NLUMessageBatcher(recorder, max_batch_size=3, max_wait_time=0.05)
+
+    cancelled = asyncio.ensure_future(batcher.parse(UserMessage("a")))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    parsed = await batcher.parse(UserMessage("b"))
+
+    assert parsed.get(TEXT) == "B"
+    assert recorder.batches == [["a", "b"]]
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
@@ -194,6 +194,30 @@ class PolicyTestCollection:
             )
             assert predicted_probabilities == actual_probabilities
 
+    def test_prediction_for_multiple_trackers(
+        self, trained_policy: Policy, default_domain: Domain, stories_path: Text
+    ):
+        trackers = train_trackers(default_domain, stories_path, augmentation_factor=0)
+        trackers.append(DialogueStateTracker(DEFAULT_SENDER_ID, default_domain.slots))
+
+        batch_predictions = trained_policy.predict_action_probabilities_for_trackers(
+            trackers, default_domain
+        )
+
+        assert len(batch_predictions) == len(trackers)
+        for tracker, batch_prediction in zip(trackers, batch_predictions):
+            prediction = trained_policy.predict_action_probabilities(
+                tracker, default_domain
+            )
+            assert np.allclose(
+                batch_prediction.probabilities, prediction.probabilities, atol=1e-5
+            )
+            assert batch_prediction.policy_name == prediction.policy_name
+            assert (
+                batch_prediction.is_end_to_end_prediction
+                == prediction.is_end_to_end_prediction
+            )
+
     def test_prediction_on_empty_tracker(
         self, trained_policy: Policy, default_domain: Domain
     ):
@@ -406,6 +430,46 @@ class TestMemoizationPolicy(PolicyTestCollection):
 
         assert lookup_no_augmentation == lookup_with_augmentation
 
+    def test_compact_lookup_recalls_same_actions(
+        self,
+        trained_policy: MemoizationPolicy,
+        featurizer: TrackerFeaturizer,
+        model_storage: ModelStorage,
+        execution_context: ExecutionContext,
+        default_domain: Domain,
+        stories_path: Text,
+    ):
+        resource = Resource("compact_memoization")
+        policy = self.create_policy(
+            featurizer,
+            model_storage,
+            resource,
+            execution_context,
+            config={"use_compact_lookup": True},
+        )
+        trackers = train_trackers(default_domain, stories_path, augmentation_factor=20)
+        policy.train(trackers, default_domain)
+
+        assert not policy.lookup
+        assert len(policy.compact_lookup) == len(trained_policy.lookup)
+
+        loaded = policy.__class__.load(
+            policy.config, model_storage, resource, execution_context
+        )
+        assert loaded.compact_lookup is not None
+
+        all_states, _ = trained_policy.featurizer.training_states_and_labels(
+            trackers, default_domain
+        )
+        for states in all_states:
+            expected = trained_policy._recall_states(states)
+            assert policy._recall_states(states) == expected
+            assert loaded._recall_states(states) == expected
+
+        nums = np.random.randn(default_domain.num_states)
+        random_states = [{f: num for f, num in zip(default_domain.input_states, nums)}]
+        assert loaded._recall_states(random_states) is None
+
     def test_memorise_with_nlu(
         self, trained_policy: MemoizationPolicy, default_domain: Domain
     ):
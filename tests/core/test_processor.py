@@ -48,6 +48,7 @@ from rasa.core.channels.channel import (
     UserMessage,
     OutputChannel,
 )
+from rasa.engine.constants import PLACEHOLDER_MESSAGE
 from rasa.engine.graph import ExecutionContext
 from rasa.engine.storage.storage import ModelStorage
 from rasa.exceptions import ActionLimitReached
@@ -84,6 +85,7 @@ from rasa.shared.core.constants import (
     ACTION_LISTEN_NAME,
     ACTION_SESSION_START_NAME,
     EXTERNAL_MESSAGE_PREFIX,
+    FOLLOWUP_ACTION,
     IS_EXTERNAL,
     SESSION_START_METADATA_SLOT,
 )
@@ -247,6 +249,41 @@ async def test_http_parsing_default_response(
         }
 
 
+async def test_parsing_concurrent_messages_in_batches(
+    trained_default_agent_model: Text,
+    domain: Domain,
+    default_processor: MessageProcessor,
+):
+    processor = MessageProcessor(
+        trained_default_agent_model,
+        InMemoryTrackerStore(domain),
+        InMemoryLockStore(),
+        NaturalLanguageGenerator(),
+        nlu_batch_size=3,
+        nlu_batch_max_wait_time=0.5,
+    )
+    assert processor.nlu_batcher is not None
+
+    texts = ["hello", "I am sad", "goodbye", "hi there"]
+    with mock.patch.object(
+        processor.graph_runner, "run", wraps=processor.graph_runner.run
+    ) as run:
+        batched = await asyncio.gather(
+            *[processor.parse_message(UserMessage(text)) for text in texts]
+        )
+
+    # the first 3 messages fill a batch, the last one is parsed after the wait time
+    batch_sizes = [
+        len(call.kwargs["inputs"][PLACEHOLDER_MESSAGE]) for call in run.mock_calls
+    ]
+    assert batch_sizes == [3, 1]
+
+    for text, parse_data in zip(texts, batched):
+        expected = await default_processor.parse_message(UserMessage(text))
+        assert parse_data["text"] == text
+        assert parse_data["intent"]["name"] == expected["intent"]["name"]
+
+
 async def test_reminder_scheduled(
     default_channel: CollectingOutputChannel, default_processor: MessageProcessor
 ):
@@ -1553,6 +1590,42 @@ def test_predict_next_with_tracker_full_model(trained_rasa_model: Text):
     assert result["policy"] == "MemoizationPolicy"
 
 
+def test_predict_next_with_trackers_full_model(trained_rasa_model: Text):
+    processor = Agent.load(model_path=trained_rasa_model).processor
+    assert processor.batch_graph_runner is not None
+
+    trackers = [
+        DialogueStateTracker.from_events(
+            "some_id",
+            [
+                ActionExecuted(ACTION_LISTEN_NAME),
+                UserUttered("hi", intent={"name": "greet"}),
+            ],
+        ),
+        DialogueStateTracker("other_id", []),
+    ]
+    trackers[1].followup_action = "utter_greet"
+
+    with mock.patch.object(
+        processor.graph_runner, "run", wraps=processor.graph_runner.run
+    ) as run:
+        results = processor.predict_next_with_trackers(trackers)
+
+    # all predictions are made by the batch graph
+    run.assert_not_called()
+    assert [result["tracker"]["sender_id"] for result in results] == [
+        "some_id",
+        "other_id",
+    ]
+    assert results[1]["policy"] == FOLLOWUP_ACTION
+
+    expected = processor.predict_next_with_tracker(
+        DialogueStateTracker.from_events("some_id", trackers[0].events)
+    )
+    assert results[0]["policy"] == expected["policy"]
+    assert results[0]["confidence"] == pytest.approx(expected["confidence"])
+
+
 async def test_get_tracker_adds_model_id(default_processor: MessageProcessor):
     model_id = default_processor.model_metadata.model_id
     tracker = await default_processor.get_tracker("bloop")
@@ -0,0 +1,98 @@
+import json
+import math
+from typing import Any, Dict, Optional, Text
+
+import pytest
+
+from rasa.core.tracker_serialisation import (
+    TrackerSerialiser,
+    TrackerSerialiserException,
+)
+
+
+@pytest.fixture
+def serialised_event() -> Dict[Text, Any]:
+    return {
+        "event": "user",
+        "timestamp": 1579507733.1107571,
+        "text": "hello " * 500,
+        "parse_data": {"intent": {"name": "greet", "confidence": 0.9}},
+    }
+
+
+@pytest.mark.parametrize("json_library", ["auto", "json"])
+@pytest.mark.parametrize("compression", [None, "zlib"])
+def test_serialisation_round_trip(
+    serialised_event: Dict[Text, Any], json_library: Text, compression: Optional[Text]
+):
+    serialiser = TrackerSerialiser(json_library=json_library, compression=compression)
+
+    assert serialiser.loads(serialiser.dumps(serialised_event)) == serialised_event
+
+
+def test_large_values_are_compressed(serialised_event: Dict[Text, Any]):
+    serialiser = TrackerSerialiser(compression="zlib", compression_threshold=1024)
+
+    serialised = serialiser.dumps(serialised_event)
+
+    assert serialised.startswith("zlib:")
+    assert len(serialised) < len(json.dumps(serialised_event))
+
+
+def test_small_values_are_not_compressed():
+    serialiser = TrackerSerialiser(compression="zlib", compression_threshold=1024)
+    serialised_event = {"event": "action", "name": "action_listen"}
+
+    serialised = serialiser.dumps(serialised_event)
+
+    assert json.loads(serialised) == serialised_event
+
+
+def test_load_values_which_were_serialised_differently(
+    serialised_event: Dict[Text, Any]
+):
+    compressing_serialiser = TrackerSerialiser(
+        compression="zlib", compression_threshold=0
+    )
+    serialiser = TrackerSerialiser()
+    stdlib_serialised = json.dumps(serialised_event)
+
+    # values which were stored with stdlib `json` or with a different compression
+    # configuration can still be read
+    assert compressing_serialiser.loads(stdlib_serialised) == serialised_event
+    assert compressing_serialiser.loads(stdlib_serialised.encode()) == serialised_event
+
+    compressed = compressing_serialiser.dumps(serialised_event)
+    assert serialiser.loads(compressed) == serialised_event
+
+
+def test_values_which_fast_libraries_do_not_support():
+    serialiser = TrackerSerialiser()
+    obj = {1: 2**70}
+
+    assert serialiser.loads(serialiser.dumps(obj)) == {"1": 2**70}
+
+
+@pytest.mark.parametrize("json_library", ["json", "orjson", "msgspec"])
+def test_non_finite_floats_round_trip(json_library: Text):
+    pytest.importorskip(json_library)
+    serialiser = TrackerSerialiser(json_library=json_library)
+    obj = {"slot": float("nan"), "values": [float("inf"), -float("inf")], "none": None}
+
+    loaded = serialiser.loads(serialiser.dumps(obj))
+
+    assert math.isnan(loaded["slot"])
+    assert loaded["values"] == [float("inf"), -float("inf")]
+    assert loaded["none"] is None
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"json_library": "simplejson"},
+        {"compression": "gzip"},
+    ],
+)
+def test_invalid_serialisation_config(config: Dict[Text, Any]):
+    with pytest.raises(TrackerSerialiserException):
+        TrackerSerialiser.from_config(config)
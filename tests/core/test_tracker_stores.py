@@ -1,6 +1,7 @@
 # file deepcode ignore NoHardcodedCredentials/test: Secrets are all just examples for tests. # noqa: E501
 
 import logging
+import time
 import warnings
 from collections import deque
 from contextlib import contextmanager
@@ -50,10 +51,14 @@ from rasa.core.tracker_store import (
     InMemoryTrackerStore,
     RedisTrackerStore,
     DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX,
+    MONGO_TRACKER_NUMBER_OF_EVENTS,
+    MONGO_TRACKER_SESSION_START,
     SQLTrackerStore,
+    AsyncSQLTrackerStore,
     DynamoTrackerStore,
     FailSafeTrackerStore,
     AwaitableTrackerStore,
+    CachedTrackerStore,
 )
 from rasa.shared.core.trackers import DialogueStateTracker, TrackerEventDiffEngine
 from rasa.shared.nlu.training_data.message import Message
@@ -110,6 +115,57 @@ async def test_dynamo_tracker_floats():
     assert retrieved_timestamp == timestamp
 
 
+async def test_dynamo_tracker_store_retrieve_latest_session(
+    tracker_with_restarted_event: DialogueStateTracker,
+    events_after_restart: List[Event],
+):
+    with mock_dynamodb():
+        tracker_store = DynamoTrackerStore(test_domain)
+        sender_id = tracker_with_restarted_event.sender_id
+
+        await tracker_store.save(tracker_with_restarted_event)
+
+        tracker = await tracker_store.retrieve(sender_id)
+        assert list(tracker.events) == events_after_restart[1:]
+
+        tracker.update(UserUttered("hi again"))
+        await tracker_store.save(tracker)
+
+        tracker = await tracker_store.retrieve(sender_id)
+        assert list(tracker.events) == events_after_restart[1:] + [
+            UserUttered("hi again")
+        ]
+
+        # new events are appended to the conversation
+        tracker = await tracker_store.retrieve_full_tracker(sender_id)
+        assert list(tracker.events) == list(tracker_with_restarted_event.events) + [
+            UserUttered("hi again")
+        ]
+
+
+async def test_dynamo_tracker_store_replaces_events(
+    tracker_with_restarted_event: DialogueStateTracker,
+):
+    with mock_dynamodb():
+        tracker_store = DynamoTrackerStore(test_domain)
+        sender_id = tracker_with_restarted_event.sender_id
+        await tracker_store.save(tracker_with_restarted_event)
+
+        # e.g. `PUT /conversations/<conversation_id>/tracker/events`
+        new_events = [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("replaced"),
+        ]
+        await tracker_store.save(
+            DialogueStateTracker.from_events(sender_id, new_events)
+        )
+
+        tracker = await tracker_store.retrieve(sender_id)
+        assert list(tracker.events) == new_events
+        tracker = await tracker_store.retrieve_full_tracker(sender_id)
+        assert list(tracker.events) == new_events
+
+
 async def test_restart_after_retrieval_from_tracker_store(domain: Domain):
     store = InMemoryTrackerStore(domain)
     tr = await store.get_or_create_tracker("myuser")
@@ -335,6 +391,19 @@ async def test_tracker_serialisation():
     assert tracker == store.deserialise_tracker(DEFAULT_SENDER_ID, serialised)
 
 
+async def test_tracker_store_with_compressed_serialisation(domain: Domain):
+    store = InMemoryTrackerStore(
+        domain, serialisation={"compression": "zlib", "compression_threshold": 0}
+    )
+    tracker = await store.get_or_create_tracker(DEFAULT_SENDER_ID)
+    tracker.update(UserUttered("hello"))
+
+    await store.save(tracker)
+
+    assert store.store[DEFAULT_SENDER_ID].startswith("zlib:")
+    assert await store.retrieve(DEFAULT_SENDER_ID) == tracker
+
+
 @pytest.mark.parametrize(
     "full_url",
     [
@@ -524,6 +593,127 @@ def test_set_fail_safe_tracker_store_domain(domain: Domain):
     assert fallback_tracker_store.domain is failsafe_store.domain
 
 
+async def test_cached_tracker_store_returns_cached_tracker(domain: Domain):
+    wrapped_tracker_store = MockedRedisTrackerStore(domain)
+    tracker_store = CachedTrackerStore(wrapped_tracker_store)
+
+    tracker = await tracker_store.get_or_create_tracker("some-id")
+    wrapped_tracker_store.retrieve = AsyncMock()
+
+    assert await tracker_store.retrieve("some-id") is tracker
+    assert await tracker_store.retrieve("some-id") is tracker
+    wrapped_tracker_store.retrieve.assert_not_called()
+    assert tracker_store.hits == 2
+
+
+async def test_cached_tracker_store_detects_outdated_tracker(domain: Domain):
+    wrapped_tracker_store = MockedRedisTrackerStore(domain)
+    tracker_store = CachedTrackerStore(wrapped_tracker_store)
+    tracker = await tracker_store.get_or_create_tracker("some-id")
+
+    # another worker saves the conversation
+    other_worker_tracker_store = MockedRedisTrackerStore(domain)
+    other_worker_tracker_store.red = wrapped_tracker_store.red
+    other_tracker = await other_worker_tracker_store.retrieve("some-id")
+    other_tracker.update(UserUttered("hi"))
+    await other_worker_tracker_store.save(other_tracker)
+
+    retrieved = await tracker_store.retrieve("some-id")
+
+    assert retrieved is not tracker
+    assert list(retrieved.events) == list(other_tracker.events)
+    assert tracker_store.misses == 2
+
+
+async def test_cached_tracker_store_ignores_unsaved_changes(domain: Domain):
+    tracker_store = CachedTrackerStore(MockedRedisTrackerStore(domain))
+    tracker = await tracker_store.get_or_create_tracker("some-id")
+    tracker.update(UserUttered("hi"))
+
+    retrieved = await tracker_store.retrieve("some-id")
+
+    assert retrieved is not tracker
+    assert len(retrieved.events) == len(tracker.events) - 1
+
+
+async def test_cached_tracker_store_evicts_least_recently_used(domain: Domain):
+    tracker_store = CachedTrackerStore(MockedRedisTrackerStore(domain), max_size=2)
+    first = await tracker_store.get_or_create_tracker("first")
+    await tracker_store.get_or_create_tracker("second")
+    await tracker_store.retrieve("first")
+    await tracker_store.get_or_create_tracker("third")
+
+    assert tracker_store.size == 2
+    assert await tracker_store.retrieve("first") is first
+    assert tracker_store.hits == 2
+
+    await tracker_store.retrieve("second")
+    assert tracker_store.misses == 4
+
+
+async def test_cached_tracker_store_expires_trackers(
+    domain: Domain, monkeypatch: MonkeyPatch
+):
+    tracker_store = CachedTrackerStore(MockedRedisTrackerStore(domain), ttl=10)
+    tracker = await tracker_store.get_or_create_tracker("some-id")
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 11)
+
+    assert await tracker_store.retrieve("some-id") is not tracker
+
+
+async def test_cached_tracker_store_requires_ttl_if_events_are_not_counted(
+    domain: Domain,
+):
+    tracker_store = CachedTrackerStore(InMemoryTrackerStore(domain))
+
+    with pytest.warns(UserWarning, match="ttl"):
+        tracker = await tracker_store.get_or_create_tracker("some-id")
+
+    assert tracker_store.size == 0
+    assert await tracker_store.retrieve("some-id") is not tracker
+
+    tracker_store = CachedTrackerStore(InMemoryTrackerStore(domain), ttl=10)
+    tracker = await tracker_store.get_or_create_tracker("some-id")
+
+    assert await tracker_store.retrieve("some-id") is tracker
+
+
+async def test_cached_tracker_store_counts_saved_events_without_query(
+    domain: Domain,
+):
+    wrapped_tracker_store = MockedRedisTrackerStore(domain)
+    number_of_stored_events = wrapped_tracker_store.number_of_stored_events
+    tracker_store = CachedTrackerStore(wrapped_tracker_store)
+    tracker = await tracker_store.get_or_create_tracker("some-id")
+    tracker = await tracker_store.retrieve("some-id")
+    tracker.update(UserUttered("hi"))
+
+    wrapped_tracker_store.number_of_stored_events = AsyncMock()
+    await tracker_store.save(tracker)
+    wrapped_tracker_store.number_of_stored_events.assert_not_called()
+
+    wrapped_tracker_store.number_of_stored_events = number_of_stored_events
+    assert await tracker_store.retrieve("some-id") is tracker
+    assert tracker_store.hits == 2
+
+
+def test_create_cached_tracker_store_from_endpoint_config(
+    domain: Domain, tmp_path: Path
+):
+    endpoint_config = EndpointConfig(
+        type="sql", db=str(tmp_path / "rasa.db"), cache={"max_size": 5}
+    )
+    tracker_store = rasa.core.tracker_store.create_tracker_store(
+        endpoint_config, domain
+    )
+
+    assert isinstance(tracker_store, CachedTrackerStore)
+    assert tracker_store._max_size == 5
+    assert endpoint_config.kwargs["cache"] == {"max_size": 5}
+
+
 async def create_tracker_with_partially_saved_events(
     tracker_store: TrackerStore,
 ) -> Tuple[List[Event], DialogueStateTracker]:
@@ -617,6 +807,133 @@ async def test_sql_additional_events_with_session_start(domain: Domain):
         assert isinstance(additional_events[0], UserUttered)
 
 
+async def test_sql_save_uses_number_of_persisted_events(
+    domain: Domain, monkeypatch: MonkeyPatch
+):
+    sender = "test_sql_save_uses_number_of_persisted_events"
+    tracker_store = SQLTrackerStore(domain)
+    tracker = await _saved_tracker_with_multiple_session_starts(tracker_store, sender)
+    assert tracker.number_of_persisted_events == len(tracker.events)
+
+    # the stored events must not be counted in the database
+    monkeypatch.setattr(
+        tracker_store, "_event_query", Mock(side_effect=AssertionError())
+    )
+
+    new_events = [UserUttered("hi2"), BotUttered("hey"), ActionExecuted("utter_hey")]
+    for event in new_events:
+        tracker.update(event, domain)
+    await tracker_store.save(tracker)
+
+    assert tracker.number_of_persisted_events == len(tracker.events)
+
+    monkeypatch.undo()
+    retrieved = await tracker_store.retrieve(sender)
+    assert list(retrieved.events) == list(tracker.events)
+
+
+async def test_async_sql_tracker_store_save_and_retrieve(
+    domain: Domain, tmp_path: Path, tracker_with_restarted_event: DialogueStateTracker
+):
+    pytest.importorskip("aiosqlite")
+
+    tracker_store = AsyncSQLTrackerStore(domain, db=str(tmp_path / "rasa.db"))
+    sender_id = tracker_with_restarted_event.sender_id
+    await tracker_store.save(tracker_with_restarted_event)
+
+    tracker = await tracker_store.retrieve(sender_id)
+    assert list(tracker.events) == list(tracker_with_restarted_event.events)[10:]
+    assert tracker.number_of_persisted_events == len(tracker.events)
+
+    tracker.update(UserUttered("hi again"), domain)
+    await tracker_store.save(tracker)
+
+    full_tracker = await tracker_store.retrieve_full_tracker(sender_id)
+    assert list(full_tracker.events) == list(tracker_with_restarted_event.events) + [
+        tracker.events[-1]
+    ]
+    assert list(await tracker_store.keys()) == [sender_id]
+    assert await tracker_store.retrieve("unknown") is None
+
+    await tracker_store.engine.dispose()
+
+
+async def test_async_sql_tracker_store_shares_table_with_sql_tracker_store(
+    domain: Domain, tmp_path: Path, tracker_with_restarted_event: DialogueStateTracker
+):
+    pytest.importorskip("aiosqlite")
+
+    db = str(tmp_path / "rasa.db")
+    await SQLTrackerStore(domain, db=db).save(tracker_with_restarted_event)
+
+    tracker_store = AsyncSQLTrackerStore(domain, db=db)
+    tracker = await tracker_store.retrieve_full_tracker(
+        tracker_with_restarted_event.sender_id
+    )
+
+    assert tracker == tracker_with_restarted_event
+
+    await tracker_store.engine.dispose()
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({"dialect": "sqlite", "db": "rasa.db"}, "sqlite+aiosqlite:///rasa.db"),
+        (
+            {"dialect": "postgresql", "host": "localhost", "db": "rasa"},
+            "postgresql+asyncpg://localhost/rasa",
+        ),
+        (
+            {"host": "postgresql+asyncpg://localhost:5432/rasa"},
+            "postgresql+asyncpg://localhost:5432/rasa",
+        ),
+    ],
+)
+def test_async_sql_tracker_store_get_db_url(kwargs: Dict[Text, Any], expected: Text):
+    assert str(AsyncSQLTrackerStore.get_db_url(**kwargs)) == expected
+
+
+def test_async_sql_tracker_store_get_db_url_with_unsupported_dialect():
+    with pytest.raises(RasaException):
+        AsyncSQLTrackerStore.get_db_url(dialect="oracle", host="localhost")
+
+
+def test_async_sql_tracker_store_engine_kwargs():
+    url = AsyncSQLTrackerStore.get_db_url(dialect="postgresql", host="localhost")
+
+    kwargs = AsyncSQLTrackerStore._create_engine_kwargs(
+        url,
+        pool_size=5,
+        max_overflow=2,
+        statement_timeout=1.5,
+        prepared_statement_cache_size=0,
+    )
+
+    assert kwargs["pool_size"] == 5
+    assert kwargs["max_overflow"] == 2
+    assert kwargs["connect_args"] == {
+        "server_settings": {"statement_timeout": "1500"},
+        "prepared_statement_cache_size": 0,
+    }
+
+
+def test_create_async_sql_tracker_store_from_endpoint_config(
+    domain: Domain, tmp_path: Path
+):
+    pytest.importorskip("aiosqlite")
+
+    endpoint_config = EndpointConfig(
+        type="async_sql", dialect="sqlite", db=str(tmp_path / "rasa.db")
+    )
+    tracker_store = rasa.core.tracker_store.create_tracker_store(
+        endpoint_config, domain
+    )
+
+    assert isinstance(tracker_store, AsyncSQLTrackerStore)
+    assert rasa.core.tracker_store.check_if_tracker_store_async(tracker_store)
+
+
 @pytest.mark.parametrize(
     "tracker_store_type,tracker_store_kwargs",
     [(MockedMongoTrackerStore, {}), (SQLTrackerStore, {"host": "sqlite:///"})],
@@ -1162,6 +1479,66 @@ async def test_mongo_tracker_store_retrieve(
     assert list(tracker.events) == events_after_restart[1:]
 
 
+async def test_mongo_tracker_store_stores_latest_session_start(
+    domain: Domain,
+    tracker_with_restarted_event: DialogueStateTracker,
+    events_after_restart: List[Event],
+) -> None:
+    tracker_store = MockedMongoTrackerStore(domain)
+    sender_id = tracker_with_restarted_event.sender_id
+
+    await tracker_store.save(tracker_with_restarted_event)
+
+    tracker = await tracker_store.retrieve(sender_id)
+    tracker.update(UserUttered("hi again"))
+    await tracker_store.save(tracker)
+
+    stored = tracker_store.conversations.find_one({"sender_id": sender_id})
+    number_of_events = len(tracker_with_restarted_event.events) + 1
+    assert stored[MONGO_TRACKER_NUMBER_OF_EVENTS] == number_of_events
+    # the latest session starts with the `session_started` event
+    assert stored[MONGO_TRACKER_SESSION_START] == number_of_events - len(
+        events_after_restart
+    )
+    assert await tracker_store.number_of_stored_events(sender_id) == number_of_events
+
+    # the projection only fetches the events of the latest session
+    tracker = await tracker_store.retrieve(sender_id)
+    assert list(tracker.events) == events_after_restart[1:] + [UserUttered("hi again")]
+
+    tracker = await tracker_store.retrieve_full_tracker(sender_id)
+    assert len(tracker.events) == number_of_events
+
+
+async def test_mongo_tracker_store_with_conversation_without_session_start(
+    domain: Domain,
+    tracker_with_restarted_event: DialogueStateTracker,
+    events_after_restart: List[Event],
+) -> None:
+    tracker_store = MockedMongoTrackerStore(domain)
+    sender_id = tracker_with_restarted_event.sender_id
+
+    # conversation stored by a previous Rasa version
+    tracker_store.conversations.insert_one(
+        {
+            "sender_id": sender_id,
+            "events": [e.as_dict() for e in tracker_with_restarted_event.events],
+        }
+    )
+
+    tracker = await tracker_store.retrieve(sender_id)
+    assert list(tracker.events) == events_after_restart[1:]
+
+    tracker.update(UserUttered("hi again"))
+    await tracker_store.save(tracker)
+
+    tracker = await tracker_store.retrieve(sender_id)
+    assert list(tracker.events) == events_after_restart[1:] + [UserUttered("hi again")]
+
+    tracker = await tracker_store.retrieve_full_tracker(sender_id)
+    assert len(tracker.events) == len(tracker_with_restarted_event.events) + 1
+
+
 class MockedRedisTrackerStore(RedisTrackerStore):
     def __init__(
         self,
@@ -1200,6 +1577,99 @@ async def test_redis_tracker_store_retrieve(
     assert list(tracker.events) == events_after_restart
 
 
+async def test_redis_tracker_store_save_appends_new_events(
+    domain: Domain,
+    tracker_with_restarted_event: DialogueStateTracker,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    tracker_store = MockedRedisTrackerStore(domain)
+    sender_id = tracker_with_restarted_event.sender_id
+    await tracker_store.save(tracker_with_restarted_event)
+
+    # saving must not load the stored conversation
+    monkeypatch.setattr(
+        tracker_store, "deserialise_tracker", Mock(side_effect=AssertionError())
+    )
+
+    tracker = await tracker_store.retrieve(sender_id)
+    new_events = [ActionExecuted("utter_greet"), ActionExecuted(ACTION_LISTEN_NAME)]
+    tracker.update_with_events(new_events, domain)
+    await tracker_store.save(tracker)
+
+    number_of_events = len(tracker_with_restarted_event.events) + len(new_events)
+    assert (
+        tracker_store.red.llen(tracker_store._events_key(sender_id)) == number_of_events
+    )
+
+    full_tracker = await tracker_store.retrieve_full_tracker(sender_id)
+    assert list(full_tracker.events) == (
+        list(tracker_with_restarted_event.events) + new_events
+    )
+    assert list((await tracker_store.retrieve(sender_id)).events) == list(
+        tracker.events
+    )
+
+
+async def test_redis_tracker_store_save_merges_diverging_tracker(
+    domain: Domain,
+    tracker_with_restarted_event: DialogueStateTracker,
+    events_after_restart: List[Event],
+) -> None:
+    tracker_store = MockedRedisTrackerStore(domain)
+    sender_id = tracker_with_restarted_event.sender_id
+    await tracker_store.save(tracker_with_restarted_event)
+
+    new_event = UserUttered("hi again", timestamp=14)
+    tracker = DialogueStateTracker.from_events(
+        sender_id, evts=events_after_restart[1:] + [new_event]
+    )
+    await tracker_store.save(tracker)
+
+    full_tracker = await tracker_store.retrieve_full_tracker(sender_id)
+    assert list(full_tracker.events) == list(tracker_with_restarted_event.events) + [
+        new_event
+    ]
+
+
+async def test_redis_tracker_store_migrates_serialised_tracker(
+    domain: Domain,
+    tracker_with_restarted_event: DialogueStateTracker,
+    events_after_restart: List[Event],
+) -> None:
+    tracker_store = MockedRedisTrackerStore(domain)
+    sender_id = tracker_with_restarted_event.sender_id
+    tracker_store.red.set(
+        tracker_store.key_prefix + sender_id,
+        tracker_store.serialise_tracker(tracker_with_restarted_event),
+    )
+
+    tracker = await tracker_store.retrieve(sender_id)
+
+    assert list(tracker.events) == events_after_restart
+    assert tracker_store.red.type(tracker_store.key_prefix + sender_id) == b"hash"
+
+
+def test_redis_tracker_store_migrate_serialised_trackers(
+    domain: Domain, tracker_with_restarted_event: DialogueStateTracker
+) -> None:
+    tracker_store = MockedRedisTrackerStore(domain)
+    for sender_id in ["first", "second"]:
+        tracker_store.red.set(
+            tracker_store.key_prefix + sender_id,
+            tracker_store.serialise_tracker(tracker_with_restarted_event),
+            ex=100,
+        )
+
+    assert tracker_store.migrate_serialised_trackers() == 2
+    assert tracker_store.migrate_serialised_trackers() == 0
+
+    for sender_id in ["first", "second"]:
+        assert tracker_store.red.llen(tracker_store._events_key(sender_id)) == len(
+            tracker_with_restarted_event.events
+        )
+        assert 0 < tracker_store.red.ttl(tracker_store._events_key(sender_id)) <= 100
+
+
 async def test_redis_tracker_store_merge_trackers_same_session() -> None:
     start_session_sequence = [
         ActionExecuted(ACTION_SESSION_START_NAME),
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+import time
 from pathlib import Path
 from typing import Dict, Optional, Text, Any, List
 
@@ -47,6 +49,9 @@ class SubtractByX(GraphComponent):
     def subtract_x(self, i: Any) -> int:
         return int(i) - self._x
 
+    def subtract_x_from_all(self, inputs: List[Any]) -> List[int]:
+        return [self.subtract_x(i) for i in inputs]
+
 
 class AssertComponent(GraphComponent):
     def __init__(self, value_to_assert: Any) -> None:
@@ -104,6 +109,57 @@ class ProvideX(GraphComponent):
         return self.x
 
 
+class WaitForOtherNode(GraphComponent):
+    """Waits until the node of another instance runs at the same time."""
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    @classmethod
+    def create(
+        cls,
+        config: Dict,
+        model_storage: ModelStorage,
+        resource: Resource,
+        execution_context: ExecutionContext,
+    ) -> WaitForOtherNode:
+        return cls()
+
+    def wait(self) -> int:
+        return self.barrier.wait()
+
+
+class ThreadUnsafeComponent(GraphComponent):
+    """Records how many of its nodes run at the same time."""
+
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    @staticmethod
+    def is_thread_safe() -> bool:
+        return False
+
+    @classmethod
+    def create(
+        cls,
+        config: Dict,
+        model_storage: ModelStorage,
+        resource: Resource,
+        execution_context: ExecutionContext,
+    ) -> ThreadUnsafeComponent:
+        return cls()
+
+    def run(self) -> int:
+        cls = self.__class__
+        with cls.lock:
+            cls.running += 1
+            cls.max_running = max(cls.max_running, cls.running)
+        time.sleep(0.1)
+        with cls.lock:
+            cls.running -= 1
+        return cls.max_running
+
+
 class FileReader(GraphComponent):
     def __init__(self, file_path: Path) -> None:
         self._file_path = file_path
@@ -1,11 +1,21 @@
 from __future__ import annotations
-from typing import Optional
+import dataclasses
+import logging
+from typing import Optional, Text
+from unittest.mock import Mock
 
 import pytest
+from _pytest.logging import LogCaptureFixture
+from _pytest.monkeypatch import MonkeyPatch
 
 from rasa.engine.graph import ExecutionContext, GraphSchema, SchemaNode
 from rasa.engine.exceptions import GraphRunError
-from rasa.engine.runner.dask import DaskGraphRunner
+from rasa.engine.runner.dask import (
+    GRAPH_SCHEDULER_ENV,
+    SCHEDULER_SYNC,
+    SCHEDULER_THREADS,
+    DaskGraphRunner,
+)
 from rasa.engine.storage.storage import ModelStorage
 from tests.engine.graph_components_test_classes import (
     AddInputs,
@@ -14,6 +24,8 @@ from tests.engine.graph_components_test_classes import (
     ProvideX,
     SubtractByX,
     PersistableTestComponent,
+    ThreadUnsafeComponent,
+    WaitForOtherNode,
 )
 
 
@@ -326,3 +338,252 @@ def test_loading_from_previous_node(default_model_storage: ModelStorage):
     results = runner.run()
 
     assert results["load"] == test_value
+
+
+def test_graph_variant_shares_components(default_model_storage: ModelStorage):
+    graph_schema = GraphSchema(
+        {
+            "subtract": SchemaNode(
+                needs={"i": "input"},
+                uses=SubtractByX,
+                fn="subtract_x",
+                constructor_name="create",
+                config={"x": 2},
+                eager=True,
+                is_target=True,
+            )
+        }
+    )
+    runner = DaskGraphRunner(
+        graph_schema=graph_schema,
+        model_storage=default_model_storage,
+        execution_context=ExecutionContext(graph_schema=graph_schema, model_id="1"),
+    )
+
+    variant_schema = GraphSchema(
+        {
+            "subtract": dataclasses.replace(
+                graph_schema.nodes["subtract"],
+                fn="subtract_x_from_all",
+                needs={"inputs": "input"},
+            )
+        }
+    )
+    variant = runner.with_graph_schema(variant_schema)
+
+    assert variant.run(inputs={"input": [3, 4]}) == {"subtract": [1, 2]}
+    # the original graph is unchanged
+    assert runner.run(inputs={"input": 3}) == {"subtract": 1}
+    assert (
+        variant._instantiated_nodes["subtract"]._component
+        is runner._instantiated_nodes["subtract"]._component
+    )
+
+
+def test_graph_variant_with_different_component(default_model_storage: ModelStorage):
+    graph_schema = GraphSchema(
+        {
+            "node": SchemaNode(
+                needs={"i": "input"},
+                uses=SubtractByX,
+                fn="subtract_x",
+                constructor_name="create",
+                config={},
+                eager=True,
+                is_target=True,
+            )
+        }
+    )
+    runner = DaskGraphRunner(
+        graph_schema=graph_schema,
+        model_storage=default_model_storage,
+        execution_context=ExecutionContext(graph_schema=graph_schema, model_id="1"),
+    )
+
+    variant_schema = GraphSchema(
+        {
+            "node": SchemaNode(
+                needs={"i1": "input", "i2": "input"},
+                uses=AddInputs,
+                fn="add",
+                constructor_name="create",
+                config={},
+                eager=True,
+                is_target=True,
+            )
+        }
+    )
+
+    with pytest.raises(GraphRunError):
+        runner.with_graph_schema(variant_schema)
+
+
+def test_threads_scheduler_runs_independent_nodes_in_parallel(
+    default_model_storage: ModelStorage,
+):
+    graph_schema = GraphSchema(
+        {
+            node_name: SchemaNode(
+                needs={},
+                uses=WaitForOtherNode,
+                fn="wait",
+                constructor_name="create",
+                config={},
+                is_target=True,
+            )
+            for node_name in ["first", "second"]
+        }
+    )
+    runner = DaskGraphRunner(
+        graph_schema=graph_schema,
+        model_storage=default_model_storage,
+        execution_context=ExecutionContext(graph_schema=graph_schema, model_id="1"),
+        scheduler=SCHEDULER_THREADS,
+        max_workers=2,
+    )
+
+    # the nodes would wait for each other forever if they didn't run in parallel
+    results = runner.run()
+
+    assert sorted(results.values()) == [0, 1]
+
+
+def test_threads_scheduler_does_not_run_thread_unsafe_nodes_in_parallel(
+    default_model_storage: ModelStorage,
+):
+    graph_schema = GraphSchema(
+        {
+            f"node_{index}": SchemaNode(
+                needs={},
+                uses=ThreadUnsafeComponent,
+                fn="run",
+                constructor_name="create",
+                config={},
+                is_target=True,
+            )
+            for index in range(3)
+        }
+    )
+    runner = DaskGraphRunner(
+        graph_schema=graph_schema,
+        model_storage=default_model_storage,
+        execution_context=ExecutionContext(graph_schema=graph_schema, model_id="1"),
+        scheduler=SCHEDULER_THREADS,
+        max_workers=3,
+    )
+
+    results = runner.run()
+
+    assert set(results.values()) == {1}
+
+
+@pytest.mark.parametrize("scheduler", [SCHEDULER_SYNC, SCHEDULER_THREADS])
+def test_scheduler_from_environment(
+    scheduler: Text, default_model_storage: ModelStorage, monkeypatch: MonkeyPatch
+):
+    monkeypatch.setenv(GRAPH_SCHEDULER_ENV, scheduler)
+    graph_schema = GraphSchema(
+        {
+            "add": SchemaNode(
+                needs={"i1": "first_input", "i2": "second_input"},
+                uses=AddInputs,
+                fn="add",
+                constructor_name="create",
+                config={},
+                is_target=True,
+            )
+        }
+    )
+    runner = DaskGraphRunner(
+        graph_schema=graph_schema,
+        model_storage=default_model_storage,
+        execution_context=ExecutionContext(graph_schema=graph_schema, model_id="1"),
+    )
+
+    assert runner.run(inputs={"first_input": 3, "second_input": 4}) == {"add": 7}
+
+
+def test_unknown_scheduler(default_model_storage: ModelStorage):
+    graph_schema = GraphSchema({})
+
+    with pytest.raises(GraphRunError):
+        DaskGraphRunner(
+            graph_schema=graph_schema,
+            model_storage=default_model_storage,
+            execution_context=ExecutionContext(
+                graph_schema=graph_schema, model_id="1"
+            ),
+            scheduler="processes",
+        )
+
+
+def test_execution_plan_is_reused(
+    default_model_storage: ModelStorage, monkeypatch: MonkeyPatch
+):
+    graph_schema = GraphSchema(
+        {
+            "add": SchemaNode(
+                needs={"i1": "first_input", "i2": "second_input"},
+                uses=AddInputs,
+                fn="add",
+                constructor_name="create",
+                config={},
+            ),
+            "subtract_2": SchemaNode(
+                needs={"i": "add"},
+                uses=SubtractByX,
+                fn="subtract_x",
+                constructor_name="create",
+                config={"x": 2},
+                is_target=True,
+            ),
+        }
+    )
+    runner = DaskGraphRunner(
+        graph_schema=graph_schema,
+        model_storage=default_model_storage,
+        execution_context=ExecutionContext(graph_schema=graph_schema, model_id="1"),
+    )
+    minimal_graph_schema = Mock(wraps=graph_schema.minimal_graph_schema)
+    monkeypatch.setattr(graph_schema, "minimal_graph_schema", minimal_graph_schema)
+
+    first = runner.run(inputs={"first_input": 3, "second_input": 4})
+    second = runner.run(inputs={"first_input": 5, "second_input": 4})
+    intermediate = runner.run(
+        inputs={"first_input": 5, "second_input": 4}, targets=["add", "subtract_2"]
+    )
+
+    assert first == {"subtract_2": 5}
+    assert second == {"subtract_2": 7}
+    assert intermediate == {"add": 9, "subtract_2": 7}
+    assert minimal_graph_schema.call_count == 2
+
+
+def test_run_logs_node_durations(
+    default_model_storage: ModelStorage, caplog: LogCaptureFixture
+):
+    graph_schema = GraphSchema(
+        {
+            "add": SchemaNode(
+                needs={"i1": "first_input", "i2": "second_input"},
+                uses=AddInputs,
+                fn="add",
+                constructor_name="create",
+                config={},
+                is_target=True,
+            )
+        }
+    )
+    runner = DaskGraphRunner(
+        graph_schema=graph_schema,
+        model_storage=default_model_storage,
+        execution_context=ExecutionContext(graph_schema=graph_schema, model_id="1"),
+    )
+
+    with caplog.at_level(logging.DEBUG, logger="rasa.engine.runner.dask"):
+        runner.run(inputs={"first_input": 3, "second_input": 4})
+
+    assert any(
+        record.message.startswith("Ran graph in") and "add: " in record.message
+        for record in caplog.records
+    )
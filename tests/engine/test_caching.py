@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Dict, Text, Optional, Any, Callable
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
 from _pytest.logging import LogCaptureFixture
 from _pytest.monkeypatch import MonkeyPatch
@@ -19,12 +20,17 @@ from rasa.engine.caching import (
     DEFAULT_CACHE_NAME,
     CACHE_SIZE_ENV,
     CACHE_DB_NAME_ENV,
+    FEATURE_CACHE_NAME,
     TrainingCache,
 )
 import tests.conftest
 from rasa.engine.storage.local_model_storage import LocalModelStorage
 from rasa.engine.storage.resource import Resource
 from rasa.engine.storage.storage import ModelStorage
+from rasa.nlu.featurizers.feature_cache import FeatureCache
+from rasa.shared.nlu.constants import FEATURE_TYPE_SENTENCE, TEXT
+from rasa.shared.nlu.training_data.features import Features
+from rasa.shared.utils.yaml_cache import YAML_CACHE_DIRECTORY
 
 
 @dataclasses.dataclass
@@ -489,6 +495,71 @@ def test_cache_exceeds_size_but_not_in_database(
     assert not test_file.is_file()
 
 
+def test_feature_cache_does_not_count_towards_cache_size(
+    tmp_path: Path, monkeypatch: MonkeyPatch, default_model_storage: ModelStorage
+):
+    monkeypatch.setenv(CACHE_LOCATION_ENV, str(tmp_path))
+    max_cache_size = 5
+    monkeypatch.setenv(CACHE_SIZE_ENV, str(max_cache_size))
+
+    cache = LocalTrainingCache()
+
+    # fill the feature cache close to the size limit
+    feature_cache = FeatureCache()
+    features = [
+        Features(np.random.rand(1, 140_000), FEATURE_TYPE_SENTENCE, TEXT, "lm")
+    ]
+    feature_cache.cache_features({str(index): features for index in range(4)})
+    feature_cache_file = cache._cache_location / FEATURE_CACHE_NAME
+    assert feature_cache_file.stat().st_size > 4 * 1024 * 1024
+
+    output_fingerprints = []
+    for _ in range(2):
+        fingerprint_key = uuid.uuid4().hex
+        output = TestCacheableOutput({"something to cache": "dasdaasda"}, size_in_mb=2)
+        output_fingerprint = uuid.uuid4().hex
+        cache.cache_output(
+            fingerprint_key, output, output_fingerprint, default_model_storage
+        )
+        output_fingerprints.append(output_fingerprint)
+
+    # the cached features didn't evict any cached results
+    for output_fingerprint in output_fingerprints:
+        assert cache.get_cached_result(
+            output_fingerprint, "some_node", default_model_storage
+        )
+    cached_features = feature_cache.get_cached_features(
+        [str(index) for index in range(4)]
+    )
+    assert len(cached_features) == 4
+
+
+def test_parsed_yaml_does_not_count_towards_cache_size(
+    tmp_path: Path, monkeypatch: MonkeyPatch, default_model_storage: ModelStorage
+):
+    monkeypatch.setenv(CACHE_LOCATION_ENV, str(tmp_path))
+    max_cache_size = 5
+    monkeypatch.setenv(CACHE_SIZE_ENV, str(max_cache_size))
+
+    cache = LocalTrainingCache()
+
+    parsed_yaml_dir = cache._cache_location / YAML_CACHE_DIRECTORY
+    parsed_yaml_dir.mkdir()
+    parsed_yaml_file = tests.conftest.create_test_file_with_size(parsed_yaml_dir, 4)
+
+    fingerprint_key = uuid.uuid4().hex
+    output = TestCacheableOutput({"something to cache": "dasdaasda"}, size_in_mb=2)
+    output_fingerprint = uuid.uuid4().hex
+    cache.cache_output(
+        fingerprint_key, output, output_fingerprint, default_model_storage
+    )
+
+    assert cache.get_cached_result(
+        output_fingerprint, "some_node", default_model_storage
+    )
+    assert parsed_yaml_file.is_file()
+
+
 def test_clean_up_of_cached_result_if_database_fails(
     tmp_path: Path,
     monkeypatch: MonkeyPatch,
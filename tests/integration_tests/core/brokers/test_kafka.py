@@ -17,11 +17,13 @@ def test_kafka_event_broker_valid():
             {"sender_id": "valid_test", "event": "user", "text": "hello world!"},
             retries=5,
         )
-        assert broker.producer.poll() == 1
     finally:
-        broker.producer.flush()
+        # publishes the pending events
         broker._close()
 
+    assert broker.delivered_events == 1
+    assert broker.queue_depth == 0
+
 
 def test_kafka_event_broker_buffer_error_is_handled(caplog: LogCaptureFixture):
     broker = KafkaEventBroker(
@@ -35,8 +37,8 @@ def test_kafka_event_broker_buffer_error_is_handled(caplog: LogCaptureFixture):
 
     event_count = 100
     try:
-        for i in range(event_count):
-            with caplog.at_level(logging.DEBUG):
+        with caplog.at_level(logging.DEBUG):
+            for i in range(event_count):
                 broker.publish(
                     {
                         "sender_id": "valid_test",
@@ -45,8 +47,9 @@ def test_kafka_event_broker_buffer_error_is_handled(caplog: LogCaptureFixture):
                     },
                     retries=5,
                 )
+            broker._close()
         assert "Queue full" in caplog.text
-        assert broker.producer.poll() == 1
     finally:
-        broker.producer.flush()
         broker._close()
+
+    assert broker.delivered_events == event_count
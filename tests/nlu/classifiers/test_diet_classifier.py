@@ -716,6 +716,56 @@ async def test_process_gives_diagnostic_data(
         assert DIAGNOSTIC_DATA not in processed_message.data
 
 
+@pytest.mark.parametrize("bilou_flag", [True, False])
+async def test_process_batch_equals_single_messages(
+    create_diet: Callable[..., DIETClassifier],
+    train_and_preprocess: Callable[..., Tuple[TrainingData, List[GraphComponent]]],
+    process_message: Callable[..., Message],
+    bilou_flag: bool,
+):
+    pipeline = [
+        {"component": WhitespaceTokenizer},
+        {"component": CountVectorsFeaturizer},
+    ]
+    diet = create_diet(
+        {RANDOM_SEED: 1, EPOCHS: 2, BILOU_FLAG: bilou_flag, RUN_EAGERLY: True}
+    )
+    training_data, loaded_pipeline = train_and_preprocess(
+        pipeline, training_data="data/test/demo-rasa-composite-entities.yml"
+    )
+    diet.train(training_data=training_data)
+
+    texts = [
+        "I am looking for an italian restaurant",
+        "hi",
+        "show me a mexican place in the centre of the town please",
+    ]
+    batch = [process_message(loaded_pipeline, Message.build(text)) for text in texts]
+    # messages without features are not predicted
+    batch.insert(1, Message.build("unfeaturized message"))
+    single = [copy.deepcopy(message) for message in batch]
+
+    diet.process(batch)
+    for message in single:
+        diet.process([message])
+
+    for batch_message, single_message in zip(batch, single):
+        assert (
+            batch_message.get(INTENT)[INTENT_NAME_KEY]
+            == single_message.get(INTENT)[INTENT_NAME_KEY]
+        )
+        assert batch_message.get(INTENT)[PREDICTED_CONFIDENCE_KEY] == pytest.approx(
+            single_message.get(INTENT)[PREDICTED_CONFIDENCE_KEY], abs=1e-5
+        )
+        assert [
+            (entity["start"], entity["end"], entity["entity"])
+            for entity in batch_message.get(ENTITIES)
+        ] == [
+            (entity["start"], entity["end"], entity["entity"])
+            for entity in single_message.get(ENTITIES)
+        ]
+
+
 @pytest.mark.parametrize(
     "initial_sparse_feature_sizes, final_sparse_feature_sizes, label_attribute",
     [
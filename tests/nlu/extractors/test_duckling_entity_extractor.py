@@ -1,7 +1,10 @@
-from typing import Callable, Dict, Text, Any
+import json
+from typing import Callable, Dict, Text, Any, Tuple
+from urllib.parse import parse_qs
 
 import pytest
 import responses
+from requests import PreparedRequest
 
 from rasa.engine.graph import ExecutionContext
 from rasa.engine.storage.resource import Resource
@@ -237,3 +240,107 @@ def test_duckling_entity_extractor_dimension_filtering(
         assert len(entities) == 1
         assert entities[0]["text"] == "5"
         assert entities[0]["value"] == 5
+
+
+def _number_match_callback(
+    request: PreparedRequest,
+) -> Tuple[int, Dict[Text, Text], Text]:
+    text = parse_qs(request.body)["text"][0]
+    matches = [
+        {
+            "body": text,
+            "start": 0,
+            "value": {"value": int(text), "type": "value"},
+            "end": len(text),
+            "dim": "number",
+        }
+    ]
+    return 200, {}, json.dumps(matches)
+
+
+def test_duckling_entity_extractor_parses_batch_concurrently_and_caches(
+    create_duckling: Callable[[Dict[Text, Any]], DucklingEntityExtractor]
+):
+    duckling = create_duckling({"dimensions": ["number"], "max_concurrent_requests": 4})
+
+    with responses.RequestsMock() as rsps:
+        rsps.add_callback(
+            responses.POST,
+            "http://localhost:8000/parse",
+            callback=_number_match_callback,
+        )
+
+        messages = [
+            Message(data={TEXT: text}, time=1381536182)
+            for text in ["1", "2", "3", "2"]
+        ]
+        duckling.process(messages)
+
+        # every distinct text is only sent once
+        assert len(rsps.calls) == 3
+        assert [message.get("entities")[0]["value"] for message in messages] == [
+            1,
+            2,
+            3,
+            2,
+        ]
+
+        # the responses are cached
+        cached_messages = [Message(data={TEXT: "3"}, time=1381536182)]
+        duckling.process(cached_messages)
+        assert len(rsps.calls) == 3
+        assert cached_messages[0].get("entities")[0]["value"] == 3
+
+        # a different reference time requires a new request
+        duckling.process([Message(data={TEXT: "3"}, time=1381536300)])
+        assert len(rsps.calls) == 4
+
+
+def test_duckling_entity_extractor_does_not_cache_failed_requests(
+    create_duckling: Callable[[Dict[Text, Any]], DucklingEntityExtractor]
+):
+    duckling = create_duckling({"dimensions": ["number"]})
+
+    with responses.RequestsMock() as rsps:
+        rsps.add(responses.POST, "http://localhost:8000/parse", status=500)
+
+        messages = [Message(data={TEXT: "5"}, time=1381536182)]
+        duckling.process(messages)
+        assert messages[0].get("entities", []) == []
+
+        rsps.replace(
+            responses.POST,
+            "http://localhost:8000/parse",
+            json=[
+                {
+                    "body": "5",
+                    "start": 0,
+                    "value": {"value": 5, "type": "value"},
+                    "end": 1,
+                    "dim": "number",
+                }
+            ],
+        )
+
+        messages = [Message(data={TEXT: "5"}, time=1381536182)]
+        duckling.process(messages)
+        assert messages[0].get("entities")[0]["value"] == 5
+        assert len(rsps.calls) == 2
+
+
+def test_duckling_entity_extractor_without_cache(
+    create_duckling: Callable[[Dict[Text, Any]], DucklingEntityExtractor]
+):
+    duckling = create_duckling({"dimensions": ["number"], "cache_size": 0})
+
+    with responses.RequestsMock() as rsps:
+        rsps.add_callback(
+            responses.POST,
+            "http://localhost:8000/parse",
+            callback=_number_match_callback,
+        )
+
+        for _ in range(2):
+            duckling.process([Message(data={TEXT: "7"}, time=1381536182)])
+
+        assert len(rsps.calls) == 2
@@ -1,9 +1,11 @@
 from typing import List, Any, Text, Dict, Callable, Optional
+from unittest.mock import Mock
 
 import dataclasses
 import numpy as np
 import pytest
 import scipy.sparse
+from _pytest.monkeypatch import MonkeyPatch
 
 from rasa.engine.graph import ExecutionContext
 from rasa.engine.storage.resource import Resource
@@ -721,6 +723,48 @@ def test_count_vector_featurizer_process_by_attribute(
     assert action_name_sen_vecs is None
 
 
+def test_count_vector_featurizer_process_batch_equals_single_messages(
+    create_featurizer: Callable[..., CountVectorsFeaturizer],
+    whitespace_tokenizer: WhitespaceTokenizer,
+):
+    ftr = create_featurizer({"OOV_token": "__oov__", "OOV_words": ["oov"]})
+
+    train_messages = [
+        Message(data={TEXT: "hello there 1", INTENT: "greet", RESPONSE: "hi"}),
+        Message(data={TEXT: "bye oov", INTENT: "goodbye", RESPONSE: "ciao oov"}),
+        Message(data={TEXT: "what is up", INTENT: "chitchat"}),
+    ]
+    data = TrainingData(train_messages)
+    whitespace_tokenizer.process_training_data(data)
+    ftr.train(data)
+
+    def test_messages() -> List[Message]:
+        messages = [
+            Message(data={TEXT: "hello hello unknown 42", INTENT: "greet"}),
+            Message(data={TEXT: "bye", RESPONSE: "ciao ciao"}),
+            Message(data={ACTION_NAME: "action_listen"}),
+            Message(data={TEXT: "what is up there", INTENT: "chitchat"}),
+        ]
+        whitespace_tokenizer.process(messages)
+        return messages
+
+    batch = ftr.process(test_messages())
+    single = [ftr.process([message])[0] for message in test_messages()]
+
+    for batch_message, single_message in zip(batch, single):
+        assert len(batch_message.features) == len(single_message.features)
+        for batch_features, single_features in zip(
+            batch_message.features, single_message.features
+        ):
+            assert batch_features.attribute == single_features.attribute
+            assert batch_features.type == single_features.type
+            assert isinstance(batch_features.features, scipy.sparse.coo_matrix)
+            assert batch_features.features.shape == single_features.features.shape
+            assert np.array_equal(
+                batch_features.features.toarray(), single_features.features.toarray()
+            )
+
+
 @pytest.mark.parametrize(
     "initial_train_text, additional_train_text, "
     "initial_vocabulary_size, final_vocabulary_size",
@@ -841,3 +885,47 @@ def test_create_independent_vocab_vectorizers_min_df(
             cvf.train(data)
     else:
         cvf.train(data)
+
+
+def test_process_training_data_reuses_cached_features(
+    create_featurizer: Callable[..., CountVectorsFeaturizer],
+    whitespace_tokenizer: WhitespaceTokenizer,
+    monkeypatch: MonkeyPatch,
+):
+    ftr = create_featurizer()
+
+    def training_data() -> TrainingData:
+        data = TrainingData(
+            [
+                Message(data={TEXT: "hello there", INTENT: "greet"}),
+                Message(data={TEXT: "goodbye", INTENT: "goodbye"}),
+            ]
+        )
+        whitespace_tokenizer.process_training_data(data)
+        return data
+
+    first_run_data = training_data()
+    ftr.train(first_run_data)
+    ftr.process_training_data(first_run_data)
+
+    second_run_data = training_data()
+    new_message = Message(data={TEXT: "hello", INTENT: "greet"})
+    whitespace_tokenizer.process([new_message])
+    second_run_data.training_examples.append(new_message)
+
+    process = Mock(wraps=ftr.process)
+    monkeypatch.setattr(ftr, "process", process)
+    ftr.process_training_data(second_run_data)
+
+    # only the new message is featurized
+    process.assert_called_once_with([new_message])
+
+    for first, second in zip(
+        first_run_data.training_examples, second_run_data.training_examples
+    ):
+        assert [str(features) for features in first.features] == [
+            str(features) for features in second.features
+        ]
+        for first_features, second_features in zip(first.features, second.features):
+            assert (first_features.features != second_features.features).nnz == 0
+    assert new_message.features
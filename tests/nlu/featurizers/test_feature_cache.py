@@ -0,0 +1,87 @@
+import numpy as np
+import scipy.sparse
+from _pytest.monkeypatch import MonkeyPatch
+
+from rasa.engine.caching import CACHE_SIZE_ENV, FEATURE_CACHE_NAME
+from rasa.nlu.featurizers.feature_cache import (
+    FEATURE_CACHE_SIZE_ENV,
+    FeatureCache,
+    _serialize_features,
+)
+from rasa.shared.nlu.constants import (
+    FEATURE_TYPE_SENTENCE,
+    FEATURE_TYPE_SEQUENCE,
+    INTENT,
+    TEXT,
+)
+from rasa.shared.nlu.training_data.features import Features
+
+
+def test_cache_features_round_trip():
+    cache = FeatureCache()
+    dense = Features(
+        np.random.rand(3, 5).astype(np.float32), FEATURE_TYPE_SEQUENCE, TEXT, "lm"
+    )
+    sparse = Features(
+        scipy.sparse.random(1, 10, density=0.3, format="csr"),
+        FEATURE_TYPE_SENTENCE,
+        INTENT,
+        ["cvf", "regex"],
+    )
+
+    cache.cache_features({"key": [dense, sparse], "no features": []})
+
+    cached = cache.get_cached_features(["key", "no features", "unknown"])
+
+    assert set(cached.keys()) == {"key", "no features"}
+    assert cached["no features"] == []
+
+    cached_dense, cached_sparse = cached["key"]
+    assert str(cached_dense) == str(dense)
+    assert cached_dense.features.dtype == np.float32
+    assert np.array_equal(cached_dense.features, dense.features)
+
+    assert str(cached_sparse) == str(sparse)
+    assert cached_sparse.features.format == "csr"
+    assert (cached_sparse.features != sparse.features).nnz == 0
+
+
+def test_feature_cache_is_disabled(monkeypatch: MonkeyPatch):
+    monkeypatch.setenv(CACHE_SIZE_ENV, "0")
+    cache = FeatureCache()
+
+    assert cache.is_disabled()
+
+    features = Features(np.ones((1, 2)), FEATURE_TYPE_SENTENCE, TEXT, "lm")
+    cache.cache_features({"key": [features]})
+
+    assert cache.get_cached_features(["key"]) == {}
+
+
+def test_feature_cache_drops_least_recently_used_entries(monkeypatch: MonkeyPatch):
+    features = [Features(np.ones((1, 2)), FEATURE_TYPE_SENTENCE, TEXT, "lm")]
+    size_in_mb = len(_serialize_features(features)) / 1e6
+    monkeypatch.setenv(FEATURE_CACHE_SIZE_ENV, str(2 * size_in_mb))
+    cache = FeatureCache()
+
+    cache.cache_features({"first": features})
+    cache.cache_features({"second": features})
+    # mark `first` as recently used
+    cache.get_cached_features(["first"])
+    cache.cache_features({"third": features})
+
+    cached = cache.get_cached_features(["first", "second", "third"])
+    assert set(cached.keys()) == {"first", "third"}
+
+
+def test_feature_cache_shrinks_after_dropping_entries(monkeypatch: MonkeyPatch):
+    features = [Features(np.random.rand(1, 150_000), FEATURE_TYPE_SENTENCE, TEXT, "lm")]
+    size_in_mb = len(_serialize_features(features)) / 1e6
+    monkeypatch.setenv(FEATURE_CACHE_SIZE_ENV, str(2.5 * size_in_mb))
+    cache = FeatureCache()
+
+    cache.cache_features({"first": features, "second": features})
+    cache.cache_features({"third": features})
+
+    cache_file = cache._cache_location / FEATURE_CACHE_NAME
+    assert cache_file.stat().st_size < 2.5 * size_in_mb * 1e6
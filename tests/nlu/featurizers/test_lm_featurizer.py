@@ -821,3 +821,61 @@ def test_lm_featurizer_correctly_handle_whitespace_token(
     result, _ = lm_featurizer._tokenize_example(message, TEXT)
 
     assert [(token.text, token.start) for token in result] == expected_feature_tokens
+
+
+@pytest.mark.skip_on_windows
+def test_lm_featurizer_process_batches_and_caches(
+    create_language_model_featurizer: Callable[
+        [Dict[Text, Any]], LanguageModelFeaturizer
+    ],
+    whitespace_tokenizer: WhitespaceTokenizer,
+    monkeypatch: MonkeyPatch,
+):
+    monkeypatch.setattr(LanguageModelFeaturizer, "_load_model_instance", lambda _: None)
+    component = create_language_model_featurizer(
+        {"model_name": "bert", "batch_size": 2, "cache_size": 10}
+    )
+    component.pad_token_id = 0
+    monkeypatch.setattr(
+        component, "_lm_tokenize", lambda text: ([len(text) + 1000], [text])
+    )
+
+    model_inputs = []
+
+    def compute_batch_sequence_features(
+        batch_attention_mask: np.ndarray, padded_token_ids: List[List[int]]
+    ) -> np.ndarray:
+        model_inputs.append(padded_token_ids)
+        # every token is embedded as its token id
+        return np.repeat(
+            np.array(padded_token_ids, dtype=np.float32)[:, :, np.newaxis], 3, axis=2
+        )
+
+    monkeypatch.setattr(
+        component, "_compute_batch_sequence_features", compute_batch_sequence_features
+    )
+
+    texts = ["a bb", "a bb ccc dddd", "ccc", "a bb", "a bb ccc"]
+    messages = [Message.build(text=text) for text in texts]
+    whitespace_tokenizer.process(messages)
+    component.process(messages)
+
+    # the duplicated message is only fed once, the others are bucketed by length
+    assert [len(batch) for batch in model_inputs] == [2, 2]
+    assert [len(batch[0]) for batch in model_inputs] == [4, 6]
+
+    for message in messages:
+        seq_vecs, sen_vecs = message.get_dense_features(TEXT, [])
+        expected = [len(token.text) + 1000 for token in message.get(TOKENS_NAMES[TEXT])]
+        assert np.all(seq_vecs.features[:, 0] == expected)
+        assert np.all(sen_vecs.features == 101)
+
+    # all messages are taken from the cache
+    model_inputs.clear()
+    cached_message = Message.build(text="ccc")
+    whitespace_tokenizer.process([cached_message])
+    component.process([cached_message])
+
+    assert not model_inputs
+    seq_vecs, _ = cached_message.get_dense_features(TEXT, [])
+    assert np.all(seq_vecs.features[:, 0] == [1003])
@@ -626,3 +626,62 @@ def test_vocabulary_expand_for_finetuning(
         if pattern["name"] == "hello"
     ]
     assert pattern_to_check == [new_patterns[1]]
+
+
+def test_process_training_data_with_cached_features_marks_tokens(
+    create_featurizer: Callable[..., RegexFeaturizer],
+    whitespace_tokenizer: WhitespaceTokenizer,
+):
+    patterns = [
+        {"pattern": "[0-9]+", "name": "number", "usage": "intent"},
+        {"pattern": "\\bhey*", "name": "hello", "usage": "intent"},
+    ]
+    ftr = create_featurizer(known_patterns=patterns)
+
+    def featurized_message() -> Message:
+        message = Message(data={TEXT: "hey there 123", INTENT: "greet"})
+        training_data = TrainingData([message])
+        whitespace_tokenizer.process_training_data(training_data)
+        ftr.process_training_data(training_data)
+        return message
+
+    featurized = featurized_message()
+    # the second time the features are taken from the cache
+    from_cache = featurized_message()
+
+    for message in [featurized, from_cache]:
+        seq_vecs, _ = message.get_sparse_features(TEXT, [])
+        assert np.all(
+            seq_vecs.features.toarray() == [[0.0, 1.0], [0.0, 0.0], [1.0, 0.0]]
+        )
+        assert [token.get("pattern") for token in message.get(TOKENS_NAMES[TEXT])] == [
+            {"number": False, "hello": True},
+            {"number": False, "hello": False},
+            {"number": True, "hello": False},
+        ]
+
+
+def test_process_marks_all_tokens_of_a_match(
+    create_featurizer: Callable[..., RegexFeaturizer],
+    whitespace_tokenizer: WhitespaceTokenizer,
+):
+    ftr = create_featurizer()
+    training_data = TrainingData()
+    training_data.lookup_tables = [{"name": "city", "elements": ["new york", "berlin"]}]
+    ftr.train(training_data)
+
+    messages = [
+        Message(data={TEXT: "fly from new york to berlin"}),
+        Message(data={TEXT: "stay here"}),
+    ]
+    whitespace_tokenizer.process(messages)
+    ftr.process(messages)
+
+    seq_vecs, sen_vecs = messages[0].get_sparse_features(TEXT, [])
+    assert seq_vecs.features.toarray().tolist() == [[0], [0], [1], [1], [0], [1]]
+    assert sen_vecs.features.toarray().tolist() == [[1]]
+
+    seq_vecs, sen_vecs = messages[1].get_sparse_features(TEXT, [])
+    assert seq_vecs.features.nnz == 0
+    assert seq_vecs.features.shape == (2, 1)
+    assert sen_vecs.features.nnz == 0
@@ -1,3 +1,4 @@
+import re
 from typing import Dict, List, Text
 
 import pytest
@@ -6,6 +7,13 @@ import rasa.nlu.utils.pattern_utils as pattern_utils
 from rasa.shared.nlu.training_data.training_data import TrainingData
 from rasa.shared.nlu.training_data.message import Message
 
+PERSON_PATTERN = {
+    "name": "person",
+    "pattern": "(\\bMax\\b|\\bJohn\\b)",
+    "elements": ["Max", "John"],
+    "use_word_boundaries": True,
+}
+
 
 @pytest.mark.parametrize(
     "lookup_tables, regex_features, expected_patterns",
@@ -13,7 +21,7 @@ from rasa.shared.nlu.training_data.message import Message
         (
             {"name": "person", "elements": ["Max", "John"]},
             {},
-            [{"name": "person", "pattern": "(\\bMax\\b|\\bJohn\\b)"}],
+            [PERSON_PATTERN],
         ),
         ({}, {}, []),
         (
@@ -26,7 +34,7 @@ from rasa.shared.nlu.training_data.message import Message
             {"name": "zipcode", "pattern": "[0-9]{5}"},
             [
                 {"name": "zipcode", "pattern": "[0-9]{5}"},
-                {"name": "person", "pattern": "(\\bMax\\b|\\bJohn\\b)"},
+                PERSON_PATTERN,
             ],
         ),
         (
@@ -38,6 +46,14 @@ from rasa.shared.nlu.training_data.message import Message
                     "name": "plates",
                     "pattern": "(\\btacos\\b|\\bbeef\\b|\\bmapo\\ "
                     "tofu\\b|\\bburrito\\b|\\blettuce\\ wrap\\b)",
+                    "elements": [
+                        "tacos",
+                        "beef",
+                        "mapo tofu",
+                        "burrito",
+                        "lettuce wrap",
+                    ],
+                    "use_word_boundaries": True,
                 },
             ],
         ),
@@ -102,7 +118,7 @@ def test_extract_patterns_use_only_entities_regexes(
         (
             "person",
             {"name": "person", "elements": ["Max", "John"]},
-            [{"name": "person", "pattern": "(\\bMax\\b|\\bJohn\\b)"}],
+            [PERSON_PATTERN],
         ),
         ("entity", {"name": "person", "elements": ["Max", "John"]}, []),
     ],
@@ -150,7 +166,7 @@ def test_extract_patterns_use_only_entities_lookup_tables(
             {"name": "zipcode", "pattern": "[0-9]{5}"},
             True,
             False,
-            [{"name": "person", "pattern": "(\\bMax\\b|\\bJohn\\b)"}],
+            [PERSON_PATTERN],
         ),
         (
             {"name": "person", "elements": ["Max", "John"]},
@@ -218,3 +234,41 @@ def test_regex_validation(
     assert "Model training failed." in str(e.value)
     assert "not a valid regex." in str(e.value)
     assert "Please update your nlu training data configuration" in str(e.value)
+
+
+@pytest.mark.parametrize("use_word_boundaries", [True, False])
+@pytest.mark.parametrize("case_sensitive", [True, False])
+@pytest.mark.parametrize(
+    "elements, text",
+    [
+        (["New York", "York", "new"], "new york, NEW YORK and Newark in New York"),
+        (["ab", "a", "abc"], "abc ab a_b aB ab."),
+        (["i", "s"], "I İ ı ſ S is"),
+        (["(a)", ".b", "c+"], "(a) x.b .b c+ cc+"),
+        (["北京", "上海"], "北京和上海"),
+    ],
+)
+def test_pattern_matcher_matches_lookup_table_like_regex(
+    elements: List[Text], text: Text, use_word_boundaries: bool, case_sensitive: bool
+):
+    training_data = TrainingData()
+    training_data.lookup_tables = [{"name": "table", "elements": elements}]
+    (pattern,) = pattern_utils.extract_patterns(
+        training_data, use_word_boundaries=use_word_boundaries
+    )
+
+    matcher = pattern_utils.PatternMatcher(pattern, case_sensitive)
+
+    flags = 0 if case_sensitive else re.IGNORECASE
+    expected = [
+        match.span() for match in re.finditer(pattern["pattern"], text, flags=flags)
+    ]
+    assert matcher.spans(text) == expected
+
+
+def test_pattern_matcher_with_regex():
+    matcher = pattern_utils.PatternMatcher(
+        {"name": "zipcode", "pattern": "[0-9]{5}"}, case_sensitive=True
+    )
+
+    assert matcher.spans("12345 and 67890") == [(0, 5), (10, 15)]
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from pytest import MonkeyPatch
 from unittest.mock import MagicMock
@@ -5,8 +6,11 @@ from unittest.mock import MagicMock
 from rasa.engine.graph import ExecutionContext
 from rasa.engine.storage.resource import Resource
 from rasa.engine.storage.storage import ModelStorage
+from rasa.nlu.constants import SPACY_DOCS
 from rasa.nlu.model import InvalidModelError
-from rasa.nlu.utils.spacy_utils import SpacyNLP
+from rasa.nlu.utils.spacy_utils import SpacyModel, SpacyNLP
+from rasa.shared.nlu.constants import TEXT
+from rasa.shared.nlu.training_data.message import Message
 import spacy
 
 
@@ -43,3 +47,49 @@ def test_spacy_runtime_model_version_compatibility(
         default_execution_context,
     )
     assert isinstance(component, SpacyNLP)
+
+
+def test_process_messages_in_batches(
+    spacy_nlp_component: SpacyNLP, spacy_model: SpacyModel
+):
+    texts = ["hello there", "", "how are you?", "hello there"]
+    messages = [Message(data={TEXT: text}) for text in texts]
+
+    spacy_nlp_component.process(messages, spacy_model)
+
+    assert messages[1].get(SPACY_DOCS[TEXT]) is None
+    for text, message in zip(texts, messages):
+        if not text:
+            continue
+        doc = message.get(SPACY_DOCS[TEXT])
+        expected = spacy_nlp_component._doc_for_text(spacy_model.model, text)
+        assert [token.text for token in doc] == [token.text for token in expected]
+        assert np.allclose(doc.vector, expected.vector)
+
+
+def test_process_reuses_cached_docs(spacy_model: SpacyModel):
+    component = SpacyNLP(
+        spacy_model,
+        {
+            **SpacyNLP.get_default_config(),
+            "doc_cache_size": 2,
+            "doc_cache_max_text_length": 10,
+        },
+    )
+
+    def doc_for(text: str) -> spacy.tokens.Doc:
+        message = Message(data={TEXT: text})
+        component.process([message], spacy_model)
+        return message.get(SPACY_DOCS[TEXT])
+
+    hello = doc_for("hello")
+    assert doc_for("Hello") is hello
+
+    # long texts are not cached
+    long_text = "this text is too long for the cache"
+    assert doc_for(long_text) is not doc_for(long_text)
+
+    # the least recently used doc is dropped
+    doc_for("hi")
+    doc_for("hey")
+    assert doc_for("hello") is not hello
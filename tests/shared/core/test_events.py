@@ -270,6 +270,26 @@ def test_json_parse_agent():
     assert Event.from_parameters(evt) == AgentUttered("Hey, how are you?")
 
 
+def test_resolve_by_type_finds_event_classes_defined_later():
+    assert Event.resolve_by_type("action") == ActionExecuted
+
+    class MyCustomEvent(Restarted):
+        type_name = "my_custom_event"
+
+    assert Event.resolve_by_type("my_custom_event") == MyCustomEvent
+    assert isinstance(
+        Event.from_parameters({"event": "my_custom_event"}), MyCustomEvent
+    )
+
+
+def test_resolve_by_type_with_unknown_type_name():
+    with pytest.raises(ValueError):
+        Event.resolve_by_type("unknown_event")
+
+    assert Event.resolve_by_type("unknown_event", default=Restarted) == Restarted
+    assert Event.resolve_by_type("topic") is None
+
+
 @pytest.mark.parametrize(
     "event_class",
     [
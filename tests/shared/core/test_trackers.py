@@ -11,6 +11,7 @@ from typing import List, Text, Dict, Any, Type
 import fakeredis
 import freezegun
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 
 from rasa.core.actions.action import ActionExtractSlots
 from rasa.core.channels import CollectingOutputChannel
@@ -25,6 +26,7 @@ from rasa.shared.core.constants import (
     LOOP_NAME,
     REQUESTED_SLOT,
     LOOP_INTERRUPTED,
+    USER,
 )
 from rasa.shared.constants import (
     ASSISTANT_ID_KEY,
@@ -572,6 +574,64 @@ def test_traveling_back_in_time(domain: Domain):
     assert len(list(tracker.generate_all_prior_trackers())) == 2
 
 
+def test_past_states_are_built_incrementally(domain: Domain, monkeypatch: MonkeyPatch):
+    tracker = DialogueStateTracker("default", domain.slots)
+    tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+    tracker.update(UserUttered("/greet", {"name": "greet"}, []))
+    tracker.past_states(domain)
+
+    def fail_init_copy() -> DialogueStateTracker:
+        raise AssertionError("The prior states should not be replayed again.")
+
+    monkeypatch.setattr(tracker, "init_copy", fail_init_copy)
+
+    tracker.update(ActionExecuted("utter_greet"))
+    tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+    tracker.update(UserUttered("/goodbye", {"name": "goodbye"}, []))
+
+    expected = DialogueStateTracker.from_events(
+        "default", list(tracker.events), domain.slots
+    ).past_states(domain)
+    assert tracker.past_states(domain) == expected
+
+
+@pytest.mark.parametrize(
+    "rewind_event",
+    [UserUtteranceReverted(), ActionReverted(), Restarted(), SessionStarted()],
+)
+def test_past_states_after_rewind(domain: Domain, rewind_event: Event):
+    tracker = DialogueStateTracker("default", domain.slots)
+    for event in [
+        ActionExecuted(ACTION_LISTEN_NAME),
+        UserUttered("/greet", {"name": "greet"}, []),
+        ActionExecuted("utter_greet"),
+        ActionExecuted(ACTION_LISTEN_NAME),
+        UserUttered("/goodbye", {"name": "goodbye"}, []),
+        ActionExecuted("utter_goodbye"),
+    ]:
+        tracker.update(event)
+        tracker.past_states(domain)
+
+    tracker.update(rewind_event)
+    tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+
+    expected = DialogueStateTracker.from_events(
+        "default", list(tracker.events), domain.slots
+    ).past_states(domain)
+    assert tracker.past_states(domain) == expected
+
+
+def test_past_states_are_not_modified_by_callers(domain: Domain):
+    tracker = DialogueStateTracker("default", domain.slots)
+    tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+    tracker.update(UserUttered("/greet", {"name": "greet"}, []))
+
+    states = tracker.past_states(domain)
+    states[-1][USER]["intent"] = "goodbye"
+
+    assert tracker.past_states(domain)[-1][USER]["intent"] == "greet"
+
+
 def test_tracker_init_copy(domain: Domain):
     sender_id = "some-id"
     tracker = DialogueStateTracker(sender_id, domain.slots)
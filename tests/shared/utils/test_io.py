@@ -7,6 +7,8 @@ import uuid
 from collections import OrderedDict
 from typing import Callable, Text, List, Set, Any, Dict
 import copy
+import glob
+import math
 
 from pathlib import Path
 import numpy as np
@@ -17,6 +19,7 @@ from unittest.mock import MagicMock
 import rasa.shared
 from rasa.shared.nlu.training_data.features import Features
 from rasa.shared.exceptions import FileIOException, FileNotFoundException, RasaException
+from ruamel.yaml.constructor import DuplicateKeyError
 import rasa.shared.utils.io
 import rasa.shared.utils.validation
 from rasa.shared.constants import NEXT_MAJOR_VERSION_FOR_DEPRECATIONS
@@ -664,3 +667,99 @@ def test_handle_print_blocking_windows(monkeypatch: MonkeyPatch):
 
     assert isinstance(mock_print.call_args[1]["file"], ansitowin32.StreamWrapper)
     assert mock_print.call_args[1]["flush"]
+
+
+requires_libyaml = pytest.mark.skipif(
+    rasa.shared.utils.io._libyaml_loader() is None,
+    reason="PyYAML was built without libyaml.",
+)
+
+
+def _assert_identical(actual: Any, expected: Any) -> None:
+    # unlike `==` this distinguishes e.g. `1`, `1.0` and `True`
+    assert type(actual) is type(expected)
+    if isinstance(expected, dict):
+        assert list(actual.keys()) == list(expected.keys())
+        for key in expected:
+            _assert_identical(actual[key], expected[key])
+    elif isinstance(expected, list):
+        assert len(actual) == len(expected)
+        for actual_item, expected_item in zip(actual, expected):
+            _assert_identical(actual_item, expected_item)
+    elif isinstance(expected, float) and math.isnan(expected):
+        assert math.isnan(actual)
+    else:
+        assert actual == expected
+
+
+def _assert_libyaml_reads_like_ruamel(content: Text) -> None:
+    content = rasa.shared.utils.io._unescape_unicode(content)
+    try:
+        expected = rasa.shared.utils.io._load_yaml_with_ruamel(content, "safe")
+    except Exception:
+        # content which `ruamel.yaml` rejects must not be accepted either
+        with pytest.raises(Exception):
+            rasa.shared.utils.io._load_yaml_with_libyaml(content)
+        return
+
+    try:
+        actual = rasa.shared.utils.io._load_yaml_with_libyaml(content)
+    except ValueError:
+        # content which is left to `ruamel.yaml`
+        return
+
+    _assert_identical(actual, expected)
+
+
+@requires_libyaml
+@pytest.mark.parametrize(
+    "file",
+    sorted(
+        file
+        for pattern in ["data/**/*.yml", "examples/**/*.yml", "rasa/**/*.yml"]
+        for file in glob.glob(pattern, recursive=True)
+    ),
+)
+def test_libyaml_reads_files_like_ruamel(file: Text):
+    _assert_libyaml_reads_like_ruamel(rasa.shared.utils.io.read_file(file))
+
+
+@requires_libyaml
+@pytest.mark.parametrize(
+    "content",
+    [
+        "a: yes\nb: no\nc: on\nd: y",
+        "a: 010\nb: 0o10\nc: 0x1F\nd: 0b11\ne: -0x1F\nf: +12\ng: 1_000",
+        "a: 1e3\nb: .5\nc: -.inf\nd: .nan\ne: 1.\nf: 6.8523015e+5",
+        "a: ~\nb: null\nc:\nd: Null\ne: True\nf: FALSE",
+        "a: 1:20\nb: 2001-12-14\nc: 2001-12-14t21:59:43.10-05:00",
+        "user: ${USER_NAME}\npassword: pre${PASS}post",
+        "a: 1\na: 2",
+        "base: &base {x: 1}\nderived:\n  <<: *base\n  y: 2",
+        "%YAML 1.1\n---\na: yes",
+        'a: "\\U0001F600"\nb: \\U0001F600',
+        "- !!set {a, b}\n- !!binary aGVsbG8=",
+        "? [1, 2]\n: a",
+        "a: 'quoted'\nb: \"1\"\nc: {d: [1, {e: f}]}",
+        "",
+    ],
+)
+def test_libyaml_reads_content_like_ruamel(content: Text):
+    _assert_libyaml_reads_like_ruamel(content)
+
+
+def test_read_yaml_with_duplicate_keys():
+    with pytest.raises(DuplicateKeyError):
+        rasa.shared.utils.io.read_yaml("a: 1\na: 2")
+
+
+def test_read_yaml_with_directive_does_not_affect_later_content():
+    assert rasa.shared.utils.io.read_yaml("%YAML 1.1\n---\na: yes") == {"a": True}
+
+    assert rasa.shared.utils.io.read_yaml("a: yes\nb: 010") == {"a": "yes", "b": 10}
+
+
+def test_read_yaml_with_ruamel_if_libyaml_is_not_installed(monkeypatch: MonkeyPatch):
+    monkeypatch.setattr(rasa.shared.utils.io, "_libyaml_loader", lambda: None)
+
+    assert rasa.shared.utils.io.read_yaml("a: yes\nb: 010") == {"a": "yes", "b": 10}
@@ -0,0 +1,137 @@
+import os
+import pickle
+from pathlib import Path
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+import rasa.shared.utils.io
+import rasa.shared.utils.yaml_cache as yaml_cache
+from rasa.shared.core.training_data.story_reader.yaml_story_reader import (
+    CORE_SCHEMA_FILE,
+)
+from rasa.shared.exceptions import YamlException
+from rasa.shared.nlu.training_data.formats.rasa_yaml import NLU_SCHEMA_FILE
+
+STORIES_FILE = "data/test_yaml_stories/stories.yml"
+
+
+def _raise_if_parsed(*args, **kwargs):
+    raise AssertionError("The content should be taken from the cache.")
+
+
+def test_parse_validated_yaml_uses_cache(monkeypatch: MonkeyPatch):
+    content = rasa.shared.utils.io.read_file(STORIES_FILE)
+    expected = rasa.shared.utils.io.read_yaml(content)
+
+    assert yaml_cache.parse_validated_yaml(content, CORE_SCHEMA_FILE) == expected
+
+    monkeypatch.setattr(yaml_cache, "_parse", _raise_if_parsed)
+    assert yaml_cache.parse_validated_yaml(content, CORE_SCHEMA_FILE) == expected
+
+    # the same content isn't necessarily valid for a different schema
+    with pytest.raises(AssertionError):
+        yaml_cache.parse_validated_yaml(content, NLU_SCHEMA_FILE)
+
+
+def test_parse_validated_yaml_with_invalid_content():
+    content = "stories:\n- story: no steps\n  unknown_key: 1\n"
+
+    for _ in range(2):
+        with pytest.raises(YamlException):
+            yaml_cache.parse_validated_yaml(content, CORE_SCHEMA_FILE)
+
+
+def test_parse_validated_yaml_with_disabled_cache(monkeypatch: MonkeyPatch):
+    monkeypatch.setenv(yaml_cache.CACHE_SIZE_ENV, "0")
+    content = rasa.shared.utils.io.read_file(STORIES_FILE)
+
+    yaml_cache.parse_validated_yaml(content, CORE_SCHEMA_FILE)
+
+    assert not yaml_cache._cache_file(
+        yaml_cache._cache_key(content, CORE_SCHEMA_FILE)
+    ).exists()
+
+
+def test_parse_validated_yaml_ignores_unsafe_cache_entries():
+    content = rasa.shared.utils.io.read_file(STORIES_FILE)
+    cache_key = yaml_cache._cache_key(content, CORE_SCHEMA_FILE)
+    cache_file = yaml_cache._cache_file(cache_key)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    cache_file.write_bytes(pickle.dumps(Path("unexpected")))
+
+    parsed = yaml_cache.parse_validated_yaml(content, CORE_SCHEMA_FILE)
+
+    assert parsed == rasa.shared.utils.io.read_yaml(content)
+
+
+def test_parse_files_in_parallel(monkeypatch: MonkeyPatch, tmp_path: Path):
+    monkeypatch.setenv(yaml_cache.DATA_LOADING_WORKERS_ENV, "2")
+    monkeypatch.setattr(yaml_cache, "MIN_FILES_FOR_PARALLEL_PARSING", 1)
+
+    valid_contents = [
+        f"stories:\n- story: story {i}\n  steps:\n  - intent: greet\n"
+        for i in range(3)
+    ]
+    invalid_content = "stories:\n- story: no steps\n  unknown_key: 1\n"
+    files = []
+    for i, content in enumerate([*valid_contents, invalid_content]):
+        file = tmp_path / f"stories_{i}.yml"
+        rasa.shared.utils.io.write_text_file(content, file)
+        files.append(file)
+
+    yaml_cache.parse_files_in_parallel(files, CORE_SCHEMA_FILE)
+
+    monkeypatch.setattr(yaml_cache, "_parse", _raise_if_parsed)
+    for content in valid_contents:
+        assert yaml_cache.parse_validated_yaml(
+            content, CORE_SCHEMA_FILE
+        ) == rasa.shared.utils.io.read_yaml(content)
+
+    with pytest.raises(AssertionError):
+        yaml_cache.parse_validated_yaml(invalid_content, CORE_SCHEMA_FILE)
+
+
+def test_parse_validated_yaml_expands_current_environment_variables(
+    monkeypatch: MonkeyPatch,
+):
+    content = "stories:\n- story: ${STORY_NAME}\n  steps:\n  - intent: greet\n"
+
+    for story_name in ["first", "second"]:
+        monkeypatch.setenv("STORY_NAME", story_name)
+        parsed = yaml_cache.parse_validated_yaml(content, CORE_SCHEMA_FILE)
+        assert parsed["stories"][0]["story"] == story_name
+
+    assert not yaml_cache._cache_file(
+        yaml_cache._cache_key(content, CORE_SCHEMA_FILE)
+    ).exists()
+
+
+def test_parse_validated_yaml_drops_least_recently_used_files(
+    monkeypatch: MonkeyPatch,
+):
+    contents = [
+        f"stories:\n- story: story {i}\n  steps:\n  - intent: greet\n"
+        for i in range(3)
+    ]
+    cache_files = [
+        yaml_cache._cache_file(yaml_cache._cache_key(content, CORE_SCHEMA_FILE))
+        for content in contents
+    ]
+    for content in contents[:2]:
+        yaml_cache.parse_validated_yaml(content, CORE_SCHEMA_FILE)
+    for index, cache_file in enumerate(cache_files[:2]):
+        os.utime(cache_file, (index, index))
+
+    # reading the first file marks it as recently used
+    with monkeypatch.context() as context:
+        context.setattr(yaml_cache, "_parse", _raise_if_parsed)
+        yaml_cache.parse_validated_yaml(contents[0], CORE_SCHEMA_FILE)
+
+    file_size = max(cache_file.stat().st_size for cache_file in cache_files[:2])
+    monkeypatch.setenv(yaml_cache.YAML_CACHE_SIZE_ENV, str(2.5 * file_size / 1e6))
+    yaml_cache.parse_validated_yaml(contents[2], CORE_SCHEMA_FILE)
+
+    assert cache_files[0].exists()
+    assert not cache_files[1].exists()
+    assert cache_files[2].exists()
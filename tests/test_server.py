@@ -1060,6 +1060,46 @@ async def test_predict(rasa_app: SanicASGITestClient):
     assert "policy" in content
 
 
+async def test_predict_batch(rasa_app: SanicASGITestClient):
+    data = [
+        [
+            {"event": "action", "name": "action_listen"},
+            {
+                "event": "user",
+                "text": "hello",
+                "parse_data": {
+                    "entities": [],
+                    "intent": {"confidence": 0.57, INTENT_NAME_KEY: "greet"},
+                    "text": "hello",
+                },
+            },
+        ],
+        [{"event": "action", "name": "action_listen"}],
+    ]
+
+    _, response = await rasa_app.post(
+        "/model/predict/batch",
+        json=data,
+        headers={"Content-Type": rasa.server.JSON_CONTENT_TYPE},
+    )
+    content = response.json
+    assert response.status == HTTPStatus.OK
+    assert len(content) == 2
+    for result in content:
+        assert "scores" in result
+        assert "tracker" in result
+        assert "policy" in result
+
+
+async def test_predict_batch_invalid_body(rasa_app: SanicASGITestClient):
+    _, response = await rasa_app.post(
+        "/model/predict/batch",
+        json=[{"event": "action", "name": "action_listen"}],
+        headers={"Content-Type": rasa.server.JSON_CONTENT_TYPE},
+    )
+    assert response.status == HTTPStatus.BAD_REQUEST
+
+
 async def test_predict_invalid_entities_format(rasa_app: SanicASGITestClient):
     data = [
         {"event": "action", "name": "action_listen"},
@@ -109,6 +109,18 @@ def test_dir_size_with_sub_directory(tmp_path: Path):
     assert rasa.utils.common.directory_size_in_mb(tmp_path) == pytest.approx(5)
 
 
+def test_dir_size_with_excluded_sub_directory(tmp_path: Path):
+    subdir = tmp_path / "sub"
+    subdir.mkdir()
+
+    tests.conftest.create_test_file_with_size(tmp_path, 2)
+    tests.conftest.create_test_file_with_size(subdir, 3)
+
+    assert rasa.utils.common.directory_size_in_mb(
+        tmp_path, subdirectories_to_exclude=["sub"]
+    ) == pytest.approx(2)
+
+
 @pytest.mark.parametrize("create_destination", [True, False])
 def test_copy_directory_with_created_destination(
     tmp_path: Path, create_destination: bool